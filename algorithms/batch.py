@@ -0,0 +1,196 @@
+# Batched shortest-path distances from many start nodes over one compiled graph
+# The CSR arrays are copied into shared memory once; a process pool computes the distance
+# rows of the requested sources against them and writes each row straight into a shared
+# result matrix (a shared-memory block, or a memory-mapped .npy file for large results)
+import os
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from algorithms.compiled_graph import compile_graph
+
+INFINITY = float("infinity")
+# Results larger than this are written to a memory-mapped file instead of RAM
+MEMMAP_BYTES = 256 * 2 ** 20
+# Below this many (source, edge) pairs the pool costs more than it saves
+MIN_POOL_WORK = 10 ** 6
+# Sources per pool task
+CHUNK_SIZE = 32
+
+def _dijkstra_row(offsets, targets, weights, source):
+    """Dijkstra distances from source, as a list (infinity if unreachable)."""
+    import heapq
+    distances = [INFINITY] * (len(offsets) - 1)
+    distances[source] = 0
+    heap = [(0, source)]
+    while heap:
+        distance, u = heapq.heappop(heap)
+        if distance > distances[u]:
+            continue
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            new_distance = distance + weights[k]
+            if new_distance < distances[v]:
+                distances[v] = new_distance
+                heapq.heappush(heap, (new_distance, v))
+    return distances
+
+def _bfs_row(offsets, targets, weights, source):
+    """Hop counts from source, as a list (infinity if unreachable)."""
+    distances = [INFINITY] * (len(offsets) - 1)
+    distances[source] = 0
+    queue = deque([source])
+    while queue:
+        u = queue.popleft()
+        level = distances[u] + 1
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            if distances[v] == INFINITY:
+                distances[v] = level
+                queue.append(v)
+    return distances
+
+METHODS = {
+    "dijkstra": _dijkstra_row,
+    "bfs": _bfs_row,
+}
+
+# State of a pool worker: the attached shared blocks, CSR memoryviews and result matrix
+_WORKER = {}
+
+def _attach(spec):
+    """Pool initializer: attach to the shared CSR arrays and the result matrix."""
+    blocks = []
+    views = []
+    for name, typecode, size in spec["csr"]:
+        # Pool workers share the parent's resource tracker, so attaching registers nothing new
+        block = shared_memory.SharedMemory(name=name)
+        blocks.append(block)
+        views.append(block.buf[:size].cast(typecode))
+    _WORKER["blocks"] = blocks
+    _WORKER["csr"] = views
+    _WORKER["result"] = _open_result(spec["result"], blocks)
+
+def _open_result(result_spec, blocks):
+    kind, location, shape, dtype = result_spec
+    if kind == "memmap":
+        return np.load(location, mmap_mode="r+")
+    block = shared_memory.SharedMemory(name=location)
+    blocks.append(block)
+    return np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+def _run_rows(method, first_row, sources):
+    """Pool task: compute the rows of consecutive sources starting at first_row."""
+    offsets, targets, weights = _WORKER["csr"]
+    result = _WORKER["result"]
+    row_function = METHODS[method]
+    for row, source in enumerate(sources, first_row):
+        result[row] = row_function(offsets, targets, weights, source)
+    if isinstance(result, np.memmap):
+        result.flush()
+    return len(sources)
+
+def _share(values):
+    """Copy a stdlib array into a new shared memory block."""
+    data = memoryview(values).cast("B")
+    block = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+    block.buf[:len(data)] = data
+    return block
+
+def distance_matrix(graph, sources=None, method="dijkstra", workers=None, dtype=np.float64, path=None):
+    """
+    Shortest-path distances from many start nodes in one call.
+    Args:
+        graph: Graph dict or CompiledGraph
+        sources: Start node ids; None for every node (all pairs)
+        method: "dijkstra" for weighted distances, or "bfs" for hop counts
+        workers: Worker processes; None uses os.cpu_count() unless the work is small
+            (fewer than MIN_POOL_WORK source-edge pairs), and 0 runs in this process
+        dtype: Matrix dtype; float32 halves the size (exact for integer distances below 2^24)
+        path: Write the matrix to this .npy file and return it memory-mapped. Without a path,
+            results over MEMMAP_BYTES go to a temporary .npy file (the caller deletes it)
+    Returns:
+        A (len(sources), len(graph)) matrix: row i holds the distances from sources[i] to
+        the nodes in graph.ids order, infinity for unreachable nodes
+    Raises:
+        ValueError: For an unknown method or source node
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown method: {method}")
+    graph = compile_graph(graph)
+    n = len(graph)
+    if sources is None:
+        indices = list(range(n))
+    else:
+        indices = []
+        for node_id in sources:
+            index = graph.resolve(node_id)
+            if index is None:
+                raise ValueError(f"Unknown source node: {node_id}")
+            indices.append(index)
+    shape = (len(indices), n)
+    dtype = np.dtype(dtype)
+    nbytes = shape[0] * shape[1] * dtype.itemsize
+    if path is None and nbytes > MEMMAP_BYTES:
+        handle, path = tempfile.mkstemp(suffix=".npy", prefix="distances-")
+        os.close(handle)
+    if workers is None:
+        workers = os.cpu_count() or 1
+        if len(indices) * max(graph.edge_count, 1) < MIN_POOL_WORK:
+            workers = 0
+    workers = min(workers, -(-len(indices) // CHUNK_SIZE))
+
+    if path is not None:
+        result = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=shape)
+    if workers <= 0:
+        if path is None:
+            result = np.empty(shape, dtype=dtype)
+        row_function = METHODS[method]
+        for row, source in enumerate(indices):
+            result[row] = row_function(graph.offsets, graph.targets, graph.weights, source)
+        if path is not None:
+            result.flush()
+        return result
+
+    blocks = [_share(values) for values in (graph.offsets, graph.targets, graph.weights)]
+    try:
+        if path is not None:
+            result.flush()
+            result_spec = ("memmap", path, shape, dtype.str)
+        else:
+            result_block = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+            blocks.append(result_block)
+            result_spec = ("shm", result_block.name, shape, dtype.str)
+        spec = {
+            "csr": [
+                (block.name, values.typecode, len(values) * values.itemsize)
+                for block, values in zip(blocks, (graph.offsets, graph.targets, graph.weights))
+            ],
+            "result": result_spec,
+        }
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach, initargs=(spec,)) as executor:
+            futures = [
+                executor.submit(_run_rows, method, start, indices[start:start + CHUNK_SIZE])
+                for start in range(0, len(indices), CHUNK_SIZE)
+            ]
+            for future in futures:
+                future.result()
+        if path is not None:
+            # Reopen to see the rows the workers wrote through their own mappings
+            return np.load(path, mmap_mode="r+")
+        return np.ndarray(shape, dtype=dtype, buffer=result_block.buf).copy()
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+def all_pairs_distances(graph, method="dijkstra", workers=None, dtype=np.float64, path=None):
+    """
+    Distances between every pair of nodes: distance_matrix with every node as a source.
+    Returns:
+        A (len(graph), len(graph)) matrix indexed in graph.ids order
+    """
+    return distance_matrix(graph, None, method=method, workers=workers, dtype=dtype, path=path)
@@ -0,0 +1,316 @@
+# Benchmark suite for the algorithms: python -m algorithms.bench [--max-size N] [--baseline FILE]
+# Measures time, peak traced memory and trace size per (algorithm, input family, size),
+# writes the results as JSON, and fails when a result regresses against a stored baseline
+# or (with --check-scaling) when time per step grows with input size. The *_explained cases
+# time the client-side step explanations in Node (static/js/bench/explain_steps.js)
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from itertools import islice
+
+import numpy as np
+
+from algorithms.compiled_graph import CompiledGraph
+from algorithms.generators import gnp_edges, grid_edges, path_edges
+from algorithms.graph_algorithms import (
+    iter_dfs, iter_bfs, iter_dijkstra, iter_bidirectional_bfs, iter_bidirectional_dijkstra, iter_astar
+)
+from algorithms.sorting import (
+    iter_heapsort, iter_merge_sort, iter_quicksort, iter_radix_sort, iter_shell_sort, iter_timsort
+)
+
+SIZES = [10, 100, 1000, 10 ** 4, 10 ** 5, 10 ** 6]
+
+def _array(family, n, seed):
+    rng = np.random.default_rng(seed)
+    if family == "random":
+        return rng.integers(1, n + 1, size=n).tolist()
+    if family == "sorted":
+        return list(range(1, n + 1))
+    if family == "reversed":
+        return list(range(n, 0, -1))
+    return [1] * n
+
+def _graph(family, n, seed):
+    if family == "path":
+        edges = path_edges(n, seed=seed)
+    elif family == "grid":
+        edges = grid_edges(n, seed=seed)
+    elif family == "dense":
+        edges = gnp_edges(n, 0.5, seed=seed)
+    else:
+        edges = gnp_edges(n, min(1.0, 4 / max(n - 1, 1)), seed=seed)
+    return CompiledGraph.from_arrays(n, *edges)
+
+# Input families: name -> (kind, builder, largest size worth running)
+ARRAY_FAMILIES = {name: ("array", _array, 10 ** 6) for name in ["random", "sorted", "reversed", "equal"]}
+GRAPH_FAMILIES = {
+    "path": ("graph", _graph, 10 ** 6),
+    "grid": ("graph", _graph, 10 ** 6),
+    "dense": ("graph", _graph, 3000),  # G(n, 0.5): about n^2 / 4 edges
+    "sparse": ("graph", _graph, 10 ** 6),  # G(n, p) with average degree 4
+}
+FAMILIES = dict(ARRAY_FAMILIES, **GRAPH_FAMILIES)
+
+# Algorithm name -> (input kind, step generator factory)
+ALGORITHMS = {
+    "dfs": ("graph", lambda graph: iter_dfs(graph, 0)),
+    "bfs": ("graph", lambda graph: iter_bfs(graph, 0)),
+    "bfs_numpy": ("graph", lambda graph: iter_bfs(graph, 0, backend="numpy")),
+    "dijkstra": ("graph", lambda graph: iter_dijkstra(graph, 0)),
+    # Point-to-point searches from the first to the last node
+    "bfs_target": ("graph", lambda graph: iter_bfs(graph, 0, target_node=len(graph) - 1)),
+    "dijkstra_target": ("graph", lambda graph: iter_dijkstra(graph, 0, target_node=len(graph) - 1)),
+    "bidirectional_bfs": ("graph", lambda graph: iter_bidirectional_bfs(graph, 0, len(graph) - 1)),
+    "bidirectional_dijkstra": ("graph", lambda graph: iter_bidirectional_dijkstra(graph, 0, len(graph) - 1)),
+    # Landmark tables are cached with the graph, so only the first run pays for them
+    "astar": ("graph", lambda graph: iter_astar(graph, 0, len(graph) - 1)),
+    "quicksort": ("array", lambda array: iter_quicksort(list(array))),
+    "quicksort_three_way": ("array", lambda array: iter_quicksort(list(array), partition_method="three_way")),
+    "quicksort_hoare": ("array", lambda array: iter_quicksort(list(array), partition_method="hoare")),
+    "merge_sort": ("array", lambda array: iter_merge_sort(list(array))),
+    "heapsort": ("array", lambda array: iter_heapsort(list(array))),
+    "timsort": ("array", lambda array: iter_timsort(list(array))),
+    "radix_sort": ("array", lambda array: iter_radix_sort(list(array))),
+    "shell_sort": ("array", lambda array: iter_shell_sort(list(array))),
+    # Full-mode app traces, timed through the client-side explanation templates (see EXPLAINED)
+    "quicksort_explained": ("array", lambda array: iter_quicksort(list(array), include_stats=True)),
+    "merge_sort_explained": ("array", lambda array: iter_merge_sort(list(array), include_stats=True)),
+}
+
+# Cases whose time is that of explaining every step in Node rather than of generating
+# the trace: name -> algorithm whose templates explain it
+EXPLAINED = {"quicksort_explained": "quicksort", "merge_sort_explained": "merge_sort"}
+EXPLAIN_SCRIPT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "static", "js", "bench", "explain_steps.js"
+)
+
+# Result fields compared against the baseline
+METRICS = ["seconds", "peakBytes", "traceBytes"]
+
+def _consume(steps, max_steps):
+    """Count the steps of a generator, raising if it produces more than max_steps."""
+    count = 0
+    for _ in islice(steps, max_steps + 1):
+        count += 1
+    if count > max_steps:
+        raise RuntimeError(f"more than {max_steps} steps")
+    return count
+
+def _time_explanations(algorithm, initial, trace, repeat):
+    """
+    Best-of-repeat seconds that the sorting.js templates of algorithm take to explain every
+    step of trace, measured in Node by static/js/bench/explain_steps.js.
+    Raises:
+        RuntimeError: If node is not installed or the script fails
+    """
+    node = shutil.which("node")
+    if node is None:
+        raise RuntimeError("node is not installed")
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False, encoding="utf-8") as f:
+        json.dump({"algorithm": algorithm, "initial": initial, "steps": trace}, f, separators=(",", ":"))
+    try:
+        completed = subprocess.run(
+            [node, EXPLAIN_SCRIPT, f.name, str(repeat)], capture_output=True, text=True
+        )
+    finally:
+        os.unlink(f.name)
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip()[-200:])
+    return json.loads(completed.stdout)["seconds"]
+
+def run_case(algorithm, family, size, repeat=3, memory=True, max_steps=2 * 10 ** 7, seed=0):
+    """
+    Benchmark one (algorithm, family, size) case.
+    Time is the best of `repeat` runs that only consume the steps. A separate run collects
+    the trace as a list under tracemalloc for the peak memory and the JSON trace size.
+    For the EXPLAINED cases, time is that of the client-side explanations of the whole
+    trace instead, and memory is not measured.
+    Returns:
+        A result dict; failures (e.g. RecursionError) are reported in "error"
+    """
+    factory = ALGORITHMS[algorithm][1]
+    result = {"algorithm": algorithm, "family": family, "size": size}
+    data = FAMILIES[family][1](family, size, seed)
+    try:
+        if algorithm in EXPLAINED:
+            trace = list(islice(factory(data), max_steps + 1))
+            if len(trace) > max_steps:
+                raise RuntimeError(f"more than {max_steps} steps")
+            result["seconds"] = round(_time_explanations(EXPLAINED[algorithm], data, trace, repeat), 6)
+            result["steps"] = len(trace)
+            return result
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            steps = _consume(factory(data), max_steps)
+            best = min(best, time.perf_counter() - started)
+        result["seconds"] = round(best, 6)
+        result["steps"] = steps
+        if memory:
+            tracemalloc.start()
+            try:
+                trace = list(factory(data))
+                result["peakBytes"] = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+            result["traceBytes"] = sum(len(json.dumps(step, separators=(",", ":"))) for step in trace) + len(trace) + 1
+    except (RecursionError, RuntimeError, MemoryError) as e:
+        result["error"] = f"{type(e).__name__}: {str(e)[:200]}"
+    return result
+
+def run_suite(algorithms, families, max_size, repeat=3, memory=True, max_steps=2 * 10 ** 7, log=None):
+    """Run every applicable (algorithm, family, size) case up to max_size and return the results."""
+    results = []
+    for algorithm in algorithms:
+        kind = ALGORITHMS[algorithm][0]
+        for family in families:
+            family_kind, _, family_max = FAMILIES[family]
+            if family_kind != kind:
+                continue
+            for size in SIZES:
+                if size > min(max_size, family_max):
+                    break
+                result = run_case(algorithm, family, size, repeat=repeat, memory=memory, max_steps=max_steps)
+                results.append(result)
+                if log:
+                    log(_format_result(result))
+                if "error" in result:
+                    # Larger inputs of the same family fail the same way
+                    break
+    return results
+
+def _format_result(result):
+    label = f"{result['algorithm']:<22} {result['family']:<9} {result['size']:>8}"
+    if "error" in result:
+        return f"{label}  {result['error']}"
+    text = f"{label}  {result['seconds']:>10.4f}s  {result['steps']:>10} steps"
+    if "peakBytes" in result:
+        text += f"  {result['peakBytes'] / 1e6:>9.1f} MB peak  {result['traceBytes'] / 1e6:>9.1f} MB trace"
+    return text
+
+def _key(result):
+    return result["algorithm"], result["family"], result["size"]
+
+def compare(results, baseline, threshold=0.25, min_seconds=0.01, min_bytes=2 ** 16):
+    """
+    Compare results to baseline results.
+    A metric regresses when it exceeds the baseline by more than threshold (a fraction).
+    Timings under min_seconds and sizes under min_bytes (in both runs) are ignored as noise.
+    A case that succeeded in the baseline and now fails is a regression too.
+    Returns:
+        A list of human-readable regression descriptions
+    """
+    previous = {_key(result): result for result in baseline}
+    regressions = []
+    for result in results:
+        old = previous.get(_key(result))
+        if old is None or "error" in old:
+            continue
+        label = "{} {} n={}".format(*_key(result))
+        if "error" in result:
+            regressions.append(f"{label}: now fails ({result['error']})")
+            continue
+        for metric in METRICS:
+            if metric not in result or metric not in old:
+                continue
+            floor = min_seconds if metric == "seconds" else min_bytes
+            if max(result[metric], old[metric]) < floor:
+                continue
+            if result[metric] > old[metric] * (1 + threshold):
+                regressions.append(f"{label}: {metric} {old[metric]} -> {result[metric]} (+{result[metric] / old[metric] - 1:.0%})")
+    return regressions
+
+def check_scaling(results, tolerance=3.0, min_steps=1000, min_seconds=0.01):
+    """
+    Check that cost per step stays roughly flat as inputs grow (linear scaling in trace length).
+    For each (algorithm, family), compares seconds per step at the largest size against the
+    smallest size with at least min_steps steps that took at least min_seconds (shorter
+    timings are mostly noise and warm-up).
+    Returns:
+        A list of descriptions of curves whose per-step cost grew more than tolerance times
+    """
+    curves = {}
+    for result in results:
+        if "error" not in result and result["steps"] >= min_steps and result["seconds"] >= min_seconds:
+            curves.setdefault((result["algorithm"], result["family"]), []).append(result)
+    failures = []
+    for (algorithm, family), curve in curves.items():
+        curve.sort(key=lambda r: r["size"])
+        first, last = curve[0], curve[-1]
+        if first is last:
+            continue
+        growth = (last["seconds"] / last["steps"]) / (first["seconds"] / first["steps"])
+        if growth > tolerance:
+            failures.append(
+                f"{algorithm} {family}: time per step grew {growth:.1f}x from n={first['size']} to n={last['size']}"
+            )
+    return failures
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m algorithms.bench",
+        description="Benchmark the algorithms across input families and sizes."
+    )
+    parser.add_argument("--max-size", type=int, default=10 ** 4, help="Largest input size, up to 10^6 (default: 10^4)")
+    parser.add_argument("-a", "--algorithms", default=",".join(ALGORITHMS), help="Comma-separated algorithms")
+    parser.add_argument("-f", "--families", default=",".join(FAMILIES), help="Comma-separated input families")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case; the best is kept (default: 3)")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc and trace size pass")
+    parser.add_argument("--max-steps", type=int, default=2 * 10 ** 7, help="Fail cases producing more steps")
+    parser.add_argument("-o", "--output", help="Write the results to this JSON file")
+    parser.add_argument("--baseline", help="Baseline results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed regression as a fraction (default: 0.25)")
+    parser.add_argument(
+        "--min-seconds", type=float, default=0.01,
+        help="Ignore timings below this in comparisons and scaling checks (default: 0.01)"
+    )
+    parser.add_argument("--min-bytes", type=int, default=2 ** 16, help="Ignore memory/trace sizes below this (default: 64 KiB)")
+    parser.add_argument("--check-scaling", action="store_true", help="Also fail on superlinear time per step")
+    args = parser.parse_args(argv)
+
+    algorithms = [name for name in args.algorithms.split(",") if name]
+    families = [name for name in args.families.split(",") if name]
+    unknown = (set(algorithms) - set(ALGORITHMS)) | (set(families) - set(FAMILIES))
+    if unknown:
+        parser.error(f"unknown algorithms/families: {', '.join(sorted(unknown))}")
+
+    results = run_suite(
+        algorithms, families, args.max_size, repeat=args.repeat, memory=not args.no_memory,
+        max_steps=args.max_steps, log=print
+    )
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "maxSize": args.max_size,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=1)
+
+    failures = []
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        failures += compare(
+            results, baseline, threshold=args.threshold, min_seconds=args.min_seconds, min_bytes=args.min_bytes
+        )
+    if args.check_scaling:
+        failures += check_scaling(results, min_seconds=args.min_seconds)
+    for failure in failures:
+        print(f"REGRESSION {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
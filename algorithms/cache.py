@@ -0,0 +1,97 @@
+# Content-addressed cache for serialized algorithm traces and rendered payloads
+# Lives in an imported module so it survives Streamlit reruns of app.py
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+def fingerprint(*parts):
+    """
+    Stable content hash of JSON-serializable parts (graph/array data, algorithm, parameters).
+    Dict key order does not affect the result.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(json.dumps(part, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+def _payload_size(value):
+    """Size in bytes of a cached value: a str/bytes, or a tuple/list of them."""
+    if isinstance(value, (tuple, list)):
+        return sum(_payload_size(item) for item in value)
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    return len(value)
+
+class TraceCache:
+    """
+    LRU cache of serialized payloads, bounded by total size in bytes.
+    Values must be str/bytes (or tuples/lists of them) so their size is known exactly.
+    Thread-safe, since Streamlit serves each session from its own thread.
+    """
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Return the cached value for key (marking it recently used), or None."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        """Store value under key, evicting least recently used entries to stay within max_bytes."""
+        size = _payload_size(value)
+        with self._lock:
+            if key in self._entries:
+                self.size_bytes -= self._sizes.pop(key)
+                del self._entries[key]
+            if size > self.max_bytes:
+                return value
+            self._entries[key] = value
+            self._sizes[key] = size
+            self.size_bytes += size
+            while self.size_bytes > self.max_bytes:
+                old_key, _ = self._entries.popitem(last=False)
+                self.size_bytes -= self._sizes.pop(old_key)
+                self.evictions += 1
+        return value
+
+    def get_or_compute(self, key, compute):
+        """Return the cached value for key, or compute, store and return it."""
+        value = self.get(key)
+        if value is None:
+            value = self.put(key, compute())
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self.size_bytes = 0
+
+    def stats(self):
+        """Counters for display: hits, misses, evictions, entries and bytes used."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.size_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+# Process-wide cache shared by all sessions
+TRACE_CACHE = TraceCache()
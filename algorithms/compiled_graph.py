@@ -0,0 +1,191 @@
+# Compiled graph representation shared by the graph algorithms
+# Adjacency is stored once in compressed-sparse-row (CSR) arrays instead of per-edge dicts
+from array import array
+
+class CompiledGraph:
+    """
+    A graph compiled into CSR adjacency arrays.
+    Node ids are mapped to dense indices 0..n-1 (in the order of graph["nodes"]).
+    The neighbors of index i are targets[offsets[i]:offsets[i + 1]], with the
+    matching edge weights at the same positions in weights.
+    Directed graphs store out-edges only; the in-edge (transposed) CSR is built on
+    first use by reverse(). Undirected graphs store every edge in both directions.
+    Layout coordinates, when every node has them, are kept as positions: a pair of
+    arrays (xs, ys) indexed like ids, or None.
+    Build it once with CompiledGraph.from_graph (or compile_graph) and pass it to
+    dfs, bfs and dijkstra as often as needed.
+    """
+    def __init__(self, ids, offsets, targets, weights, directed=False, index=None, positions=None):
+        self.ids = ids
+        self.index = index if index is not None else {node_id: i for i, node_id in enumerate(ids)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.directed = directed
+        self.positions = positions
+        self._reverse = None if directed else self
+        self._max_weight = None
+
+    @classmethod
+    def from_graph(cls, graph):
+        """
+        Compile a {"nodes": [...], "links": [...], "directed": bool} graph dict.
+        Links of undirected graphs are added in both directions, and each node
+        keeps its neighbors in the order the links appear in the input.
+        Node "x"/"y" coordinates are kept as positions if every node has them.
+        """
+        directed = bool(graph.get("directed", False))
+        ids = [node["id"] for node in graph["nodes"]]
+        index = {node_id: i for i, node_id in enumerate(ids)}
+        n = len(ids)
+        sources = array("q")
+        targets = array("q")
+        weights = []
+        for link in graph["links"]:
+            source = link["source"]
+            target = link["target"]
+            if isinstance(source, dict):
+                source = source["id"]
+            if isinstance(target, dict):
+                target = target["id"]
+            s = index[source]
+            t = index[target]
+            weight = link.get("weight", 1)
+            sources.append(s)
+            targets.append(t)
+            weights.append(weight)
+            if not directed:
+                sources.append(t)
+                targets.append(s)
+                weights.append(weight)
+        typecode = "q" if all(isinstance(w, int) for w in weights) else "d"
+        offsets, csr_targets, csr_weights = _build_csr(n, sources, targets, weights, typecode)
+        positions = None
+        if n and all("x" in node and "y" in node for node in graph["nodes"]):
+            positions = (
+                array("d", [node["x"] for node in graph["nodes"]]),
+                array("d", [node["y"] for node in graph["nodes"]]),
+            )
+        return cls(ids, offsets, csr_targets, csr_weights, directed=directed, index=index, positions=positions)
+
+    @classmethod
+    def from_arrays(cls, n, sources, targets, weights, directed=False, points=None):
+        """
+        Compile edge arrays from algorithms.generators (node ids 0..n-1) without building link dicts.
+        Uses NumPy for the stable sort, so per-node neighbor order matches from_graph.
+        points: Optional (n, 2) node coordinates, e.g. from random_geometric_edges
+        """
+        import numpy as np
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        weights = np.asarray(weights)
+        if directed:
+            all_sources, all_targets, all_weights = sources, targets, weights
+        else:
+            # Interleave both directions per edge, as from_graph does
+            all_sources = np.column_stack([sources, targets]).ravel()
+            all_targets = np.column_stack([targets, sources]).ravel()
+            all_weights = np.repeat(weights, 2)
+        order = np.argsort(all_sources, kind="stable")
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(all_sources, minlength=n), out=offsets[1:])
+        typecode = "q" if np.issubdtype(all_weights.dtype, np.integer) else "d"
+        return cls(
+            list(range(n)),
+            _to_array("q", offsets),
+            _to_array("q", all_targets[order]),
+            _to_array(typecode, all_weights[order].astype(np.int64 if typecode == "q" else np.float64)),
+            directed=directed,
+            positions=None if points is None else (
+                _to_array("d", np.asarray(points, dtype=np.float64)[:, 0]),
+                _to_array("d", np.asarray(points, dtype=np.float64)[:, 1]),
+            )
+        )
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def edge_count(self):
+        """Number of stored (directed) adjacency entries."""
+        return len(self.targets)
+
+    def reverse(self):
+        """
+        The transposed graph, whose adjacency lists are in-edges of this one.
+        Built once and cached; an undirected graph is its own reverse.
+        """
+        if self._reverse is None:
+            n = len(self.ids)
+            offsets = self.offsets
+            sources = array("q")
+            for i in range(n):
+                sources.extend([i] * (offsets[i + 1] - offsets[i]))
+            in_offsets, in_targets, in_weights = _build_csr(
+                n, self.targets, sources, self.weights, self.weights.typecode
+            )
+            reverse = CompiledGraph(
+                self.ids, in_offsets, in_targets, in_weights, directed=True, index=self.index, positions=self.positions
+            )
+            reverse._reverse = self
+            self._reverse = reverse
+        return self._reverse
+
+    def max_weight(self):
+        """The largest edge weight (0 without edges), computed once; the bucket queue is sized by it."""
+        if self._max_weight is None:
+            self._max_weight = max(self.weights, default=0)
+        return self._max_weight
+
+    def resolve(self, node_id):
+        """Return the index of node_id, or None if the graph has no such node."""
+        return self.index.get(node_id)
+
+def _build_csr(n, sources, targets, weights, typecode):
+    """
+    Counting sort of edge lists by source into CSR (offsets, targets, weights) arrays.
+    Stable, so each node's neighbors stay in input order.
+    """
+    offsets = array("q", bytes(8 * (n + 1)))
+    for s in sources:
+        offsets[s + 1] += 1
+    for i in range(n):
+        offsets[i + 1] += offsets[i]
+    fill = array("q", offsets[:n])
+    csr_targets = array("q", bytes(8 * len(targets)))
+    csr_weights = array(typecode, bytes(array(typecode).itemsize * len(weights)))
+    for k in range(len(sources)):
+        pos = fill[sources[k]]
+        fill[sources[k]] = pos + 1
+        csr_targets[pos] = targets[k]
+        csr_weights[pos] = weights[k]
+    return offsets, csr_targets, csr_weights
+
+def _to_array(typecode, values):
+    """Copy a NumPy array into a stdlib array, whose items index as plain Python numbers."""
+    result = array(typecode)
+    result.frombytes(values.tobytes())
+    return result
+
+def compile_graph(graph):
+    """Return graph as a CompiledGraph, compiling it if it is still a graph dict."""
+    if isinstance(graph, CompiledGraph):
+        return graph
+    return CompiledGraph.from_graph(graph)
+
+def parse_node_id(node):
+    """Node ids from the UI arrive as numbers or numeric strings."""
+    return int(node) if not isinstance(node, int) else node
+
+def resolve_target(graph, target_node):
+    """
+    Index of target_node in a CompiledGraph, or None when no target is given.
+    Raises:
+        ValueError: If target_node is not in the graph
+    """
+    if target_node is None:
+        return None
+    target = graph.resolve(parse_node_id(target_node))
+    if target is None:
+        raise ValueError(f"Unknown target node: {target_node}")
+    return target
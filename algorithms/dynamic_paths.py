@@ -0,0 +1,292 @@
+# Dynamic single-source shortest paths: keeps the distance/predecessor tree of a Dijkstra run
+# and repairs only the affected part of it after each edge insert, delete or weight change
+# (in the style of Ramalingam and Reps), emitting steps for the nodes that changed
+import heapq
+
+from algorithms.compiled_graph import compile_graph
+
+INFINITY = float("infinity")
+
+class DynamicShortestPaths:
+    """
+    Shortest paths from one source under edge updates.
+    The graph is held as mutable adjacency dicts (out-edges and in-edges per node id);
+    undirected graphs store each edge in both directions, and there is at most one edge
+    per (source, target) pair, so inserting an existing edge changes its weight.
+    After an update:
+        - a shorter edge can only improve distances, so the improvement is propagated
+          from the edge's target with a Dijkstra search that only touches improved nodes;
+        - a longer or deleted edge matters only if it is a tree edge. The subtree below it is
+          the affected set: each affected node is seeded with its best distance through
+          unaffected in-neighbors, and Dijkstra restricted to the set settles them again.
+    Update methods return the steps of the repair:
+        {"type": "update", "operation", "from", "to", "weight", "oldWeight"} first, then per changed node
+        a "relax" step from its new tree parent (when it has one) and a "distance" step with
+        the new "distance" (None when it became unreachable) and "previous" (its tree parent).
+    """
+    def __init__(self, graph, source):
+        graph = compile_graph(graph)
+        self.directed = graph.directed
+        self.source = source
+        self.successors = {node_id: {} for node_id in graph.ids}
+        self.predecessors = {node_id: {} for node_id in graph.ids}
+        ids = graph.ids
+        offsets = graph.offsets
+        for i, node_id in enumerate(ids):
+            for k in range(offsets[i], offsets[i + 1]):
+                target = ids[graph.targets[k]]
+                weight = graph.weights[k]
+                # Keep the lightest of parallel edges
+                if weight < self.successors[node_id].get(target, INFINITY):
+                    self.successors[node_id][target] = weight
+                    self.predecessors[target][node_id] = weight
+        if source not in self.successors:
+            raise ValueError(f"Unknown source node: {source}")
+        self.distance = {node_id: INFINITY for node_id in ids}
+        self.previous = {node_id: None for node_id in ids}
+        self.children = {node_id: set() for node_id in ids}
+        self.distance[source] = 0
+        for _ in self._search([(0, 0, source)]):
+            pass
+
+    def _search(self, heap, allowed=None, before=None):
+        """
+        Dijkstra from the (distance, tiebreak, node) entries in heap, using self.distance and
+        self.previous as tentative labels.
+        Args:
+            allowed: Only relax edges into these nodes
+            before: Dict recording the (distance, previous) label of each node before the
+                search first changes it
+        Yields:
+            Nodes in the order they are settled
+        """
+        heapq.heapify(heap)
+        settled = set()
+        counter = len(heap)
+        distance = self.distance
+        while heap:
+            current_distance, _, node = heapq.heappop(heap)
+            if node in settled or current_distance > distance[node]:
+                continue
+            settled.add(node)
+            yield node
+            for target, weight in self.successors[node].items():
+                if allowed is not None and target not in allowed:
+                    continue
+                new_distance = current_distance + weight
+                if new_distance < distance[target]:
+                    if before is not None and target not in before:
+                        before[target] = (distance[target], self.previous[target])
+                    distance[target] = new_distance
+                    self._set_parent(target, node)
+                    counter += 1
+                    heapq.heappush(heap, (new_distance, counter, target))
+
+    def _set_parent(self, node, parent):
+        old = self.previous[node]
+        if old is not None:
+            self.children[old].discard(node)
+        self.previous[node] = parent
+        if parent is not None:
+            self.children[parent].add(node)
+
+    def _change_steps(self, nodes, before):
+        """Steps for the nodes whose distance or tree parent differs from before[node]."""
+        steps = []
+        for node in nodes:
+            if before[node] == (self.distance[node], self.previous[node]):
+                continue
+            parent = self.previous[node]
+            distance = self.distance[node]
+            if parent is not None:
+                steps.append({
+                    "type": "relax",
+                    "from": parent,
+                    "to": node,
+                    "success": True,
+                    "newDistance": distance
+                })
+            steps.append({
+                "type": "distance",
+                "node": node,
+                "distance": None if distance == INFINITY else distance,
+                "previous": parent
+            })
+        return steps
+
+    def _arcs(self, source, target):
+        """The directed arcs behind an edge: one, or both directions for undirected graphs."""
+        if self.directed or source == target:
+            return [(source, target)]
+        return [(source, target), (target, source)]
+
+    def _check_nodes(self, *nodes):
+        for node in nodes:
+            if node not in self.successors:
+                raise ValueError(f"Unknown node: {node}")
+
+    def _update(self, operation, source, target, weight):
+        self._check_nodes(source, target)
+        if weight is not None and weight < 0:
+            raise ValueError("Edge weights must be non-negative")
+        old_weight = self.successors[source].get(target)
+        for u, v in self._arcs(source, target):
+            if weight is None:
+                self.successors[u].pop(v, None)
+                self.predecessors[v].pop(u, None)
+            else:
+                self.successors[u][v] = weight
+                self.predecessors[v][u] = weight
+        steps = [{
+            "type": "update",
+            "operation": operation,
+            "from": source,
+            "to": target,
+            "weight": weight,
+            "oldWeight": old_weight
+        }]
+        if old_weight is None or (weight is not None and weight < old_weight):
+            steps.extend(self._decrease(source, target))
+        elif weight is None or weight > old_weight:
+            steps.extend(self._increase(source, target))
+        return steps
+
+    def _decrease(self, source, target):
+        """Propagate the improvements made possible by a new or shorter edge."""
+        heap = []
+        before = {}
+        for u, v in self._arcs(source, target):
+            new_distance = self.distance[u] + self.successors[u][v]
+            if new_distance < self.distance[v]:
+                before[v] = (self.distance[v], self.previous[v])
+                self.distance[v] = new_distance
+                self._set_parent(v, u)
+                heap.append((new_distance, len(heap), v))
+        # Only improved nodes are pushed, so the search stays inside the changed region
+        changed = list(self._search(heap, before=before))
+        return self._change_steps(changed, before)
+
+    def _increase(self, source, target):
+        """Repair the subtree below a longer or deleted tree edge."""
+        roots = [v for u, v in self._arcs(source, target) if self.previous[v] == u]
+        if not roots:
+            return []
+        # The affected set is the shortest-path subtree below the edge
+        affected = []
+        stack = list(roots)
+        while stack:
+            node = stack.pop()
+            affected.append(node)
+            stack.extend(self.children[node])
+        affected_set = set(affected)
+        before = {node: (self.distance[node], self.previous[node]) for node in affected}
+        for node in affected:
+            self.distance[node] = INFINITY
+            self._set_parent(node, None)
+        # Seed each affected node with its best distance through unaffected in-neighbors
+        heap = []
+        for node in affected:
+            best, parent = INFINITY, None
+            for u, weight in self.predecessors[node].items():
+                if u not in affected_set and self.distance[u] + weight < best:
+                    best, parent = self.distance[u] + weight, u
+            if parent is not None:
+                self.distance[node] = best
+                self._set_parent(node, parent)
+                heap.append((best, len(heap), node))
+        settled = list(self._search(heap, allowed=affected_set))
+        # Nodes the search did not reach stay unreachable
+        reached = set(settled)
+        unreachable = [node for node in affected if node not in reached]
+        return self._change_steps(settled + unreachable, before)
+
+    def insert_edge(self, source, target, weight=1):
+        """Insert an edge (or change its weight if it exists) and return the repair steps."""
+        operation = "insert" if target not in self.successors[source] else "weight"
+        return self._update(operation, source, target, weight)
+
+    def set_weight(self, source, target, weight):
+        """Change the weight of an existing edge and return the repair steps."""
+        if target not in self.successors.get(source, {}):
+            raise ValueError(f"No edge from {source} to {target}")
+        return self._update("weight", source, target, weight)
+
+    def delete_edge(self, source, target):
+        """Delete an edge and return the repair steps."""
+        if target not in self.successors.get(source, {}):
+            raise ValueError(f"No edge from {source} to {target}")
+        return self._update("delete", source, target, None)
+
+    def add_node(self, node_id):
+        """Add an isolated (unreachable) node."""
+        if node_id in self.successors:
+            raise ValueError(f"Node {node_id} already exists")
+        self.successors[node_id] = {}
+        self.predecessors[node_id] = {}
+        self.distance[node_id] = INFINITY
+        self.previous[node_id] = None
+        self.children[node_id] = set()
+
+    def remove_node(self, node_id):
+        """Delete a node and its edges, returning the repair steps of the edge deletions."""
+        self._check_nodes(node_id)
+        if node_id == self.source:
+            raise ValueError("The source node cannot be removed")
+        steps = []
+        for target in list(self.successors[node_id]):
+            steps.extend(self.delete_edge(node_id, target))
+        for source in list(self.predecessors[node_id]):
+            steps.extend(self.delete_edge(source, node_id))
+        for mapping in (self.successors, self.predecessors, self.distance, self.previous, self.children):
+            del mapping[node_id]
+        return steps
+
+    def sync(self, graph):
+        """
+        Bring the engine in line with an edited graph dict ({"nodes", "links"}), applying
+        the differences as individual updates: added nodes, inserted, reweighted and
+        deleted edges, then removed nodes.
+        Returns:
+            The concatenated repair steps
+        """
+        new_graph = compile_graph(graph)
+        steps = []
+        for node_id in new_graph.ids:
+            if node_id not in self.successors:
+                self.add_node(node_id)
+        edges = {}
+        for i, node_id in enumerate(new_graph.ids):
+            for k in range(new_graph.offsets[i], new_graph.offsets[i + 1]):
+                target = new_graph.ids[new_graph.targets[k]]
+                weight = new_graph.weights[k]
+                if weight < edges.get((node_id, target), INFINITY):
+                    edges[(node_id, target)] = weight
+        for (source, target), weight in edges.items():
+            if self.successors[source].get(target) != weight:
+                steps.extend(self.insert_edge(source, target, weight))
+        for source in list(self.successors):
+            for target in list(self.successors[source]):
+                if (source, target) not in edges:
+                    steps.extend(self.delete_edge(source, target))
+        for node_id in set(self.successors) - set(new_graph.ids):
+            steps.extend(self.remove_node(node_id))
+        return steps
+
+    def distances(self):
+        """Current distances by node id (infinity for unreachable nodes)."""
+        return dict(self.distance)
+
+    def tree_edges(self):
+        """Edges [parent, node] of the current shortest-path tree, as in the "path" step."""
+        return [[parent, node] for node, parent in self.previous.items() if parent is not None]
+
+    def path_to(self, target):
+        """Node ids of the current shortest path from the source to target, or [] if unreachable."""
+        self._check_nodes(target)
+        if self.distance[target] == INFINITY:
+            return []
+        path = [target]
+        while path[-1] != self.source:
+            path.append(self.previous[path[-1]])
+        path.reverse()
+        return path
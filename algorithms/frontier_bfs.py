@@ -0,0 +1,185 @@
+# Level-synchronous BFS over the CSR arrays of a CompiledGraph, vectorized with NumPy
+# Each level is expanded with array operations instead of one queue pop per node, switching
+# between top-down and bottom-up expansion as the frontier grows and shrinks (Beamer et al.,
+# direction-optimizing BFS). Steps are per level, not per edge
+import numpy as np
+
+from algorithms.compiled_graph import compile_graph, parse_node_id, resolve_target
+
+# Switch to bottom-up when the frontier's out-edges exceed 1/ALPHA of the unexplored edges,
+# and back to top-down when the frontier falls below 1/BETA of the nodes
+ALPHA = 14
+BETA = 24
+# Bottom-up levels scan one in-edge per unvisited node for this many rounds, so most nodes
+# stop at their first hit, then check the remaining in-edges of the rest at once
+BOTTOM_UP_ROUNDS = 4
+
+def _csr(graph):
+    """Zero-copy NumPy views of a CompiledGraph's offsets and targets."""
+    return np.frombuffer(graph.offsets, dtype=np.int64), np.frombuffer(graph.targets, dtype=np.int64)
+
+def _edge_positions(offsets, nodes):
+    """
+    Positions in targets of all edges of nodes, grouped by node.
+    Returns:
+        (positions, owners): edge positions and the node each one belongs to
+    """
+    starts = offsets[nodes]
+    counts = offsets[nodes + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    # Offset of each node's run within the result, subtracted to restart arange per node
+    run_starts = np.cumsum(counts) - counts
+    positions = np.repeat(starts - run_starts, counts) + np.arange(total, dtype=np.int64)
+    return positions, np.repeat(nodes, counts)
+
+def _top_down(offsets, targets, frontier, visited):
+    """
+    Expand the frontier along out-edges.
+    Returns:
+        (nodes, parents, edges_checked) for the newly discovered nodes, in discovery order
+    """
+    positions, owners = _edge_positions(offsets, frontier)
+    neighbors = targets[positions]
+    fresh = ~visited[neighbors]
+    neighbors = neighbors[fresh]
+    owners = owners[fresh]
+    # Keep the first discovery of each node, in scan order
+    _, first = np.unique(neighbors, return_index=True)
+    first.sort()
+    return neighbors[first], owners[first], len(positions)
+
+def _bottom_up(in_offsets, in_targets, frontier, visited):
+    """
+    Let every unvisited node look for a parent in the frontier along its in-edges.
+    Returns:
+        (nodes, parents, edges_checked) for the newly discovered nodes, in index order
+    """
+    in_frontier = np.zeros(len(visited), dtype=bool)
+    in_frontier[frontier] = True
+    candidates = np.flatnonzero(~visited)
+    found_nodes = []
+    found_parents = []
+    checked = 0
+    for round_index in range(BOTTOM_UP_ROUNDS):
+        degrees = in_offsets[candidates + 1] - in_offsets[candidates]
+        candidates = candidates[degrees > round_index]
+        if not len(candidates):
+            break
+        sources = in_targets[in_offsets[candidates] + round_index]
+        checked += len(candidates)
+        hit = in_frontier[sources]
+        found_nodes.append(candidates[hit])
+        found_parents.append(sources[hit])
+        candidates = candidates[~hit]
+    else:
+        # The remaining candidates check all their later in-edges at once
+        degrees = in_offsets[candidates + 1] - in_offsets[candidates]
+        candidates = candidates[degrees > BOTTOM_UP_ROUNDS]
+        if len(candidates):
+            positions, owners = _edge_positions(in_offsets, candidates)
+            later = positions >= in_offsets[owners] + BOTTOM_UP_ROUNDS
+            positions = positions[later]
+            owners = owners[later]
+            checked += len(positions)
+            hit = in_frontier[in_targets[positions]]
+            owners = owners[hit]
+            sources = in_targets[positions[hit]]
+            _, first = np.unique(owners, return_index=True)
+            found_nodes.append(owners[first])
+            found_parents.append(sources[first])
+    if not found_nodes:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, checked
+    nodes = np.concatenate(found_nodes)
+    parents = np.concatenate(found_parents)
+    order = np.argsort(nodes, kind="stable")
+    return nodes[order], parents[order], checked
+
+def iter_frontier_bfs(graph, start_node, target_node=None, direction="auto"):
+    """
+    Level-synchronous Breadth-First Search, vectorized with NumPy.
+    Yields one "level" step per BFS level: "level" (the distance from the start), "frontier"
+    (the ids of the nodes at that distance), "parents" (the BFS tree parent of each of them,
+    as flat lists are far cheaper to build than edge pairs), "direction" ("top-down" or
+    "bottom-up") and "edgesChecked". Level 0 is the start node alone, with parent None.
+    With target_node, the search stops at the target's level and finishes with a "path"
+    step as in iter_bfs.
+    Args:
+        direction: "auto" for direction-optimizing switching, or "top-down"/"bottom-up" to
+            force one expansion for every level
+    Raises:
+        ValueError: If target_node is not in the graph, or direction is unknown
+    """
+    if direction not in ("auto", "top-down", "bottom-up"):
+        raise ValueError(f"Unknown BFS direction: {direction}")
+    graph = compile_graph(graph)
+    start_node = parse_node_id(start_node)
+    start = graph.resolve(start_node)
+    if start is None:
+        return
+    goal = resolve_target(graph, target_node)
+    n = len(graph)
+    ids = np.asarray(graph.ids)
+    if ids.dtype.kind != "i":
+        # Keep non-integer ids as the original objects
+        ids = np.empty(n, dtype=object)
+        ids[:] = graph.ids
+    offsets, targets = _csr(graph)
+    in_offsets, in_targets = _csr(graph.reverse())
+    degrees = np.diff(offsets)
+    visited = np.zeros(n, dtype=bool)
+    parent = np.full(n, -1, dtype=np.int64)
+    visited[start] = True
+    frontier = np.array([start], dtype=np.int64)
+    unexplored_edges = int(degrees.sum()) - int(degrees[start])
+    bottom_up = direction == "bottom-up"
+    yield {
+        "type": "level",
+        "level": 0,
+        "frontier": [start_node],
+        "parents": [None],
+        "direction": "top-down",
+        "edgesChecked": 0
+    }
+    level = 0
+    while len(frontier) and goal != start and not (goal is not None and visited[goal]):
+        if direction == "auto":
+            frontier_edges = int(degrees[frontier].sum())
+            if not bottom_up and frontier_edges > unexplored_edges / ALPHA:
+                bottom_up = True
+            elif bottom_up and len(frontier) < n / BETA:
+                bottom_up = False
+        if bottom_up:
+            nodes, parents, checked = _bottom_up(in_offsets, in_targets, frontier, visited)
+        else:
+            nodes, parents, checked = _top_down(offsets, targets, frontier, visited)
+        if not len(nodes):
+            break
+        level += 1
+        visited[nodes] = True
+        parent[nodes] = parents
+        unexplored_edges -= int(degrees[nodes].sum())
+        yield {
+            "type": "level",
+            "level": level,
+            "frontier": ids[nodes].tolist(),
+            "parents": ids[parents].tolist(),
+            "direction": "bottom-up" if bottom_up else "top-down",
+            "edgesChecked": checked
+        }
+        frontier = nodes
+    if goal is not None and visited[goal]:
+        edges = []
+        index = goal
+        while parent[index] >= 0:
+            edges.append((graph.ids[parent[index]], graph.ids[index]))
+            index = parent[index]
+        edges.reverse()
+        yield {
+            "type": "path",
+            "edges": edges,
+            "target": graph.ids[goal],
+            "distance": len(edges)
+        }
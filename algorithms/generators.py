@@ -0,0 +1,164 @@
+# Random graph generators emitting edge lists straight into NumPy arrays
+# Each generator returns (sources, targets, weights) as int64 arrays; weights are uniform in [1, 10]
+import numpy as np
+
+def _weights(rng, count):
+    return rng.integers(1, 11, size=count, dtype=np.int64)
+
+def _skip_positions(rng, total, p):
+    """
+    Positions of the successes among `total` Bernoulli(p) trials, by geometric skipping
+    (Batagelj & Brandes): draw the gaps between successes instead of every trial.
+    """
+    if p <= 0 or total <= 0:
+        return np.empty(0, dtype=np.int64)
+    if p >= 1:
+        return np.arange(total, dtype=np.int64)
+    expected = total * p
+    batch = int(expected + 5 * np.sqrt(expected) + 16)
+    positions = []
+    last = -1
+    while True:
+        gaps = rng.geometric(p, size=batch).astype(np.int64)
+        chunk = last + np.cumsum(gaps)
+        if chunk[-1] >= total:
+            positions.append(chunk[chunk < total])
+            break
+        positions.append(chunk)
+        last = chunk[-1]
+        batch = max(16, batch // 4)
+    return np.concatenate(positions)
+
+def gnp_edges(n, p, directed=False, seed=None):
+    """
+    Erdős–Rényi G(n, p) graph in O(n + m) expected time.
+    Args:
+        n: Number of nodes
+        p: Edge probability
+        directed: Draw ordered pairs (u != v) instead of unordered ones
+        seed: Seed for numpy.random.default_rng
+    Returns:
+        (sources, targets, weights) int64 arrays
+    """
+    rng = np.random.default_rng(seed)
+    if directed:
+        k = _skip_positions(rng, n * (n - 1), p)
+        sources = k // (n - 1)
+        targets = k % (n - 1)
+        targets += targets >= sources
+    else:
+        # Pair index k enumerates (v, w) with w < v as k = v(v-1)/2 + w
+        k = _skip_positions(rng, n * (n - 1) // 2, p)
+        v = ((1 + np.sqrt(1 + 8 * k.astype(np.float64))) / 2).astype(np.int64)
+        v -= v * (v - 1) // 2 > k
+        v += (v + 1) * v // 2 <= k
+        sources = v
+        targets = k - v * (v - 1) // 2
+    return sources, targets, _weights(rng, len(sources))
+
+def path_edges(n, seed=None):
+    """Path 0 - 1 - ... - n-1."""
+    rng = np.random.default_rng(seed)
+    sources = np.arange(max(n - 1, 0), dtype=np.int64)
+    return sources, sources + 1, _weights(rng, len(sources))
+
+def grid_edges(n, seed=None):
+    """
+    Near-square grid of n nodes, numbered row by row; each node links to its right and lower neighbor.
+    """
+    rng = np.random.default_rng(seed)
+    cols = max(1, int(np.ceil(np.sqrt(n))))
+    nodes = np.arange(n, dtype=np.int64)
+    right = nodes[(nodes % cols != cols - 1) & (nodes + 1 < n)]
+    down = nodes[nodes + cols < n]
+    sources = np.concatenate([right, down])
+    targets = np.concatenate([right + 1, down + cols])
+    return sources, targets, _weights(rng, len(sources))
+
+def random_geometric_edges(n, radius, seed=None):
+    """
+    Random geometric graph: n points uniform in the unit square, linked when closer than radius.
+    Points are bucketed into radius-sized cells so only neighboring cells are compared.
+    Returns the edge arrays plus the (n, 2) point coordinates.
+    """
+    rng = np.random.default_rng(seed)
+    points = rng.random((n, 2))
+    radius = min(max(radius, 1e-9), np.sqrt(2))
+    cells_per_side = max(1, int(np.ceil(1 / radius)))
+    cell_xy = np.minimum((points / radius).astype(np.int64), cells_per_side - 1)
+    cell = cell_xy[:, 0] * cells_per_side + cell_xy[:, 1]
+    order = np.argsort(cell, kind="stable")
+    sorted_cell = cell[order]
+    cell_start = np.searchsorted(sorted_cell, np.arange(cells_per_side * cells_per_side), side="left")
+    cell_end = np.searchsorted(sorted_cell, np.arange(cells_per_side * cells_per_side), side="right")
+    sorted_xy = cell_xy[order]
+    sorted_points = points[order]
+    sources = []
+    targets = []
+    # Half of the 3x3 neighborhood, so each pair of cells is visited once
+    for dx, dy in ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1)):
+        nx_ = sorted_xy[:, 0] + dx
+        ny_ = sorted_xy[:, 1] + dy
+        valid = (nx_ >= 0) & (nx_ < cells_per_side) & (ny_ >= 0) & (ny_ < cells_per_side)
+        i = np.flatnonzero(valid)
+        neighbor_cell = nx_[i] * cells_per_side + ny_[i]
+        start = cell_start[neighbor_cell]
+        counts = cell_end[neighbor_cell] - start
+        i = np.repeat(i, counts)
+        first = np.repeat(np.cumsum(counts) - counts, counts)
+        j = np.repeat(start, counts) + (np.arange(len(i)) - first)
+        if dx == 0 and dy == 0:
+            keep = j > i
+            i, j = i[keep], j[keep]
+        delta = sorted_points[i] - sorted_points[j]
+        close = np.einsum("ij,ij->i", delta, delta) <= radius * radius
+        sources.append(order[i[close]])
+        targets.append(order[j[close]])
+    sources = np.concatenate(sources)
+    targets = np.concatenate(targets)
+    return sources, targets, _weights(rng, len(sources)), points
+
+def scale_free_edges(n, m, seed=None):
+    """
+    Barabási–Albert preferential attachment with m edges per node, after Batagelj & Brandes:
+    every edge end is a copy of a uniformly chosen earlier end. The copy chains are resolved
+    with vectorized pointer jumping; self-loops and repeated edges are dropped.
+    """
+    rng = np.random.default_rng(seed)
+    m = max(1, int(m))
+    count = n * m
+    edge = np.arange(count, dtype=np.int64)
+    # Edge e has ends at positions 2e (its source node, e // m) and 2e + 1 (a copy of position r[e])
+    r = (rng.random(count) * (2 * edge + 1)).astype(np.int64)
+    pointer = r.copy()
+    pending = np.flatnonzero(pointer & 1)
+    while pending.size:
+        pointer[pending] = r[(pointer[pending] - 1) // 2]
+        pending = pending[(pointer[pending] & 1) == 1]
+    sources = edge // m
+    targets = (pointer // 2) // m
+    keep = sources != targets
+    sources, targets = sources[keep], targets[keep]
+    low = np.minimum(sources, targets)
+    high = np.maximum(sources, targets)
+    _, first = np.unique(low * n + high, return_index=True)
+    first.sort()
+    return sources[first], targets[first], _weights(rng, len(first))
+
+def to_graph_data(n, sources, targets, weights, directed=False, points=None):
+    """
+    Convert generated edge arrays into the {"nodes", "links", "directed"} dict used by the front end.
+    Optional (n, 2) points become the nodes' "x"/"y" layout coordinates.
+    """
+    if points is None:
+        nodes = [{"id": i} for i in range(n)]
+    else:
+        nodes = [{"id": i, "x": round(x, 2), "y": round(y, 2)} for i, (x, y) in enumerate(points.tolist())]
+    return {
+        "nodes": nodes,
+        "links": [
+            {"source": u, "target": v, "weight": w}
+            for u, v, w in zip(sources.tolist(), targets.tolist(), weights.tolist())
+        ],
+        "directed": directed
+    }
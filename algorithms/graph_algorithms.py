@@ -1,233 +1,715 @@
 # Graph algorithms for visualization: DFS, BFS, Dijkstra
-# Each function returns a list of steps for visualization
+# Each iter_* generator yields steps for visualization; the plain functions return them as a list
+# Graphs with "directed": true are traversed along edge direction only
+from algorithms.compiled_graph import compile_graph, parse_node_id, resolve_target
+from algorithms.heuristics import make_heuristic
+from algorithms.priority_queues import make_queue
 
-def dfs(graph, start_node):
+# Step types kept by the "structural" level of detail (see algorithms.trace.sample_graph_steps):
+# finished DFS nodes, BFS levels (iter_bfs with levels=True) and settled Dijkstra nodes
+STRUCTURAL_STEPS = {
+    "dfs": {"complete"},
+    "bfs": {"level", "path"},
+    "dijkstra": {"complete", "path", "stats"},
+    "bidirectional_bfs": {"level", "meet", "path"},
+    "bidirectional_dijkstra": {"complete", "meet", "path", "stats"},
+    "astar": {"complete", "path", "stats"},
+}
+
+# Names of the two searches of the bidirectional algorithms, recorded as the steps' "side"
+SIDES = ("forward", "backward")
+
+def _tree_edges(ids, previous):
+    """All (parent, node) edges of a predecessor tree, in one pass over the nodes."""
+    return [(ids[parent], ids[index]) for index, parent in enumerate(previous) if parent is not None]
+
+def _path_edges(ids, previous, index):
+    """The (parent, node) edges on the tree path from the root to index, in path order."""
+    edges = []
+    while previous[index] is not None:
+        edges.append((ids[previous[index]], ids[index]))
+        index = previous[index]
+    edges.reverse()
+    return edges
+
+def iter_dfs(graph, start_node):
     """
     Depth-First Search algorithm implementation.
-    Returns steps of the algorithm for visualization.
-    """
-    nodes = graph["nodes"]
-    links = graph["links"]
-    start_node = int(start_node) if not isinstance(start_node, int) else start_node
-    node_ids = [node["id"] for node in nodes]
-    if start_node not in node_ids:
-        return []
-    # Build adjacency list
-    adj_list = {node["id"]: [] for node in nodes}
-    for link in links:
-        source = link["source"]
-        target = link["target"]
-        weight = link.get("weight", 1)
-        if isinstance(source, dict):
-            source = source["id"]
-        if isinstance(target, dict):
-            target = target["id"]
-        adj_list[source].append({"target": target, "weight": weight})
-        adj_list[target].append({"target": source, "weight": weight})
-    visited = set()
-    stack = [start_node]
+    Accepts a graph dict or a CompiledGraph (compile once to reuse across runs).
+    Yields steps of the algorithm for visualization lazily.
+    """
+    graph = compile_graph(graph)
+    start_node = parse_node_id(start_node)
+    start = graph.resolve(start_node)
+    if start is None:
+        return
+    ids = graph.ids
+    offsets = graph.offsets
+    targets = graph.targets
+    n = len(graph)
+    visited = bytearray(n)
+    # Visit order of node ids, and each node's position in it (replaces path.index)
     path = []
-    steps = []
-    def dfs_recursive(node):
-        visited.add(node)
+    position = [0] * n
+    def visit(index):
+        node = ids[index]
+        visited[index] = 1
+        position[index] = len(path)
         path.append(node)
-        steps.append({
+        return {
             "type": "visit",
-            "node": node,
-            "action": f"Visiting node {node}",
-            "reason": f"DFS explores this node as it's either the start node or an unvisited neighbor of the current node."
-        })
-        for neighbor in adj_list[node]:
-            target = neighbor["target"]
-            if target not in visited:
-                steps.append({
-                    "type": "explore",
-                    "from": node,
-                    "to": target,
-                    "action": f"Exploring edge from {node} to {target}",
-                    "reason": f"DFS checks each unvisited neighbor of the current node."
-                })
-                dfs_recursive(target)
-        steps.append({
+            "node": node
+        }
+    # Explicit stack of node indices with the next adjacency position to scan for each
+    node_stack = [start]
+    edge_cursor = [offsets[start]]
+    yield visit(start)
+    while node_stack:
+        index = node_stack[-1]
+        k = edge_cursor[-1]
+        end = offsets[index + 1]
+        while k < end and visited[targets[k]]:
+            k += 1
+        if k < end:
+            edge_cursor[-1] = k + 1
+            target_index = targets[k]
+            node = ids[index]
+            target = ids[target_index]
+            yield {
+                "type": "explore",
+                "from": node,
+                "to": target
+            }
+            yield visit(target_index)
+            node_stack.append(target_index)
+            edge_cursor.append(offsets[target_index])
+            continue
+        node_stack.pop()
+        edge_cursor.pop()
+        node = ids[index]
+        yield {
             "type": "complete",
-            "node": node,
-            "action": f"Completed exploration of node {node}",
-            "reason": f"All neighbors of this node have been visited."
-        })
-        if node != path[-1]:
-            current_index = path.index(node)
-            if current_index < len(path) - 1:
-                next_node = path[current_index + 1]
-                steps.append({
-                    "type": "backtrack",
-                    "from": node,
-                    "to": next_node,
-                    "action": f"Backtracking from {node} to {next_node}",
-                    "reason": f"DFS backtracks when all neighbors of a node have been explored."
-                })
-    dfs_recursive(start_node)
-    return steps
-
-def bfs(graph, start_node):
+            "node": node
+        }
+        # Backtrack towards the node visited right after this one, if any
+        current_index = position[index]
+        if current_index < len(path) - 1:
+            next_node = path[current_index + 1]
+            yield {
+                "type": "backtrack",
+                "from": node,
+                "to": next_node
+            }
+
+def dfs(graph, start_node):
+    """
+    Depth-First Search algorithm implementation.
+    Returns the steps of iter_dfs as a list.
+    """
+    return list(iter_dfs(graph, start_node))
+
+def iter_bfs(graph, start_node, levels=False, target_node=None, backend="python"):
     """
     Breadth-First Search algorithm implementation.
-    Returns steps of the algorithm for visualization.
+    Accepts a graph dict or a CompiledGraph (compile once to reuse across runs).
+    Args:
+        levels: Also yield a "level" step (with the level number and its "frontier" size)
+            before the nodes of each level are expanded
+        target_node: Stop as soon as this node is discovered, and finish with a "path" step
+            holding the edges of the path to it and its "distance" in edges
+        backend: "python" for per-edge steps, or "numpy" for the vectorized level-synchronous
+            BFS of algorithms.frontier_bfs, which only yields "level" steps with the node
+            lists of each level (and the final "path" step); levels is implied
+    Yields steps of the algorithm for visualization lazily.
+    Raises:
+        ValueError: If target_node is not in the graph, or the backend is unknown
     """
+    if backend == "numpy":
+        from algorithms.frontier_bfs import iter_frontier_bfs
+        yield from iter_frontier_bfs(graph, start_node, target_node=target_node)
+        return
+    if backend != "python":
+        raise ValueError(f"Unknown BFS backend: {backend}")
     from collections import deque
-    nodes = graph["nodes"]
-    links = graph["links"]
-    start_node = int(start_node) if not isinstance(start_node, int) else start_node
-    node_ids = [node["id"] for node in nodes]
-    if start_node not in node_ids:
-        return []
-    # Build adjacency list
-    adj_list = {node["id"]: [] for node in nodes}
-    for link in links:
-        source = link["source"]
-        target = link["target"]
-        weight = link.get("weight", 1)
-        if isinstance(source, dict):
-            source = source["id"]
-        if isinstance(target, dict):
-            target = target["id"]
-        adj_list[source].append({"target": target, "weight": weight})
-        adj_list[target].append({"target": source, "weight": weight})
-    visited = set()
-    queue = deque([start_node])
-    visited.add(start_node)
-    steps = []
-    steps.append({
+    graph = compile_graph(graph)
+    start_node = parse_node_id(start_node)
+    start = graph.resolve(start_node)
+    if start is None:
+        return
+    goal = resolve_target(graph, target_node)
+    ids = graph.ids
+    offsets = graph.offsets
+    targets = graph.targets
+    visited = bytearray(len(graph))
+    # Parents are only needed to report the path to a target
+    previous = [None] * len(graph) if goal is not None else None
+    queue = deque([start])
+    visited[start] = 1
+    yield {
         "type": "visit",
-        "node": start_node,
-        "action": f"Starting BFS from node {start_node}",
-        "reason": f"BFS begins by visiting the start node and adding it to the queue."
-    })
+        "node": start_node
+    }
+    if goal == start:
+        queue.clear()
+    # At the start of each level the queue holds exactly the nodes of that level
+    level = 0
+    remaining = 0
     while queue:
-        current = queue.popleft()
-        for neighbor in adj_list[current]:
-            target = neighbor["target"]
-            if target not in visited:
-                visited.add(target)
-                queue.append(target)
-                steps.append({
+        if remaining == 0:
+            remaining = len(queue)
+            if levels:
+                yield {
+                    "type": "level",
+                    "level": level,
+                    "frontier": remaining
+                }
+            level += 1
+        remaining -= 1
+        current_index = queue.popleft()
+        current = ids[current_index]
+        for k in range(offsets[current_index], offsets[current_index + 1]):
+            target_index = targets[k]
+            if not visited[target_index]:
+                visited[target_index] = 1
+                queue.append(target_index)
+                target = ids[target_index]
+                yield {
                     "type": "explore",
                     "from": current,
-                    "to": target,
-                    "action": f"Exploring edge from {current} to {target}",
-                    "reason": f"BFS explores all edges from the current node to unvisited neighbors."
-                })
-                steps.append({
+                    "to": target
+                }
+                yield {
                     "type": "visit",
-                    "node": target,
-                    "action": f"Visiting node {target}",
-                    "reason": f"BFS visits this node as it's an unvisited neighbor at the current level."
-                })
-        steps.append({
+                    "node": target
+                }
+                if previous is not None:
+                    previous[target_index] = current_index
+                    if target_index == goal:
+                        queue.clear()
+                        break
+        yield {
             "type": "complete",
-            "node": current,
-            "action": f"Completed exploration of node {current}",
-            "reason": f"All neighbors of this node have been discovered and added to the queue."
-        })
-    return steps
+            "node": current
+        }
+    if goal is not None and visited[goal]:
+        edges = _path_edges(ids, previous, goal)
+        yield {
+            "type": "path",
+            "edges": edges,
+            "target": ids[goal],
+            "distance": len(edges)
+        }
 
-def dijkstra(graph, start_node):
+def bfs(graph, start_node, levels=False, target_node=None, backend="python"):
+    """
+    Breadth-First Search algorithm implementation.
+    Returns the steps of iter_bfs as a list.
+    """
+    return list(iter_bfs(graph, start_node, levels=levels, target_node=target_node, backend=backend))
+
+def iter_bidirectional_bfs(graph, start_node, target_node):
+    """
+    Bidirectional Breadth-First Search between two nodes.
+    A forward search from start_node over the graph and a backward search from target_node
+    over its reverse (CompiledGraph.reverse(), built once and cached) take turns, each time
+    expanding one whole level of whichever side has the smaller frontier. The searches stop
+    at the first node discovered by both, which lies on a shortest path.
+    Steps carry "side" ("forward" or "backward"): "level" per expanded level, "explore",
+    "visit" and "complete", then "meet" and a "path" step with the path's edges in graph
+    direction and its "distance" in edges. Nothing follows the last level if the target
+    is unreachable. When the start is the target, only its "visit" and an empty "path" follow.
+    Raises:
+        ValueError: If target_node is not in the graph
+    """
+    graph = compile_graph(graph)
+    start_node = parse_node_id(start_node)
+    start = graph.resolve(start_node)
+    if start is None:
+        return
+    goal = resolve_target(graph, target_node)
+    ids = graph.ids
+    if start == goal:
+        # As iter_bfs with target_node: the start node alone, then an empty path
+        yield {
+            "type": "visit",
+            "node": start_node,
+            "side": SIDES[0]
+        }
+        yield {
+            "type": "path",
+            "edges": [],
+            "target": start_node,
+            "distance": 0
+        }
+        return
+    n = len(graph)
+    csrs = (graph, graph.reverse())
+    seen = (bytearray(n), bytearray(n))
+    previous = ([None] * n, [None] * n)
+    frontiers = [[start], [goal]]
+    levels = [0, 0]
+    meet = None
+    for side, root in enumerate((start, goal)):
+        seen[side][root] = 1
+        yield {
+            "type": "visit",
+            "node": ids[root],
+            "side": SIDES[side]
+        }
+    while meet is None and frontiers[0] and frontiers[1]:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        other = 1 - side
+        offsets = csrs[side].offsets
+        targets = csrs[side].targets
+        side_seen = seen[side]
+        other_seen = seen[other]
+        side_previous = previous[side]
+        name = SIDES[side]
+        yield {
+            "type": "level",
+            "level": levels[side],
+            "frontier": len(frontiers[side]),
+            "side": name
+        }
+        next_frontier = []
+        for current_index in frontiers[side]:
+            current = ids[current_index]
+            for k in range(offsets[current_index], offsets[current_index + 1]):
+                target_index = targets[k]
+                if side_seen[target_index]:
+                    continue
+                side_seen[target_index] = 1
+                side_previous[target_index] = current_index
+                next_frontier.append(target_index)
+                yield {
+                    "type": "explore",
+                    "from": current,
+                    "to": ids[target_index],
+                    "side": name
+                }
+                yield {
+                    "type": "visit",
+                    "node": ids[target_index],
+                    "side": name
+                }
+                if other_seen[target_index]:
+                    meet = target_index
+                    break
+            yield {
+                "type": "complete",
+                "node": current,
+                "side": name
+            }
+            if meet is not None:
+                break
+        frontiers[side] = next_frontier
+        levels[side] += 1
+    if meet is None:
+        return
+    yield {
+        "type": "meet",
+        "node": ids[meet]
+    }
+    # The backward search's parents point along graph edges towards the target
+    edges = _path_edges(ids, previous[0], meet)
+    index = meet
+    while previous[1][index] is not None:
+        edges.append((ids[index], ids[previous[1][index]]))
+        index = previous[1][index]
+    yield {
+        "type": "path",
+        "edges": edges,
+        "target": ids[goal],
+        "distance": len(edges)
+    }
+
+def bidirectional_bfs(graph, start_node, target_node):
+    """
+    Bidirectional Breadth-First Search between two nodes.
+    Returns the steps of iter_bidirectional_bfs as a list.
+    """
+    return list(iter_bidirectional_bfs(graph, start_node, target_node))
+
+def iter_dijkstra(graph, start_node, queue="lazy", include_stats=False, target_node=None):
     """
     Dijkstra's algorithm implementation.
-    Returns steps of the algorithm for visualization.
-    """
-    import heapq
-    nodes = graph["nodes"]
-    links = graph["links"]
-    start_node = int(start_node) if not isinstance(start_node, int) else start_node
-    node_ids = [node["id"] for node in nodes]
-    if start_node not in node_ids:
-        return []
-    # Build adjacency list
-    adj_list = {node["id"]: [] for node in nodes}
-    for link in links:
-        source = link["source"]
-        target = link["target"]
-        weight = link.get("weight", 1)
-        if isinstance(source, dict):
-            source = source["id"]
-        if isinstance(target, dict):
-            target = target["id"]
-        adj_list[source].append({"target": target, "weight": weight})
-        adj_list[target].append({"target": source, "weight": weight})
-    distances = {node["id"]: float('infinity') for node in nodes}
-    distances[start_node] = 0
-    previous = {node["id"]: None for node in nodes}
-    pq = [(0, start_node)]
-    visited = set()
-    steps = []
-    steps.append({
+    Accepts a graph dict or a CompiledGraph (compile once to reuse across runs).
+    Args:
+        queue: Priority queue from algorithms.priority_queues:
+            - "lazy": heapq with lazy deletion (default)
+            - "indexed": indexed binary heap with decrease-key
+            - "bucket": Dial's bucket queue, for non-negative integer weights
+        include_stats: Append a final "stats" step with the queue's operation counters
+            and the number of "settled" nodes
+        target_node: Stop once this node is settled; the "path" step then holds only the
+            edges of the path to it, plus its "target" and "distance"
+    Yields steps of the algorithm for visualization lazily.
+    Raises:
+        ValueError: If the bucket queue is used with non-integer weights, or target_node
+            is not in the graph
+    """
+    graph = compile_graph(graph)
+    start_node = parse_node_id(start_node)
+    start = graph.resolve(start_node)
+    if start is None:
+        return
+    goal = resolve_target(graph, target_node)
+    ids = graph.ids
+    offsets = graph.offsets
+    targets = graph.targets
+    weights = graph.weights
+    n = len(graph)
+    if queue == "bucket" and weights.typecode != "q":
+        raise ValueError("The bucket queue requires integer edge weights")
+    distances = [float('infinity')] * n
+    distances[start] = 0
+    previous = [None] * n
+    # Only the bucket queue needs the largest weight, and scanning the weights is O(E)
+    pq = make_queue(queue, n, graph.max_weight() if queue == "bucket" else None)
+    pq.push(start, 0)
+    visited = bytearray(n)
+    settled = 0
+    yield {
         "type": "distance",
         "node": start_node,
-        "distance": 0,
-        "action": f"Setting initial distance of start node {start_node} to 0",
-        "reason": f"Dijkstra's algorithm initializes the distance to the start node as 0."
-    })
+        "distance": 0
+    }
     while pq:
-        current_distance, current_node = heapq.heappop(pq)
-        if current_node in visited:
-            continue
-        visited.add(current_node)
-        steps.append({
+        current_distance, current_index = pq.pop()
+        visited[current_index] = 1
+        settled += 1
+        current_node = ids[current_index]
+        yield {
+            "type": "visit",
+            "node": current_node
+        }
+        if current_index == goal:
+            yield {
+                "type": "complete",
+                "node": current_node
+            }
+            break
+        for k in range(offsets[current_index], offsets[current_index + 1]):
+            target_index = targets[k]
+            if visited[target_index]:
+                continue
+            target = ids[target_index]
+            weight = weights[k]
+            old_distance = distances[target_index]
+            new_distance = distances[current_index] + weight
+            success = new_distance < old_distance
+            yield {
+                "type": "relax",
+                "from": current_node,
+                "to": target,
+                "success": success,
+                "newDistance": new_distance if success else old_distance
+            }
+            if success:
+                distances[target_index] = new_distance
+                previous[target_index] = current_index
+                pq.push(target_index, new_distance)
+                yield {
+                    "type": "distance",
+                    "node": target,
+                    "distance": new_distance
+                }
+        yield {
+            "type": "complete",
+            "node": current_node
+        }
+    # The predecessor tree is read once: all of it, or the single path to the target
+    if goal is None:
+        edges = _tree_edges(ids, previous)
+        if edges:
+            yield {
+                "type": "path",
+                "edges": edges
+            }
+    elif visited[goal]:
+        yield {
+            "type": "path",
+            "edges": _path_edges(ids, previous, goal),
+            "target": ids[goal],
+            "distance": distances[goal]
+        }
+    if include_stats:
+        yield dict({"type": "stats"}, **pq.stats(), settled=settled)
+
+def dijkstra(graph, start_node, queue="lazy", include_stats=False, target_node=None):
+    """
+    Dijkstra's algorithm implementation.
+    Returns the steps of iter_dijkstra as a list (see there for the options).
+    """
+    return list(iter_dijkstra(
+        graph, start_node, queue=queue, include_stats=include_stats, target_node=target_node
+    ))
+
+def iter_bidirectional_dijkstra(graph, start_node, target_node, queue="lazy", include_stats=False):
+    """
+    Bidirectional Dijkstra between two nodes.
+    A forward search from start_node and a backward search from target_node over the
+    reverse graph (CompiledGraph.reverse(), built once and cached) settle one node at a
+    time, alternating towards the side with the smaller queue. Every relaxation that
+    reaches a node labelled by the other side updates the best known path length; the
+    searches stop once a node is settled by both sides, when that length is optimal.
+    Steps are those of iter_dijkstra with a "side" ("forward" or "backward"); backward
+    "relax" steps go from the settled node to its in-neighbor, against the graph edge.
+    They end with "meet" (the node joining the best path) and a "path" step with the
+    path's edges in graph direction and its "distance".
+    Args:
+        queue: Priority queue for both searches (see iter_dijkstra)
+        include_stats: Append a "stats" step with the summed queue counters and the
+            number of nodes settled by both searches together
+    Raises:
+        ValueError: If the bucket queue is used with non-integer weights, or target_node
+            is not in the graph
+    """
+    graph = compile_graph(graph)
+    start_node = parse_node_id(start_node)
+    start = graph.resolve(start_node)
+    if start is None:
+        return
+    goal = resolve_target(graph, target_node)
+    ids = graph.ids
+    n = len(graph)
+    if queue == "bucket" and graph.weights.typecode != "q":
+        raise ValueError("The bucket queue requires integer edge weights")
+    csrs = (graph, graph.reverse())
+    max_weight = graph.max_weight() if queue == "bucket" else None
+    pqs = (make_queue(queue, n, max_weight), make_queue(queue, n, max_weight))
+    distances = ([float('infinity')] * n, [float('infinity')] * n)
+    previous = ([None] * n, [None] * n)
+    visited = (bytearray(n), bytearray(n))
+    best = float('infinity') if start != goal else 0
+    meet = None if start != goal else start
+    settled = 0
+    for side, root in enumerate((start, goal)):
+        distances[side][root] = 0
+        pqs[side].push(root, 0)
+        yield {
+            "type": "distance",
+            "node": ids[root],
+            "distance": 0,
+            "side": SIDES[side]
+        }
+    while start != goal and pqs[0] and pqs[1]:
+        side = 0 if len(pqs[0]) <= len(pqs[1]) else 1
+        other = 1 - side
+        name = SIDES[side]
+        csr = csrs[side]
+        side_distances = distances[side]
+        other_distances = distances[other]
+        current_distance, current_index = pqs[side].pop()
+        visited[side][current_index] = 1
+        settled += 1
+        current_node = ids[current_index]
+        yield {
             "type": "visit",
             "node": current_node,
-            "action": f"Visiting node {current_node} with distance {current_distance}",
-            "reason": f"Dijkstra's algorithm selects the unvisited node with the smallest known distance."
-        })
-        for neighbor in adj_list[current_node]:
-            target = neighbor["target"]
-            weight = neighbor["weight"]
-            if target in visited:
+            "side": name
+        }
+        if visited[other][current_index]:
+            yield {
+                "type": "complete",
+                "node": current_node,
+                "side": name
+            }
+            break
+        for k in range(csr.offsets[current_index], csr.offsets[current_index + 1]):
+            target_index = csr.targets[k]
+            if visited[side][target_index]:
                 continue
-            old_distance = distances[target]
-            new_distance = distances[current_node] + weight
+            target = ids[target_index]
+            old_distance = side_distances[target_index]
+            new_distance = current_distance + csr.weights[k]
             success = new_distance < old_distance
-            steps.append({
+            yield {
                 "type": "relax",
                 "from": current_node,
                 "to": target,
                 "success": success,
                 "newDistance": new_distance if success else old_distance,
-                "action": f"Trying to relax edge from {current_node} to {target} (weight: {weight})",
-                "reason": f"Checking if path through {current_node} provides a shorter distance to {target}."
-            })
+                "side": name
+            }
             if success:
-                distances[target] = new_distance
-                previous[target] = current_node
-                heapq.heappush(pq, (new_distance, target))
-                steps.append({
+                side_distances[target_index] = new_distance
+                previous[side][target_index] = current_index
+                pqs[side].push(target_index, new_distance)
+                yield {
                     "type": "distance",
                     "node": target,
                     "distance": new_distance,
-                    "action": f"Updated distance to node {target} to {new_distance}",
-                    "reason": f"Found shorter path to {target} through node {current_node}."
-                })
-        steps.append({
+                    "side": name
+                }
+                if new_distance + other_distances[target_index] < best:
+                    best = new_distance + other_distances[target_index]
+                    meet = target_index
+        yield {
             "type": "complete",
             "node": current_node,
-            "action": f"Completed processing of node {current_node}",
-            "reason": f"All edges from this node have been considered for relaxation."
-        })
-    final_paths = []
-    for node in nodes:
-        node_id = node["id"]
-        if node_id != start_node and previous[node_id] is not None:
-            path = []
-            current = node_id
-            while current is not None:
-                if previous[current] is not None:
-                    path.append((previous[current], current))
-                current = previous[current]
-            final_paths.extend(path)
-    if final_paths:
-        steps.append({
+            "side": name
+        }
+    if meet is not None:
+        yield {
+            "type": "meet",
+            "node": ids[meet]
+        }
+        # The backward search's parents point along graph edges towards the target
+        edges = _path_edges(ids, previous[0], meet)
+        index = meet
+        while previous[1][index] is not None:
+            edges.append((ids[index], ids[previous[1][index]]))
+            index = previous[1][index]
+        yield {
             "type": "path",
-            "edges": list(set(final_paths)),
-            "action": f"Final shortest paths from node {start_node}",
-            "reason": f"The algorithm has found the shortest path from the start node to all reachable nodes."
-        })
-    return steps
\ No newline at end of file
+            "edges": edges,
+            "target": ids[goal],
+            "distance": best
+        }
+    if include_stats:
+        stats = {"type": "stats", "queue": queue}
+        for key, value in pqs[0].stats().items():
+            if key != "queue":
+                stats[key] = value + pqs[1].stats()[key]
+        stats["settled"] = settled
+        yield stats
+
+def bidirectional_dijkstra(graph, start_node, target_node, queue="lazy", include_stats=False):
+    """
+    Bidirectional Dijkstra between two nodes.
+    Returns the steps of iter_bidirectional_dijkstra as a list (see there for the options).
+    """
+    return list(iter_bidirectional_dijkstra(
+        graph, start_node, target_node, queue=queue, include_stats=include_stats
+    ))
+
+def iter_astar(
+    graph, start_node, target_node, heuristic="landmarks", queue="lazy", include_stats=False, landmarks=8,
+    compare_dijkstra=False
+):
+    """
+    A* search: Dijkstra towards one target, ordering the queue by distance plus a lower
+    bound on the remaining distance, so nodes leading away from the target are settled late
+    or never. Yields the same steps as iter_dijkstra with target_node (distances are from
+    the start, without the estimate), so it animates like Dijkstra.
+    Args:
+        heuristic: Lower bound from algorithms.heuristics:
+            - "landmarks": ALT bounds from landmark distance tables, precomputed once per
+              CompiledGraph (default)
+            - "euclidean": scaled straight-line distance from node "x"/"y" coordinates
+            - "zero": no estimate (plain Dijkstra)
+            or a callable (graph, target_index) -> (node_index -> bound)
+        queue: "lazy" or "indexed" priority queue (the bucket queue needs integer priorities)
+        include_stats: Append a "stats" step with the queue counters and the nodes "settled"
+        landmarks: Number of landmarks for the "landmarks" heuristic
+        compare_dijkstra: Also run iter_dijkstra for the same target and add the nodes it
+            settles ("dijkstraSettled") and the difference ("settledSaved") to the stats step
+    Raises:
+        ValueError: For the bucket queue, an unknown heuristic or target_node, or the
+            Euclidean heuristic on a graph without coordinates
+    """
+    graph = compile_graph(graph)
+    start_node = parse_node_id(start_node)
+    start = graph.resolve(start_node)
+    if start is None:
+        return
+    goal = resolve_target(graph, target_node)
+    if queue == "bucket":
+        raise ValueError("A* needs the lazy or indexed queue")
+    options = {"count": landmarks} if heuristic == "landmarks" else {}
+    estimate = make_heuristic(heuristic, graph, goal, **options)
+    ids = graph.ids
+    offsets = graph.offsets
+    targets = graph.targets
+    weights = graph.weights
+    n = len(graph)
+    distances = [float('infinity')] * n
+    distances[start] = 0
+    previous = [None] * n
+    pq = make_queue(queue, n)
+    pq.push(start, estimate(start))
+    visited = bytearray(n)
+    settled = 0
+    yield {
+        "type": "distance",
+        "node": start_node,
+        "distance": 0
+    }
+    while pq:
+        _, current_index = pq.pop()
+        visited[current_index] = 1
+        settled += 1
+        current_node = ids[current_index]
+        yield {
+            "type": "visit",
+            "node": current_node
+        }
+        if current_index == goal:
+            yield {
+                "type": "complete",
+                "node": current_node
+            }
+            break
+        for k in range(offsets[current_index], offsets[current_index + 1]):
+            target_index = targets[k]
+            if visited[target_index]:
+                continue
+            target = ids[target_index]
+            old_distance = distances[target_index]
+            new_distance = distances[current_index] + weights[k]
+            success = new_distance < old_distance
+            yield {
+                "type": "relax",
+                "from": current_node,
+                "to": target,
+                "success": success,
+                "newDistance": new_distance if success else old_distance
+            }
+            if success:
+                distances[target_index] = new_distance
+                previous[target_index] = current_index
+                yield {
+                    "type": "distance",
+                    "node": target,
+                    "distance": new_distance
+                }
+                bound = estimate(target_index)
+                # An infinite bound proves the target is unreachable from this node
+                if bound != float('infinity'):
+                    pq.push(target_index, new_distance + bound)
+        yield {
+            "type": "complete",
+            "node": current_node
+        }
+    if visited[goal]:
+        yield {
+            "type": "path",
+            "edges": _path_edges(ids, previous, goal),
+            "target": ids[goal],
+            "distance": distances[goal]
+        }
+    if include_stats:
+        stats = dict({"type": "stats"}, **pq.stats(), heuristic=getattr(heuristic, "__name__", heuristic))
+        stats["settled"] = settled
+        if compare_dijkstra:
+            # Settled count of plain Dijkstra for the same query, from its own stats step
+            baseline = None
+            for step in iter_dijkstra(graph, start_node, queue=queue, include_stats=True, target_node=target_node):
+                baseline = step
+            stats["dijkstraSettled"] = baseline["settled"]
+            stats["settledSaved"] = baseline["settled"] - settled
+        yield stats
+
+def astar(
+    graph, start_node, target_node, heuristic="landmarks", queue="lazy", include_stats=False, landmarks=8,
+    compare_dijkstra=False
+):
+    """
+    A* search.
+    Returns the steps of iter_astar as a list (see there for the options).
+    """
+    return list(iter_astar(
+        graph, start_node, target_node, heuristic=heuristic, queue=queue,
+        include_stats=include_stats, landmarks=landmarks, compare_dijkstra=compare_dijkstra
+    ))
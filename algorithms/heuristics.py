@@ -0,0 +1,156 @@
+# Distance lower bounds for A* (algorithms.graph_algorithms.iter_astar)
+# A heuristic is built for one (graph, target) pair and maps a node index to a lower bound on
+# its distance to the target. All of them are consistent, so A* settles every node at most once
+import heapq
+import math
+import weakref
+from array import array
+
+INFINITY = float("infinity")
+
+# Per-graph precomputations (Euclidean scale, landmark tables), dropped with the graph
+_CACHE = weakref.WeakKeyDictionary()
+
+def _cached(graph, key, compute):
+    entries = _CACHE.setdefault(graph, {})
+    if key not in entries:
+        entries[key] = compute()
+    return entries[key]
+
+def zero_heuristic(graph, target):
+    """No estimate: A* with it settles the same nodes as Dijkstra."""
+    return lambda index: 0
+
+def _euclidean_scale(graph):
+    """
+    The largest factor s with s * |uv| <= weight(u, v) on every edge, so that s times the
+    straight-line distance never overestimates a path's weight.
+    """
+    xs, ys = graph.positions
+    offsets = graph.offsets
+    targets = graph.targets
+    weights = graph.weights
+    scale = INFINITY
+    for u in range(len(graph)):
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            length = math.hypot(xs[u] - xs[v], ys[u] - ys[v])
+            if length > 0:
+                scale = min(scale, weights[k] / length)
+    # Without edges of positive length there is nothing to calibrate against
+    return 0 if scale == INFINITY else scale
+
+def euclidean_heuristic(graph, target):
+    """
+    Straight-line distance to the target from the graph's layout coordinates (node "x"/"y"),
+    scaled so that it is a lower bound for the edge weights. The scale is computed once per
+    graph; weights unrelated to the layout give a small scale and a weak estimate.
+    Raises:
+        ValueError: If the graph has no coordinates
+    """
+    if graph.positions is None:
+        raise ValueError("The Euclidean heuristic needs x/y coordinates on every node")
+    scale = _cached(graph, "euclidean", lambda: _euclidean_scale(graph))
+    xs, ys = graph.positions
+    tx = xs[target]
+    ty = ys[target]
+    return lambda index: scale * math.hypot(xs[index] - tx, ys[index] - ty)
+
+def _distances(graph, source):
+    """Distances from source to every node (infinity if unreachable), as an array of doubles."""
+    distances = array("d", [INFINITY]) * len(graph)
+    distances[source] = 0
+    offsets = graph.offsets
+    targets = graph.targets
+    weights = graph.weights
+    heap = [(0, source)]
+    while heap:
+        distance, u = heapq.heappop(heap)
+        if distance > distances[u]:
+            continue
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            new_distance = distance + weights[k]
+            if new_distance < distances[v]:
+                distances[v] = new_distance
+                heapq.heappush(heap, (new_distance, v))
+    return distances
+
+def landmark_tables(graph, count=8):
+    """
+    Pick up to count landmarks by farthest-point selection and compute their distance tables.
+    Computed once per (graph, count) and cached with the graph.
+    Returns:
+        (landmarks, from_tables, to_tables): landmark indices, distances from each landmark
+        to every node, and distances from every node to each landmark (over graph.reverse();
+        the same tables for undirected graphs)
+    """
+    def compute():
+        n = len(graph)
+        landmarks = []
+        from_tables = []
+        to_tables = []
+        chosen = set()
+        # Distance from the nearest chosen landmark; the first one is the farthest node from node 0
+        nearest = _distances(graph, 0) if n else []
+        while len(landmarks) < min(count, n):
+            candidate = max(
+                (i for i in range(n) if nearest[i] != INFINITY and i not in chosen),
+                key=nearest.__getitem__, default=None
+            )
+            if candidate is None:
+                # Every node reached so far is a landmark; continue in an unreached part of the graph
+                candidate = next(i for i in range(n) if i not in chosen)
+            landmarks.append(candidate)
+            chosen.add(candidate)
+            from_table = _distances(graph, candidate)
+            from_tables.append(from_table)
+            to_tables.append(from_table if not graph.directed else _distances(graph.reverse(), candidate))
+            nearest = [min(a, b) for a, b in zip(nearest, from_table)]
+        return landmarks, from_tables, to_tables
+    return _cached(graph, ("landmarks", count), compute)
+
+def landmark_heuristic(graph, target, count=8):
+    """
+    ALT lower bound from landmark distance tables (landmark_tables), using the triangle
+    inequality: d(v, t) >= d(L, t) - d(L, v) and d(v, t) >= d(v, L) - d(t, L) for each landmark L.
+    An infinite bound means the node cannot reach the target.
+    """
+    _, from_tables, to_tables = landmark_tables(graph, count)
+    # Only the terms with a finite target distance bound anything
+    forward = [(table, table[target]) for table in from_tables if table[target] != INFINITY]
+    backward = [(table, table[target]) for table in to_tables if table[target] != INFINITY]
+    unreachable = [table for table in from_tables if table[target] == INFINITY]
+    def estimate(index):
+        best = 0
+        for table in unreachable:
+            # The landmark reaches this node but not the target, so neither does this node
+            if table[index] != INFINITY:
+                return INFINITY
+        for table, to_target in forward:
+            bound = to_target - table[index]
+            if bound > best:
+                best = bound
+        for table, from_target in backward:
+            bound = table[index] - from_target
+            if bound > best:
+                best = bound
+        return best
+    return estimate
+
+HEURISTICS = {
+    "zero": zero_heuristic,
+    "euclidean": euclidean_heuristic,
+    "landmarks": landmark_heuristic,
+}
+
+def make_heuristic(kind, graph, target, **options):
+    """
+    Create a heuristic by name ("zero", "euclidean" or "landmarks") for target in graph.
+    kind may also be a callable (graph, target) -> estimate, for custom heuristics.
+    """
+    if callable(kind):
+        return kind(graph, target, **options)
+    if kind not in HEURISTICS:
+        raise ValueError(f"Unknown heuristic: {kind}")
+    return HEURISTICS[kind](graph, target, **options)
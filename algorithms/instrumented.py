@@ -0,0 +1,95 @@
+# Instrumented array shared by the sorting algorithms
+# Counts element reads, writes, comparisons and swaps, and turns the writes made between
+# two steps into the delta-encoded steps described in algorithms.trace
+from algorithms.trace import default_keyframe_interval
+
+class InstrumentedArray:
+    """
+    A list wrapper that records how an algorithm touches the array.
+    Indexing reads and writes go through the counters; compare() and swap() count as one
+    comparison or swap plus the reads and writes they make. step() emits a trace step
+    carrying the [index, value] pairs written since the previous step, and a full
+    snapshot every keyframe_interval steps.
+    The wrapped list is sorted in place; use .values to read it without counting.
+    """
+    def __init__(self, values, keyframe_interval=None):
+        self.values = values
+        if keyframe_interval is None:
+            keyframe_interval = default_keyframe_interval(len(values))
+        self.keyframe_interval = keyframe_interval
+        self.reads = 0
+        self.writes = 0
+        self.comparisons = 0
+        self.swaps = 0
+        self.step_count = 0
+        # Indices written since the last step, in first-write order
+        self._written = {}
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        self.reads += 1
+        return self.values[index]
+
+    def __setitem__(self, index, value):
+        self.writes += 1
+        self.values[index] = value
+        self._written[index] = None
+
+    def compare(self, i, j):
+        """Compare the values at i and j: -1, 0 or 1 as values[i] is less than, equal to or greater than values[j]."""
+        self.reads += 2
+        self.comparisons += 1
+        a = self.values[i]
+        b = self.values[j]
+        return (a > b) - (a < b)
+
+    def compare_value(self, i, value):
+        """Compare the value at i with a value held outside the array (e.g. a saved pivot): -1, 0 or 1."""
+        self.reads += 1
+        self.comparisons += 1
+        a = self.values[i]
+        return (a > value) - (a < value)
+
+    def swap(self, i, j):
+        """Exchange the values at i and j."""
+        values = self.values
+        self.reads += 2
+        self.writes += 2
+        self.swaps += 1
+        values[i], values[j] = values[j], values[i]
+        self._written[i] = None
+        self._written[j] = None
+
+    def step(self, step_type, keyframe=False, **fields):
+        """
+        Build the next trace step.
+        Args:
+            step_type: The step "type"
+            keyframe: Attach a full snapshot even between keyframe intervals
+            **fields: Other step fields, e.g. comparing=[i, j]
+        Returns:
+            The step dict, with "writes" when values changed since the previous step
+        """
+        step = {"type": step_type, **fields}
+        if self._written:
+            values = self.values
+            step["writes"] = [v for index in self._written for v in (index, values[index])]
+            self._written = {}
+        if keyframe or self.step_count % self.keyframe_interval == 0:
+            step["array"] = self.values.copy()
+        self.step_count += 1
+        return step
+
+    def stats(self):
+        """
+        Operation counters, as recorded in the trace.
+        Reads and writes are named elementReads/elementWrites, since "writes" holds a step's deltas.
+        """
+        return {
+            "elementReads": self.reads,
+            "elementWrites": self.writes,
+            "comparisons": self.comparisons,
+            "swaps": self.swaps,
+        }
@@ -0,0 +1,70 @@
+# Pivot selection strategies for quicksort
+# Each strategy maps (arr, low, high, rng) to an index in [low, high]
+
+def median_of_three(arr, a, b, c):
+    """Index of the median of arr[a], arr[b] and arr[c]."""
+    if arr[a] > arr[b]:
+        if arr[b] > arr[c]:
+            return b
+        elif arr[a] > arr[c]:
+            return c
+        else:
+            return a
+    else:
+        if arr[a] > arr[c]:
+            return a
+        elif arr[b] > arr[c]:
+            return c
+        else:
+            return b
+
+def _first(arr, low, high, rng):
+    return low
+
+def _last(arr, low, high, rng):
+    return high
+
+def _middle(arr, low, high, rng):
+    return low + (high - low) // 2
+
+def _random(arr, low, high, rng):
+    return rng.randint(low, high)
+
+def _median(arr, low, high, rng):
+    return median_of_three(arr, low, low + (high - low) // 2, high)
+
+# Ranges at least this long use the ninther; shorter ones fall back to median-of-three
+NINTHER_THRESHOLD = 40
+
+def _ninther(arr, low, high, rng):
+    """
+    Tukey's ninther: the median of the medians of three evenly spaced triples.
+    Approximates the median of nine samples, which resists organ-pipe and sorted inputs.
+    """
+    if high - low + 1 < NINTHER_THRESHOLD:
+        return _median(arr, low, high, rng)
+    eighth = (high - low + 1) // 8
+    mid = low + (high - low) // 2
+    return median_of_three(
+        arr,
+        median_of_three(arr, low, low + eighth, low + 2 * eighth),
+        median_of_three(arr, mid - eighth, mid, mid + eighth),
+        median_of_three(arr, high - 2 * eighth, high - eighth, high),
+    )
+
+PIVOT_STRATEGIES = {
+    "last": _last,
+    "first": _first,
+    "middle": _middle,
+    "random": _random,
+    "median": _median,
+    "ninther": _ninther,
+}
+
+PIVOT_METHODS = list(PIVOT_STRATEGIES)
+
+def get_pivot_strategy(method):
+    """Return the strategy function for a pivot method name."""
+    if method not in PIVOT_STRATEGIES:
+        raise ValueError(f"Unknown pivot method: {method}")
+    return PIVOT_STRATEGIES[method]
@@ -0,0 +1,200 @@
+# Priority queues for Dijkstra-style searches over dense node indices 0..capacity-1
+# All queues share one interface and count their operations for the trace
+import heapq
+from collections import deque
+
+class _CountingQueue:
+    """
+    Shared interface:
+        push(item, priority): insert item, or lower its priority if already queued
+        pop(): remove and return (priority, item) with the smallest (priority, item)
+        len(queue): number of queued items (not counting stale entries)
+    """
+    name = ""
+
+    def __init__(self):
+        self.pushes = 0
+        self.pops = 0
+        self.stale_pops = 0
+        self.decrease_keys = 0
+
+    def stats(self):
+        """Operation counters, as recorded in the trace."""
+        return {
+            "queue": self.name,
+            "pushes": self.pushes,
+            "pops": self.pops,
+            "stalePops": self.stale_pops,
+            "decreaseKeys": self.decrease_keys,
+        }
+
+class LazyHeap(_CountingQueue):
+    """
+    Binary heap (heapq) with lazy deletion: lowering a priority pushes a duplicate
+    entry, and outdated entries are discarded when they reach the top.
+    """
+    name = "lazy"
+
+    def __init__(self, capacity, max_weight=None):
+        super().__init__()
+        self._heap = []
+        self._best = {}
+
+    def __len__(self):
+        return len(self._best)
+
+    def push(self, item, priority):
+        if item in self._best:
+            self.decrease_keys += 1
+        self._best[item] = priority
+        self.pushes += 1
+        heapq.heappush(self._heap, (priority, item))
+
+    def pop(self):
+        while self._heap:
+            priority, item = heapq.heappop(self._heap)
+            if self._best.get(item) != priority:
+                self.stale_pops += 1
+                continue
+            del self._best[item]
+            self.pops += 1
+            return priority, item
+        raise IndexError("pop from empty priority queue")
+
+class IndexedHeap(_CountingQueue):
+    """
+    Binary heap with a position index per item, supporting decrease-key in place.
+    Holds at most one entry per item, so it never grows past the number of queued nodes.
+    """
+    name = "indexed"
+
+    def __init__(self, capacity, max_weight=None):
+        super().__init__()
+        self._heap = []
+        self._position = [-1] * capacity
+        self._priority = [None] * capacity
+
+    def __len__(self):
+        return len(self._heap)
+
+    def _less(self, a, b):
+        return (self._priority[a], a) < (self._priority[b], b)
+
+    def _sift_up(self, index):
+        heap = self._heap
+        position = self._position
+        item = heap[index]
+        while index > 0:
+            parent = (index - 1) >> 1
+            if not self._less(item, heap[parent]):
+                break
+            heap[index] = heap[parent]
+            position[heap[index]] = index
+            index = parent
+        heap[index] = item
+        position[item] = index
+
+    def _sift_down(self, index):
+        heap = self._heap
+        position = self._position
+        size = len(heap)
+        item = heap[index]
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and self._less(heap[child + 1], heap[child]):
+                child += 1
+            if not self._less(heap[child], item):
+                break
+            heap[index] = heap[child]
+            position[heap[index]] = index
+            index = child
+        heap[index] = item
+        position[item] = index
+
+    def push(self, item, priority):
+        self.pushes += 1
+        index = self._position[item]
+        self._priority[item] = priority
+        if index >= 0:
+            self.decrease_keys += 1
+            self._sift_up(index)
+        else:
+            self._heap.append(item)
+            self._sift_up(len(self._heap) - 1)
+
+    def pop(self):
+        heap = self._heap
+        if not heap:
+            raise IndexError("pop from empty priority queue")
+        top = heap[0]
+        last = heap.pop()
+        if heap:
+            heap[0] = last
+            self._sift_down(0)
+        self._position[top] = -1
+        self.pops += 1
+        return self._priority[top], top
+
+class BucketQueue(_CountingQueue):
+    """
+    Dial's algorithm: a circular array of max_weight + 1 FIFO buckets indexed by priority.
+    Only valid for non-negative integer priorities that never trail the last popped
+    priority by more than max_weight, as in Dijkstra with integer edge weights.
+    Items within a bucket come out in insertion order, not by item index.
+    """
+    name = "bucket"
+
+    def __init__(self, capacity, max_weight):
+        super().__init__()
+        if max_weight is None or max_weight < 0 or int(max_weight) != max_weight:
+            raise ValueError("BucketQueue requires a non-negative integer max_weight")
+        self._buckets = [deque() for _ in range(int(max_weight) + 1)]
+        self._priority = [None] * capacity
+        self._cursor = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def push(self, item, priority):
+        self.pushes += 1
+        if self._priority[item] is not None:
+            self.decrease_keys += 1
+        else:
+            self._size += 1
+        self._priority[item] = priority
+        self._buckets[priority % len(self._buckets)].append(item)
+
+    def pop(self):
+        if not self._size:
+            raise IndexError("pop from empty priority queue")
+        buckets = self._buckets
+        while True:
+            bucket = buckets[self._cursor % len(buckets)]
+            while bucket:
+                item = bucket.popleft()
+                if self._priority[item] != self._cursor:
+                    self.stale_pops += 1
+                    continue
+                self._priority[item] = None
+                self._size -= 1
+                self.pops += 1
+                return self._cursor, item
+            self._cursor += 1
+
+PRIORITY_QUEUES = {
+    "lazy": LazyHeap,
+    "indexed": IndexedHeap,
+    "bucket": BucketQueue,
+}
+
+def make_queue(kind, capacity, max_weight=None):
+    """
+    Create a priority queue by name ("lazy", "indexed" or "bucket") for items 0..capacity-1.
+    max_weight is the largest edge weight; it is required by the bucket queue.
+    """
+    if kind not in PRIORITY_QUEUES:
+        raise ValueError(f"Unknown priority queue: {kind}")
+    return PRIORITY_QUEUES[kind](capacity, max_weight)
@@ -0,0 +1,324 @@
+# Headless batch runner: python -m algorithms.run INPUT --output DIR
+# Runs the graph and sorting algorithms over many inputs on a process pool and writes
+# traces and/or a summary line per (input, algorithm) to disk
+import argparse
+import base64
+import json
+import os
+import re
+import sys
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from algorithms.compiled_graph import compile_graph
+from algorithms.pivots import PIVOT_METHODS
+from algorithms.graph_algorithms import (
+    iter_dfs, iter_bfs, iter_dijkstra, iter_bidirectional_bfs, iter_bidirectional_dijkstra, iter_astar
+)
+from algorithms.priority_queues import PRIORITY_QUEUES
+from algorithms.sorting import PARTITION_METHODS, SORTING_ALGORITHMS, iter_quicksort
+from algorithms.trace import encode_columnar
+
+GRAPH_ALGORITHMS = ["dfs", "bfs", "dijkstra", "bidirectional_bfs", "bidirectional_dijkstra", "astar"]
+ARRAY_ALGORITHMS = list(SORTING_ALGORITHMS)
+
+def iter_records(source):
+    """
+    Read input records lazily from a JSONL file, a .json file, a directory of those, or "-" for stdin.
+    A record is a graph ({"nodes", "links"}), an array (a JSON list), or an object with
+    "graph" or "array" plus optional "id", "start_node", "target_node", "queue", "heuristic",
+    "pivot_method", "partition_method" and "seed".
+    Lines or files that are not valid JSON are reported on stderr and skipped.
+    Yields:
+        (record_id, record) with record normalized to an object holding "graph" or "array"
+    """
+    if source == "-":
+        yield from _iter_lines(sys.stdin, "stdin")
+        return
+    if os.path.isdir(source):
+        paths = sorted(
+            os.path.join(source, name) for name in os.listdir(source)
+            if name.endswith((".json", ".jsonl"))
+        )
+    else:
+        paths = [source]
+    for path in paths:
+        name = os.path.splitext(os.path.basename(path))[0]
+        with open(path, "r", encoding="utf-8") as f:
+            if path.endswith(".jsonl"):
+                yield from _iter_lines(f, name)
+                continue
+            try:
+                record = json.load(f)
+            except json.JSONDecodeError as e:
+                print(f"Skipping {path}: invalid JSON ({e})", file=sys.stderr)
+                continue
+            yield _normalize(record, name)
+
+def _iter_lines(lines, name):
+    for line_number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            print(f"Skipping line {line_number} of {name}: invalid JSON ({e})", file=sys.stderr)
+            continue
+        yield _normalize(record, f"{name}-{line_number}")
+
+def _normalize(record, default_id):
+    if isinstance(record, list):
+        return default_id, {"array": record}
+    if not isinstance(record, dict):
+        # Left for run_record to report as a record with neither "graph" nor "array"
+        return default_id, {}
+    record_id = str(record.get("id", default_id))
+    if "nodes" in record:
+        record = {"graph": record}
+    return record_id, record
+
+def _file_stem(record_id, algorithm):
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", record_id) + "." + algorithm
+
+def run_record(record_id, record, options):
+    """
+    Run every requested algorithm that applies to one record.
+    Traces are written by the worker itself, so only the small summaries travel back.
+    A record that cannot be prepared (an unknown node in a link, neither "graph" nor "array")
+    gives a single summary with an "error" instead of aborting the batch.
+    Returns:
+        A list of summary dicts, one per algorithm
+    """
+    try:
+        runs, size = _prepare_runs(record, options)
+    except Exception as e:
+        return [{"id": record_id, "error": f"{type(e).__name__}: {e}"}]
+    summaries = []
+    for algorithm in options["algorithms"]:
+        if algorithm not in runs:
+            continue
+        summary = {"id": record_id, "algorithm": algorithm}
+        summary.update(size)
+        started = time.perf_counter()
+        try:
+            summary.update(_run_algorithm(runs[algorithm](), _file_stem(record_id, algorithm), options))
+        except Exception as e:
+            summary["error"] = f"{type(e).__name__}: {e}"
+        summary["seconds"] = round(time.perf_counter() - started, 6)
+        summaries.append(summary)
+    return summaries
+
+def _prepare_runs(record, options):
+    """
+    Compile the record's graph or copy its array, and bind the algorithms that apply to it.
+    Returns:
+        (runs, size): step generator factories by algorithm name, and the summary size fields
+    Raises:
+        ValueError: If the record holds neither "graph" nor "array"
+    """
+    if "graph" in record:
+        graph = compile_graph(record["graph"])
+        start_node = record.get("start_node", 0)
+        target_node = record.get("target_node", options.get("target_node"))
+        queue = record.get("queue", options["queue"])
+        runs = {
+            "dfs": lambda: iter_dfs(graph, start_node),
+            "bfs": lambda: iter_bfs(graph, start_node, target_node=target_node, backend=options["bfs_backend"]),
+            "dijkstra": lambda: iter_dijkstra(
+                graph, start_node, queue=queue, include_stats=True, target_node=target_node
+            ),
+        }
+        # The bidirectional searches and A* need both ends of the path
+        if target_node is not None:
+            runs["astar"] = lambda: iter_astar(
+                graph, start_node, target_node, heuristic=record.get("heuristic", options["heuristic"]),
+                queue=queue, include_stats=True
+            )
+            runs["bidirectional_bfs"] = lambda: iter_bidirectional_bfs(graph, start_node, target_node)
+            runs["bidirectional_dijkstra"] = lambda: iter_bidirectional_dijkstra(
+                graph, start_node, target_node, queue=queue, include_stats=True
+            )
+        size = {"nodes": len(graph), "edges": graph.edge_count}
+    elif "array" in record:
+        array = list(record["array"])
+        pivot_method = record.get("pivot_method", options["pivot_method"])
+        partition_method = record.get("partition_method", options["partition_method"])
+        runs = {
+            name: lambda sort=sort: sort(array.copy(), include_stats=True)
+            for name, sort in SORTING_ALGORITHMS.items()
+        }
+        runs["quicksort"] = lambda: iter_quicksort(
+            array.copy(), pivot_method=pivot_method, partition_method=partition_method,
+            seed=record.get("seed"), include_stats=True
+        )
+        size = {"size": len(array)}
+    else:
+        raise ValueError('record has neither "graph" nor "array"')
+    return runs, size
+
+def _run_algorithm(steps, stem, options):
+    """
+    Consume a step generator once, counting step types and writing the trace if requested.
+    A trailing "stats" step is copied into the summary under "stats".
+    """
+    types = Counter()
+    result = {}
+    def counted(steps):
+        for step in steps:
+            types[step["type"]] += 1
+            if step["type"] == "stats":
+                result["stats"] = {key: value for key, value in step.items() if key != "type"}
+            yield step
+    if options["traces"] == "json":
+        path = os.path.join(options["output"], stem + ".json")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("[")
+            for count, step in enumerate(counted(steps)):
+                if count:
+                    f.write(",")
+                f.write(json.dumps(step, separators=(",", ":")))
+            f.write("]")
+        result["trace"] = os.path.basename(path)
+    elif options["traces"] == "columnar":
+        path = os.path.join(options["output"], stem + ".columns.json")
+        header, buffer = encode_columnar(counted(steps))
+        header["data"] = base64.b64encode(buffer).decode("ascii")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(header, f, separators=(",", ":"))
+        result["trace"] = os.path.basename(path)
+    else:
+        for _ in counted(steps):
+            pass
+    result["steps"] = sum(types.values())
+    result["stepTypes"] = dict(types)
+    return result
+
+def run_chunk(chunk, options):
+    """Worker entry point: run a list of (record_id, record) pairs."""
+    summaries = []
+    for record_id, record in chunk:
+        summaries.extend(run_record(record_id, record, options))
+    return summaries
+
+def _chunks(records, chunk_size):
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def run_batch(records, options, workers=None, chunk_size=16, max_in_flight=None):
+    """
+    Run records through run_chunk on a process pool.
+    Records are read lazily and at most max_in_flight chunks are queued at a time
+    (backpressure), so memory stays bounded however long the input is.
+    Args:
+        records: Iterable of (record_id, record) pairs, as from iter_records
+        options: Options dict passed to every worker
+        workers: Number of worker processes (default: os.cpu_count()); 0 runs in this process
+        chunk_size: Records per task
+        max_in_flight: Maximum number of submitted, unfinished chunks (default: 2 * workers)
+    Yields:
+        Summary dicts, in completion order
+    """
+    chunks = _chunks(records, chunk_size)
+    if workers == 0:
+        for chunk in chunks:
+            yield from run_chunk(chunk, options)
+        return
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or 2 * workers
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        in_flight = set()
+        for chunk in chunks:
+            if len(in_flight) >= max_in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+            in_flight.add(executor.submit(run_chunk, chunk, options))
+        for future in wait(in_flight).done:
+            yield from future.result()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m algorithms.run",
+        description="Run graph and sorting algorithms over many inputs and write traces/summaries."
+    )
+    parser.add_argument("input", help="JSONL file, .json file, directory of them, or - for stdin")
+    parser.add_argument("-o", "--output", required=True, help="Output directory")
+    parser.add_argument(
+        "-a", "--algorithms", default=",".join(GRAPH_ALGORITHMS + ARRAY_ALGORITHMS),
+        help="Comma-separated algorithms to run (default: all that apply to each record)"
+    )
+    parser.add_argument(
+        "--traces", choices=["none", "json", "columnar"], default="none",
+        help="Write each trace as JSON or in the columnar format (default: summaries only)"
+    )
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Worker processes (default: CPU count; 0 = no pool)")
+    parser.add_argument("--chunk-size", type=int, default=16, help="Records per task (default: 16)")
+    parser.add_argument("--max-in-flight", type=int, default=None, help="Queued tasks before reading pauses (default: 2 x workers)")
+    parser.add_argument(
+        "--pivot-method", choices=PIVOT_METHODS, default="last", help="QuickSort pivot method unless a record sets one"
+    )
+    parser.add_argument(
+        "--partition-method", choices=PARTITION_METHODS, default="lomuto",
+        help="QuickSort partition scheme unless a record sets one"
+    )
+    parser.add_argument(
+        "--queue", choices=list(PRIORITY_QUEUES), default="lazy", help="Dijkstra priority queue unless a record sets one"
+    )
+    parser.add_argument(
+        "--target-node", type=int, default=None,
+        help="Stop BFS/Dijkstra at this node and run the bidirectional searches and A*, unless a record sets one"
+    )
+    parser.add_argument(
+        "--bfs-backend", choices=["python", "numpy"], default="python",
+        help="BFS with per-edge steps, or vectorized with per-level steps (for huge graphs)"
+    )
+    parser.add_argument(
+        "--heuristic", choices=["landmarks", "euclidean", "zero"], default="landmarks",
+        help="A* heuristic unless a record sets one (euclidean needs node x/y coordinates)"
+    )
+    args = parser.parse_args(argv)
+
+    algorithms = [name.strip() for name in args.algorithms.split(",") if name.strip()]
+    unknown = set(algorithms) - set(GRAPH_ALGORITHMS + ARRAY_ALGORITHMS)
+    if unknown:
+        parser.error(f"unknown algorithms: {', '.join(sorted(unknown))}")
+    os.makedirs(args.output, exist_ok=True)
+    options = {
+        "algorithms": algorithms,
+        "output": args.output,
+        "traces": args.traces,
+        "pivot_method": args.pivot_method,
+        "partition_method": args.partition_method,
+        "queue": args.queue,
+        "target_node": args.target_node,
+        "heuristic": args.heuristic,
+        "bfs_backend": args.bfs_backend,
+    }
+
+    failures = 0
+    count = 0
+    started = time.perf_counter()
+    with open(os.path.join(args.output, "summary.jsonl"), "w", encoding="utf-8") as summary_file:
+        for summary in run_batch(
+            iter_records(args.input), options,
+            workers=args.workers, chunk_size=args.chunk_size, max_in_flight=args.max_in_flight
+        ):
+            summary_file.write(json.dumps(summary) + "\n")
+            count += 1
+            failures += "error" in summary
+    print(
+        f"{count} runs ({failures} failed) in {time.perf_counter() - started:.2f}s; "
+        f"summaries in {os.path.join(args.output, 'summary.jsonl')}",
+        file=sys.stderr
+    )
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
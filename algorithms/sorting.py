@@ -1,117 +1,528 @@
 import random
-# QuickSort algorithm with multiple pivot strategies and step recording for visualization
-def quicksort(arr, pivot_method="last"):
+from algorithms.instrumented import InstrumentedArray
+from algorithms.pivots import get_pivot_strategy
+# Sorting algorithms with step recording for visualization
+# Every algorithm runs on an InstrumentedArray, which counts reads, writes, comparisons
+# and swaps and records the writes of each step
+PARTITION_METHODS = ["lomuto", "three_way", "hoare"]
+
+# Step types kept by the "structural" level of detail (see algorithms.trace.sample_array_steps):
+# partition boundaries, merge passes, runs, digit passes and gaps, plus the sorted markers
+STRUCTURAL_STEPS = {
+    "quicksort": {"range", "split", "heapsort", "sorted", "stats"},
+    "merge_sort": {"pass", "merge", "sorted", "stats"},
+    "heapsort": {"heapify", "sorted", "stats"},
+    "timsort": {"run", "merge", "sorted", "stats"},
+    "radix_sort": {"digit", "sorted", "stats"},
+    "shell_sort": {"gap", "sorted", "stats"},
+}
+
+def iter_quicksort(arr, pivot_method="last", keyframe_interval=None, partition_method="lomuto", depth_limit="auto",
+                   seed=None, include_stats=False):
     """
     QuickSort algorithm implementation with different pivot selection strategies.
+    Sorts arr in place, yielding steps lazily as they are produced.
     Args:
         arr: The array to sort
-        pivot_method: The pivot selection method. Options:
+        pivot_method: The pivot selection method (see algorithms.pivots). Options:
             - "last": Last element as pivot (default)
             - "first": First element as pivot
             - "middle": Middle element as pivot
-            - "random": Random element as pivot
+            - "random": Random element as pivot, drawn from random.Random(seed)
             - "median": Median of first, middle, last elements
-    Returns:
-        steps: A list of steps for visualization
-    """
-    steps = []
-    # Helper to choose pivot index based on method
-    def choose_pivot(arr, low, high, method):
-        if method == "first":
-            return low
-        elif method == "middle":
-            return (low + high) 
-        elif method == "random":
-            return random.randint(low, high)
-        elif method == "median":
-            mid = (low + high) 
-            if arr[low] > arr[mid]:
-                if arr[mid] > arr[high]:
-                    return mid
-                elif arr[low] > arr[high]:
-                    return high
-                else:
-                    return low
-            else:
-                if arr[low] > arr[high]:
-                    return low
-                elif arr[mid] > arr[high]:
-                    return high
-                else:
-                    return mid
-        else:
-            return high
-    # Partition the array and record steps for visualization
-    def partition(arr, low, high, pivot_idx):
-        pivot = arr[pivot_idx]
-        arr[pivot_idx], arr[high] = arr[high], arr[pivot_idx]
-        steps.append({
-            "type": "pivot",
-            "pivot": pivot_idx,
-            "range": [low, high],
-            "array": arr.copy()
-        })
+            - "ninther": Tukey's median of three medians-of-three on long ranges
+        keyframe_interval: Number of steps between full array snapshots
+            (defaults to the array length, minimum 256)
+        partition_method: The partition scheme. Options:
+            - "lomuto": Lomuto partition around the last element (default);
+              steps "pivot", "pointers", "compare", "swap", "sorted"
+            - "three_way": Dutch national flag partition into < pivot, == pivot, > pivot,
+              which keeps runs of duplicates out of the recursion; steps "three_way_pivot",
+              "three_way_compare", "three_way_swap", and "sorted" for the equal block
+            - "hoare": Hoare partition with two pointers moving inwards; steps "hoare_pivot",
+              "hoare_scan", "hoare_swap", "split"
+        depth_limit: Introsort recursion depth cap. Ranges deeper than this are finished with
+            the heapsort of iter_heapsort (a "heapsort" step, then "heapify", "compare",
+            "swap" and "sorted" over the range). "auto" uses 2 * floor(log2(n)); None
+            disables the cap.
+        seed: Seed for the "random" pivot method
+        include_stats: Append a final "stats" step with the operation counts, the deepest
+            partition level, and the mean partition balance (smaller side / larger side,
+            1.0 for perfect halves)
+    Yields:
+        Delta-encoded steps for visualization. Steps that change
+            the array carry "writes" as a flat [index, value, ...] list; every
+            keyframe_interval-th step also carries the full "array".
+            Use algorithms.trace.decode_array_steps to expand them.
+            Partition steps leave out fields the client can rebuild: only the pivot,
+            "split" and "heapsort" steps carry "range". A Lomuto "compare" is [j, high]
+            with "i_pointer", and a Lomuto "swap" is [i, j] with "pivot" at high, or
+            [i + 1, high] with "pivot" at i + 1 when it places the pivot.
+    """
+    if partition_method not in PARTITION_METHODS:
+        raise ValueError(f"Unknown partition method: {partition_method}")
+    choose_pivot = get_pivot_strategy(pivot_method)
+    rng = random.Random(seed)
+    a = InstrumentedArray(arr, keyframe_interval)
+    stats = {"maxDepth": 0, "partitions": 0, "balance": 0.0, "heapsortRanges": 0}
+    if depth_limit == "auto":
+        depth_limit = 2 * max(len(a), 1).bit_length() - 2
+    # Each partition scheme yields its steps and returns the bounds (left_high, right_low)
+    # of the two subranges that still need sorting
+    # Lomuto partition: the pivot ends up in its final position between the subranges
+    def partition(low, high, pivot_idx):
+        if pivot_idx != high:
+            a.swap(pivot_idx, high)
+        yield a.step("pivot", pivot=pivot_idx, range=[low, high])
         i = low - 1
-        steps.append({
-            "type": "pointers",
-            "i_pointer": i,
-            "j_pointer": low,
-            "range": [low, high],
-            "array": arr.copy()
-        })
+        yield a.step("pointers", i_pointer=i, j_pointer=low)
         for j in range(low, high):
-            steps.append({
-                "type": "compare",
-                "comparing": [j, high],
-                "i_pointer": i,
-                "j_pointer": j,
-                "range": [low, high],
-                "array": arr.copy()
-            })
-            if arr[j] <= pivot:
+            order = a.compare(j, high)
+            yield a.step("compare", comparing=[j, high], i_pointer=i)
+            if order <= 0:
                 i += 1
-                arr[i], arr[j] = arr[j], arr[i]
                 if i != j:
-                    steps.append({
-                        "type": "swap",
-                        "swapping": [i, j],
-                        "i_pointer": i,
-                        "j_pointer": j,
-                        "range": [low, high],
-                        "array": arr.copy()
-                    })
-        arr[i + 1], arr[high] = arr[high], arr[i + 1]
-        steps.append({
-            "type": "swap",
-            "swapping": [i + 1, high],
-            "i_pointer": i,
-            "j_pointer": high,
-            "range": [low, high],
-            "array": arr.copy()
-        })
-        steps.append({
-            "type": "sorted",
-            "sorted": [i + 1],
-            "range": [low, high],
-            "array": arr.copy()
-        })
-        return i + 1
-    # Recursive quicksort with step recording
-    def quicksort_recursive(arr, low, high):
-        if low < high:
-            steps.append({
-                "type": "range",
-                "range": [low, high],
-                "array": arr.copy()
-            })
-            pivot_idx = choose_pivot(arr, low, high, pivot_method)
-            pi = partition(arr, low, high, pivot_idx)
-            quicksort_recursive(arr, low, pi - 1)
-            quicksort_recursive(arr, pi + 1, high)
-    quicksort_recursive(arr, 0, len(arr) - 1)
-    steps.append({
-        "type": "sorted",
-        "sorted": list(range(len(arr))),
-        "array": arr.copy()
-    })
-    return steps
\ No newline at end of file
+                    a.swap(i, j)
+                    yield a.step("swap", swapping=[i, j], pivot=high)
+        if i + 1 != high:
+            a.swap(i + 1, high)
+        # The final swap moves the pivot into place, so its "pivot" is the first swapped index
+        yield a.step("swap", swapping=[i + 1, high], pivot=i + 1)
+        yield a.step("sorted", sorted=[i + 1])
+        return i, i + 2
+    # Three-way (Dutch national flag) partition: arr[low:lt] < pivot, arr[lt:gt + 1] == pivot,
+    # arr[gt + 1:high + 1] > pivot, so the whole block of pivot duplicates is placed at once
+    def partition_three_way(low, high, pivot_idx):
+        pivot = a[pivot_idx]
+        yield a.step("three_way_pivot", pivot=pivot_idx, pivotValue=pivot, range=[low, high])
+        lt, i, gt = low, low, high
+        while i <= gt:
+            outcome = a.compare_value(i, pivot)
+            yield a.step(
+                "three_way_compare", comparing=[i], outcome=outcome, pivotValue=pivot, lt_pointer=lt, gt_pointer=gt
+            )
+            if outcome < 0:
+                if lt != i:
+                    a.swap(lt, i)
+                    yield a.step("three_way_swap", swapping=[lt, i], lt_pointer=lt, i_pointer=i, gt_pointer=gt)
+                lt += 1
+                i += 1
+            elif outcome > 0:
+                if i != gt:
+                    a.swap(i, gt)
+                    yield a.step("three_way_swap", swapping=[i, gt], lt_pointer=lt, i_pointer=i, gt_pointer=gt)
+                gt -= 1
+            else:
+                i += 1
+        yield a.step("sorted", sorted=list(range(lt, gt + 1)))
+        return lt - 1, gt + 1
+    # Hoare partition: the pivot is moved to the front, then i and j scan inwards and swap
+    # out-of-place pairs; arr[low:j + 1] <= pivot <= arr[j + 1:high + 1] afterwards
+    def partition_hoare(low, high, pivot_idx):
+        pivot = a[pivot_idx]
+        if pivot_idx != low:
+            a.swap(pivot_idx, low)
+        yield a.step("hoare_pivot", pivot=low, pivotValue=pivot, range=[low, high])
+        i, j = low - 1, high + 1
+        while True:
+            i += 1
+            while True:
+                order = a.compare_value(i, pivot)
+                yield a.step("hoare_scan", comparing=[i], pivotValue=pivot, i_pointer=i, j_pointer=j)
+                if order >= 0:
+                    break
+                i += 1
+            j -= 1
+            while True:
+                order = a.compare_value(j, pivot)
+                yield a.step("hoare_scan", comparing=[j], pivotValue=pivot, i_pointer=i, j_pointer=j)
+                if order <= 0:
+                    break
+                j -= 1
+            if i >= j:
+                yield a.step("split", split=j, range=[low, high])
+                return j, j + 1
+            a.swap(i, j)
+            yield a.step("hoare_swap", swapping=[i, j])
+    partitions = {"lomuto": partition, "three_way": partition_three_way, "hoare": partition_hoare}
+    # Explicit-stack quicksort: the larger subrange is pushed and the loop continues on the
+    # smaller one, so the stack holds O(log n) ranges whatever the pivots are
+    stack = [(0, len(a) - 1, 0)]
+    while stack:
+        low, high, depth = stack.pop()
+        while low < high:
+            yield a.step("range", range=[low, high])
+            stats["maxDepth"] = max(stats["maxDepth"], depth)
+            if depth_limit is not None and depth > depth_limit:
+                stats["heapsortRanges"] += 1
+                yield a.step("heapsort", depth=depth, range=[low, high])
+                yield from _heapsort_range(a, low, high)
+                break
+            pivot_idx = choose_pivot(a, low, high, rng)
+            left_high, right_low = yield from partitions[partition_method](low, high, pivot_idx)
+            sides = sorted((left_high - low + 1, high - right_low + 1))
+            stats["partitions"] += 1
+            stats["balance"] += sides[0] / sides[1] if sides[1] else 1.0
+            depth += 1
+            if left_high - low <= high - right_low:
+                stack.append((right_low, high, depth))
+                high = left_high
+            else:
+                stack.append((low, left_high, depth))
+                low = right_low
+    yield from _finish(
+        a, "quicksort", include_stats,
+        pivotMethod=pivot_method,
+        partitionMethod=partition_method,
+        maxDepth=stats["maxDepth"],
+        partitions=stats["partitions"],
+        partitionBalance=round(stats["balance"] / stats["partitions"], 3) if stats["partitions"] else 1.0,
+        heapsortRanges=stats["heapsortRanges"]
+    )
+
+def quicksort(arr, pivot_method="last", keyframe_interval=None, partition_method="lomuto", depth_limit="auto",
+              seed=None, include_stats=False):
+    """
+    QuickSort algorithm implementation with different pivot selection strategies.
+    Returns the delta-encoded steps of iter_quicksort as a list (see there for the options).
+    """
+    return list(iter_quicksort(
+        arr, pivot_method=pivot_method, keyframe_interval=keyframe_interval,
+        partition_method=partition_method, depth_limit=depth_limit, seed=seed, include_stats=include_stats
+    ))
+
+
+def _finish(a, algorithm, include_stats, **extra):
+    """Yield the final fully sorted step and, if requested, the run statistics."""
+    yield a.step("sorted", keyframe=True, sorted=list(range(len(a))))
+    if include_stats:
+        step = {"type": "stats", "algorithm": algorithm}
+        step.update(a.stats())
+        step.update(extra)
+        yield step
+
+def _merge(a, scratch, low, mid, high):
+    """
+    Merge the sorted runs a[low:mid] and a[mid:high + 1] through scratch.
+    Merged values are collected in scratch and copied back with one "write" step each;
+    the tail of the right run is already in place and is not copied.
+    """
+    yield a.step("merge", range=[low, high], mid=mid)
+    order = a.compare(mid - 1, mid)
+    yield a.step("compare", comparing=[mid - 1, mid], range=[low, high])
+    if order <= 0:
+        # The runs are already in order
+        return
+    i, j, k = low, mid, low
+    while i < mid and j <= high:
+        # The check above already compared the first pair when the left run has one element
+        if (i, j) != (mid - 1, mid) or k > low:
+            order = a.compare(i, j)
+            yield a.step("compare", comparing=[i, j], range=[low, high])
+        if order <= 0:
+            scratch[k] = a[i]
+            i += 1
+        else:
+            scratch[k] = a[j]
+            j += 1
+        k += 1
+    while i < mid:
+        scratch[k] = a[i]
+        i += 1
+        k += 1
+    for index in range(low, k):
+        a[index] = scratch[index]
+        yield a.step("write", writing=[index], range=[low, high])
+
+def iter_merge_sort(arr, keyframe_interval=None, include_stats=False):
+    """
+    Bottom-up merge sort: runs of width 1, 2, 4, ... are merged pairwise through one
+    scratch buffer allocated up front. Sorts arr in place, yielding steps lazily.
+    Args:
+        arr: The array to sort
+        keyframe_interval: Number of steps between full array snapshots
+        include_stats: Append a final "stats" step with the operation counts
+    Yields:
+        Delta-encoded steps: "pass", "merge", "compare", "write", "sorted"
+    """
+    a = InstrumentedArray(arr, keyframe_interval)
+    n = len(a)
+    scratch = [None] * n
+    width = 1
+    passes = 0
+    while width < n:
+        yield a.step("pass", width=width)
+        for low in range(0, n - width, 2 * width):
+            yield from _merge(a, scratch, low, low + width, min(low + 2 * width, n) - 1)
+        width *= 2
+        passes += 1
+    yield from _finish(a, "merge_sort", include_stats, passes=passes)
+
+def _sift_down(a, root, end, low=0):
+    """Sift a[root] down the max-heap a[low:end + 1], whose root is at low."""
+    while True:
+        child = low + 2 * (root - low) + 1
+        if child > end:
+            return
+        if child + 1 <= end:
+            order = a.compare(child, child + 1)
+            yield a.step("compare", comparing=[child, child + 1], range=[low, end])
+            if order < 0:
+                child += 1
+        order = a.compare(root, child)
+        yield a.step("compare", comparing=[root, child], range=[low, end])
+        if order >= 0:
+            return
+        a.swap(root, child)
+        yield a.step("swap", swapping=[root, child], range=[low, end])
+        root = child
+
+def _heapsort_range(a, low, high):
+    """Heapsort a[low:high + 1] in place (used by iter_heapsort and the introsort fallback)."""
+    yield a.step("heapify", range=[low, high])
+    for root in range(low + (high - low - 1) // 2, low - 1, -1):
+        yield from _sift_down(a, root, high, low)
+    for end in range(high, low, -1):
+        a.swap(low, end)
+        yield a.step("swap", swapping=[low, end], range=[low, end])
+        yield a.step("sorted", sorted=[end])
+        yield from _sift_down(a, low, end - 1, low)
+
+def iter_heapsort(arr, keyframe_interval=None, include_stats=False):
+    """
+    Heapsort: builds a max-heap bottom-up, then repeatedly swaps the maximum to the end.
+    Sorts arr in place, yielding steps lazily.
+    Args:
+        arr: The array to sort
+        keyframe_interval: Number of steps between full array snapshots
+        include_stats: Append a final "stats" step with the operation counts
+    Yields:
+        Delta-encoded steps: "heapify", "compare", "swap", "sorted"
+    """
+    a = InstrumentedArray(arr, keyframe_interval)
+    if len(a) > 1:
+        yield from _heapsort_range(a, 0, len(a) - 1)
+    yield from _finish(a, "heapsort", include_stats)
+
+# Runs shorter than this are not worth detecting; shorter inputs are one binary insertion sort
+MIN_MERGE = 32
+
+def _min_run(n):
+    """Minimum run length, chosen so n / min_run is a power of two or just below one."""
+    extra = 0
+    while n >= MIN_MERGE:
+        extra |= n & 1
+        n >>= 1
+    return n + extra
+
+def _binary_insertion(a, low, start, end):
+    """Extend the sorted run a[low:start] to a[low:end] by binary insertion."""
+    for i in range(start, end):
+        left, right = low, i
+        while left < right:
+            mid = (left + right) // 2
+            order = a.compare(i, mid)
+            yield a.step("compare", comparing=[mid, i], range=[low, end - 1])
+            # Equal values go after the ones already in the run, which keeps the sort stable
+            if order < 0:
+                right = mid
+            else:
+                left = mid + 1
+        if left < i:
+            value = a[i]
+            for k in range(i, left, -1):
+                a[k] = a[k - 1]
+            a[left] = value
+            yield a.step("insert", inserting=[left], source=i, range=[low, end - 1])
+
+def iter_timsort(arr, keyframe_interval=None, include_stats=False):
+    """
+    Timsort-style merge sort over natural runs.
+    Ascending and strictly descending runs are detected and descending ones reversed;
+    runs shorter than the minimum run length are extended by binary insertion. Runs are
+    kept on a stack and merged while its lengths break Timsort's invariants, so merges
+    stay balanced. Galloping is not implemented.
+    Args:
+        arr: The array to sort
+        keyframe_interval: Number of steps between full array snapshots
+        include_stats: Append a final "stats" step with the operation counts and run count
+    Yields:
+        Delta-encoded steps: "run", "compare", "swap", "insert", "merge", "write", "sorted"
+    """
+    a = InstrumentedArray(arr, keyframe_interval)
+    n = len(a)
+    scratch = [None] * n
+    min_run = _min_run(n)
+    runs = []
+    run_count = 0
+
+    def merge_at(k):
+        start, length = runs[k]
+        runs[k] = (start, length + runs[k + 1][1])
+        del runs[k + 1]
+        yield from _merge(a, scratch, start, start + length, runs[k][0] + runs[k][1] - 1)
+
+    low = 0
+    while low < n:
+        # Find the natural run starting at low
+        high = low + 1
+        descending = False
+        if high < n:
+            descending = a.compare(low, high) > 0
+            yield a.step("compare", comparing=[low, high], range=[low, n - 1])
+            high += 1
+            while high < n:
+                order = a.compare(high - 1, high)
+                yield a.step("compare", comparing=[high - 1, high], range=[low, n - 1])
+                if (order > 0) != descending or (descending and order == 0):
+                    break
+                high += 1
+        yield a.step("run", range=[low, high - 1], descending=descending)
+        if descending:
+            i, j = low, high - 1
+            while i < j:
+                a.swap(i, j)
+                yield a.step("swap", swapping=[i, j], range=[low, high - 1])
+                i += 1
+                j -= 1
+        end = min(low + min_run, n)
+        if high < end:
+            yield from _binary_insertion(a, low, high, end)
+            high = end
+        runs.append((low, high - low))
+        run_count += 1
+        # Merge until the run lengths satisfy A > B + C and B > C (top three runs A, B, C)
+        while len(runs) > 1:
+            k = len(runs) - 2
+            if (k > 0 and runs[k - 1][1] <= runs[k][1] + runs[k + 1][1]) or \
+                    (k > 1 and runs[k - 2][1] <= runs[k - 1][1] + runs[k][1]):
+                if runs[k - 1][1] < runs[k + 1][1]:
+                    k -= 1
+            elif runs[k][1] > runs[k + 1][1]:
+                break
+            yield from merge_at(k)
+        low = high
+    while len(runs) > 1:
+        k = len(runs) - 2
+        if k > 0 and runs[k - 1][1] < runs[k + 1][1]:
+            k -= 1
+        yield from merge_at(k)
+    yield from _finish(a, "timsort", include_stats, runs=run_count, minRun=min_run)
+
+def iter_radix_sort(arr, keyframe_interval=None, include_stats=False, base=10):
+    """
+    LSD radix sort of non-negative integers: one stable counting sort per digit, from the
+    least significant digit up. Sorts arr in place, yielding steps lazily.
+    Args:
+        arr: The array to sort (non-negative integers)
+        keyframe_interval: Number of steps between full array snapshots
+        include_stats: Append a final "stats" step with the operation counts and digit passes
+        base: The radix (default 10, which matches the digits shown in the visualization)
+    Yields:
+        Delta-encoded steps: "digit", "read" (with the value's "bucket"), "write", "sorted"
+    Raises:
+        ValueError: If arr holds negative or non-integer values, or base is below 2
+    """
+    if base < 2:
+        raise ValueError("Radix sort requires a base of at least 2")
+    if any(not isinstance(value, int) or value < 0 for value in arr):
+        raise ValueError("Radix sort requires non-negative integers")
+    a = InstrumentedArray(arr, keyframe_interval)
+    n = len(a)
+    scratch = [None] * n
+    digits = [0] * n
+    maximum = max(a[i] for i in range(n)) if n else 0
+    place = 1
+    passes = 0
+    while n > 1 and maximum // place > 0:
+        yield a.step("digit", digit=passes, place=place, base=base)
+        counts = [0] * base
+        for i in range(n):
+            digit = a[i] // place % base
+            digits[i] = digit
+            counts[digit] += 1
+            yield a.step("read", reading=[i], bucket=digit)
+        # Starting position of each bucket, then a stable pass into scratch
+        total = 0
+        for digit in range(base):
+            counts[digit], total = total, total + counts[digit]
+        for i in range(n):
+            digit = digits[i]
+            scratch[counts[digit]] = (a[i], digit)
+            counts[digit] += 1
+        for k in range(n):
+            value, digit = scratch[k]
+            a[k] = value
+            yield a.step("write", writing=[k], bucket=digit)
+        place *= base
+        passes += 1
+    yield from _finish(a, "radix_sort", include_stats, passes=passes, base=base)
+
+# Ciura's gap sequence, extended by a factor of 2.25 for longer arrays
+CIURA_GAPS = [1, 4, 10, 23, 57, 132, 301, 701]
+
+def shell_gaps(n):
+    """Gaps used by shell sort for an array of length n, largest first."""
+    gaps = list(CIURA_GAPS)
+    while gaps[-1] < n:
+        gaps.append(int(gaps[-1] * 2.25))
+    return [gap for gap in reversed(gaps) if gap < n]
+
+def iter_shell_sort(arr, keyframe_interval=None, include_stats=False):
+    """
+    Shell sort: gapped insertion sorts over Ciura's gap sequence, finishing with gap 1.
+    Elements move by swaps, so every intermediate state is visible in the array.
+    Sorts arr in place, yielding steps lazily.
+    Args:
+        arr: The array to sort
+        keyframe_interval: Number of steps between full array snapshots
+        include_stats: Append a final "stats" step with the operation counts and gaps
+    Yields:
+        Delta-encoded steps: "gap", "compare", "swap", "sorted"
+    """
+    a = InstrumentedArray(arr, keyframe_interval)
+    n = len(a)
+    gaps = shell_gaps(n)
+    for gap in gaps:
+        yield a.step("gap", gap=gap)
+        for i in range(gap, n):
+            j = i
+            while j >= gap:
+                order = a.compare(j - gap, j)
+                yield a.step("compare", comparing=[j - gap, j], gap=gap)
+                if order <= 0:
+                    break
+                a.swap(j - gap, j)
+                yield a.step("swap", swapping=[j - gap, j], gap=gap)
+                j -= gap
+    yield from _finish(a, "shell_sort", include_stats, gaps=gaps)
+
+# Step generators by algorithm name; each takes (arr, keyframe_interval=None, include_stats=False)
+SORTING_ALGORITHMS = {
+    "quicksort": iter_quicksort,
+    "merge_sort": iter_merge_sort,
+    "heapsort": iter_heapsort,
+    "timsort": iter_timsort,
+    "radix_sort": iter_radix_sort,
+    "shell_sort": iter_shell_sort,
+}
+
+def merge_sort(arr, keyframe_interval=None, include_stats=False):
+    """Bottom-up merge sort; returns the steps of iter_merge_sort as a list."""
+    return list(iter_merge_sort(arr, keyframe_interval=keyframe_interval, include_stats=include_stats))
+
+def heapsort(arr, keyframe_interval=None, include_stats=False):
+    """Heapsort; returns the steps of iter_heapsort as a list."""
+    return list(iter_heapsort(arr, keyframe_interval=keyframe_interval, include_stats=include_stats))
+
+def timsort(arr, keyframe_interval=None, include_stats=False):
+    """Timsort-style natural merge sort; returns the steps of iter_timsort as a list."""
+    return list(iter_timsort(arr, keyframe_interval=keyframe_interval, include_stats=include_stats))
+
+def radix_sort(arr, keyframe_interval=None, include_stats=False, base=10):
+    """LSD radix sort; returns the steps of iter_radix_sort as a list."""
+    return list(iter_radix_sort(arr, keyframe_interval=keyframe_interval, include_stats=include_stats, base=base))
+
+def shell_sort(arr, keyframe_interval=None, include_stats=False):
+    """Shell sort; returns the steps of iter_shell_sort as a list."""
+    return list(iter_shell_sort(arr, keyframe_interval=keyframe_interval, include_stats=include_stats))
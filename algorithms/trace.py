@@ -0,0 +1,382 @@
+# Compact trace helpers for array-based (sorting) algorithms
+# Steps store only the [index, value] pairs they write; keyframe steps also carry a full snapshot
+
+def default_keyframe_interval(size):
+    """
+    Keyframe spacing used when the caller does not pick one.
+    Spacing keyframes by the array length keeps snapshot cost at O(1) amortized per step;
+    small arrays still replay at most 256 steps of writes to seek.
+    """
+    return max(256, size)
+
+def apply_writes(arr, step):
+    """
+    Apply a delta-encoded step to arr in place and return arr.
+    A keyframe step replaces the contents with its snapshot.
+    """
+    if "array" in step:
+        arr[:] = step["array"]
+    else:
+        writes = step.get("writes")
+        if writes:
+            for k in range(0, len(writes), 2):
+                arr[writes[k]] = writes[k + 1]
+    return arr
+
+def decode_array_steps(initial, steps):
+    """
+    Expand a delta-encoded trace back into the full format.
+    Args:
+        initial: The array the algorithm started from
+        steps: Delta-encoded steps as returned by the sorting algorithms
+    Yields:
+        A copy of each step with "array" holding the array state after that step
+    """
+    current = list(initial)
+    for step in steps:
+        apply_writes(current, step)
+        full = {key: value for key, value in step.items() if key != "writes"}
+        full["array"] = current.copy()
+        yield full
+
+def array_at(initial, steps, index):
+    """
+    Rebuild the array state after steps[index], starting from the nearest keyframe.
+    """
+    start = index
+    while start >= 0 and "array" not in steps[start]:
+        start -= 1
+    current = list(steps[start]["array"]) if start >= 0 else list(initial)
+    for k in range(start + 1, index + 1):
+        apply_writes(current, steps[k])
+    return current
+
+def chunk_steps(steps, first_size, chunk_size):
+    """
+    Group a step iterable (list or generator) into lists for chunked delivery.
+    The first chunk is kept small so playback can start early; later chunks use chunk_size.
+    """
+    chunk = []
+    limit = first_size
+    for step in steps:
+        chunk.append(step)
+        if len(chunk) >= limit:
+            yield chunk
+            chunk = []
+            limit = chunk_size
+    if chunk:
+        yield chunk
+
+
+# Level of detail
+# The algorithm still runs step by step; the samplers below only choose which steps are
+# sent. A step is kept when its index is a multiple of `every`, its type is in keep_types,
+# or it falls inside the full-detail window, and the last step is always kept. Kept steps
+# carry "traceIndex", their position in the full trace, so a window can be requested later.
+
+def _should_keep(index, step, every, keep_types, window):
+    if window is not None and window[0] <= index <= window[1]:
+        return True
+    if keep_types is not None and step["type"] in keep_types:
+        return True
+    return bool(every) and index % every == 0
+
+def _with_last(steps):
+    """Yield (index, step, is_last) for a step iterable, looking one step ahead."""
+    iterator = iter(steps)
+    try:
+        previous = next(iterator)
+    except StopIteration:
+        return
+    index = 0
+    for step in iterator:
+        yield index, previous, False
+        previous = step
+        index += 1
+    yield index, previous, True
+
+def sample_array_steps(initial, steps, every=None, keep_types=None, window=None, keyframe_interval=None):
+    """
+    Level-of-detail sampling of a delta-encoded sorting trace.
+    The writes of skipped steps are merged into the next kept step (the last value written
+    to an index wins), so applying the kept steps in order still rebuilds every array state
+    they show. Every keyframe_interval-th kept step carries a full snapshot.
+    Args:
+        initial: The array the algorithm started from
+        steps: Delta-encoded steps (list or generator)
+        every: Keep every k-th step
+        keep_types: Step types to keep, e.g. algorithms.sorting.STRUCTURAL_STEPS[name]
+        window: Inclusive (first, last) range of trace indices to keep in full detail
+        keyframe_interval: Kept steps between snapshots (default: the array length, minimum 256)
+    Yields:
+        The kept steps, with "writes" rewritten and "traceIndex" added
+    """
+    if keyframe_interval is None:
+        keyframe_interval = default_keyframe_interval(len(initial))
+    current = list(initial)
+    pending = {}
+    kept = 0
+    for index, step, is_last in _with_last(steps):
+        writes = step.get("writes")
+        if writes:
+            for k in range(0, len(writes), 2):
+                current[writes[k]] = writes[k + 1]
+                pending[writes[k]] = writes[k + 1]
+        if "array" in step and step["array"] != current:
+            for position, value in enumerate(step["array"]):
+                if current[position] != value:
+                    current[position] = value
+                    pending[position] = value
+        if not (is_last or _should_keep(index, step, every, keep_types, window)):
+            continue
+        sampled = {key: value for key, value in step.items() if key not in ("writes", "array")}
+        sampled["traceIndex"] = index
+        if pending:
+            sampled["writes"] = [v for position, value in pending.items() for v in (position, value)]
+            pending = {}
+        if kept % keyframe_interval == 0 or "array" in step:
+            sampled["array"] = current.copy()
+        kept += 1
+        yield sampled
+
+def _graph_effects(step):
+    """The lasting visual effects of a graph step: (visited nodes, completed nodes, highlighted edges)."""
+    step_type = step["type"]
+    if step_type == "visit":
+        return (step["node"],), (), ()
+    if step_type == "complete":
+        return (), (step["node"],), ()
+    if step_type in ("explore", "backtrack") or (step_type == "relax" and step["success"]):
+        return (), (), ((step["from"], step["to"]),)
+    if step_type == "level" and isinstance(step.get("frontier"), list):
+        # Level-synchronous BFS discovers a whole level and its tree edges in one step
+        edges = [(parent, node) for parent, node in zip(step["parents"], step["frontier"]) if parent is not None]
+        return step["frontier"], (), edges
+    return (), (), ()
+
+def sample_graph_steps(steps, every=None, keep_types=None, window=None, keyframe_interval=256):
+    """
+    Level-of-detail sampling of a graph trace.
+    The effects of skipped steps (visited and completed nodes, highlighted edges) are
+    folded into the next kept step as "folded": {"visited", "completed", "edges"}. Every
+    keyframe_interval-th kept step instead folds the whole state so far and sets
+    "keyframe": true, so playback can restart from it instead of from the first step.
+    Args:
+        steps: Graph steps (list or generator)
+        every, keep_types, window: As for sample_array_steps; keep_types usually comes
+            from algorithms.graph_algorithms.STRUCTURAL_STEPS
+        keyframe_interval: Kept steps between keyframes
+    Yields:
+        The kept steps, with "traceIndex" added
+    """
+    # Insertion-ordered dicts act as ordered sets; the state holds everything applied so far
+    state = ({}, {}, {})
+    pending = ({}, {}, {})
+    kept = 0
+    for index, step, is_last in _with_last(steps):
+        keep = is_last or _should_keep(index, step, every, keep_types, window)
+        if keep and kept % keyframe_interval == 0 and kept:
+            folded = state
+        else:
+            folded = pending
+        for effects, applied, waiting in zip(_graph_effects(step), state, pending):
+            for effect in effects:
+                applied[effect] = None
+                if not keep:
+                    waiting[effect] = None
+        if not keep:
+            continue
+        sampled = dict(step, traceIndex=index)
+        if folded is state:
+            sampled["keyframe"] = True
+        if any(folded):
+            sampled["folded"] = {
+                "visited": list(folded[0]),
+                "completed": list(folded[1]),
+                "edges": [list(edge) for edge in folded[2]],
+            }
+        pending = ({}, {}, {})
+        kept += 1
+        yield sampled
+
+# Columnar (binary) trace encoding
+# Steps are grouped into one table per step type. Each field of a table is a typed column
+# in a single buffer: integers as the narrowest of int8/int16/int32 that holds them, other
+# numbers as float64, booleans as uint8. Missing values use the smallest integer (or NaN).
+# List fields are int32 offsets plus values (values alone when every step of the type
+# has the same length). Fields that are not numeric are kept per step in "extras".
+COLUMN_ALIGNMENT = 8
+BOOL_MISSING = 255
+# Integer dtypes by width; the smallest value of each marks a missing field
+INT_DTYPES = {"int8": -2 ** 7, "int16": -2 ** 15, "int32": -2 ** 31}
+
+class _TypeTable:
+    """Columns collected for the steps of one type while encoding."""
+    def __init__(self, code, name):
+        self.code = code
+        self.name = name
+        self.rows = 0
+        # field -> (rows, values) for scalars, (rows, lengths, flat values) for lists
+        self.scalars = {}
+        self.lists = {}
+        self.widths = {}
+
+def _column_dtype(values):
+    """Smallest column dtype of the format ("bool", "int8", "int16", "int32" or "float64") holding values exactly."""
+    if all(isinstance(v, bool) for v in values):
+        return "bool"
+    if values and all(isinstance(v, int) for v in values):
+        low, high = min(values), max(values)
+        for dtype, missing in INT_DTYPES.items():
+            if missing < low and high < -missing:
+                return dtype
+    elif not values:
+        return "int8"
+    return "float64"
+
+_NUMPY_DTYPES = {"bool": "uint8", "int8": "int8", "int16": "int16", "int32": "int32", "float64": "float64"}
+
+def encode_columnar(steps):
+    """
+    Encode steps into the columnar trace format, consuming them one at a time.
+    Args:
+        steps: A list or generator of algorithm steps
+    Returns:
+        (header, buffer): a JSON-serializable description of the columns, and the bytes
+        holding them. Every column starts at a multiple of COLUMN_ALIGNMENT, so the browser
+        can view it in place as a typed array (see decodeColumnarTrace in static/js/main.js).
+    """
+    import numpy as np
+    tables = {}
+    type_codes = bytearray()
+    extras = {}
+    count = 0
+    for step in steps:
+        table = tables.get(step["type"])
+        if table is None:
+            if len(tables) == 256:
+                raise ValueError("The columnar format supports at most 256 step types")
+            table = tables[step["type"]] = _TypeTable(len(tables), step["type"])
+        row = table.rows
+        for key, value in step.items():
+            if key == "type":
+                continue
+            if isinstance(value, (bool, int, float)):
+                column = table.scalars.get(key)
+                if column is None:
+                    column = table.scalars[key] = ([], [])
+                column[0].append(row)
+                column[1].append(value)
+            elif isinstance(value, list) and (not value or isinstance(value[0], (int, float, list, tuple))):
+                column = table.lists.get(key)
+                if column is None:
+                    column = table.lists[key] = ([], [], [])
+                if value and not isinstance(value[0], (int, float)):
+                    # Lists of pairs (e.g. path edges) are flattened and regrouped on decode
+                    table.widths[key] = len(value[0])
+                    value = [item for group in value for item in group]
+                column[0].append(row)
+                column[1].append(len(value))
+                column[2].extend(value)
+            else:
+                extras.setdefault(count, {})[key] = value
+        type_codes.append(table.code)
+        table.rows += 1
+        count += 1
+
+    buffer = bytearray()
+    def append(values):
+        buffer.extend(bytes(-len(buffer) % COLUMN_ALIGNMENT))
+        offset = len(buffer)
+        buffer.extend(values.tobytes())
+        return offset
+    def typed(values, dtype):
+        return np.asarray(values, dtype=_NUMPY_DTYPES[dtype])
+    def missing(dtype):
+        return BOOL_MISSING if dtype == "bool" else INT_DTYPES.get(dtype, np.nan)
+
+    header = {
+        "count": count,
+        "typeCodes": append(np.frombuffer(bytes(type_codes), dtype=np.uint8)),
+        "types": [],
+        "extras": {str(index): fields for index, fields in extras.items()}
+    }
+    for table in tables.values():
+        columns = []
+        for name, (rows, values) in table.scalars.items():
+            dtype = _column_dtype(values)
+            column = np.full(table.rows, missing(dtype), dtype=_NUMPY_DTYPES[dtype])
+            column[rows] = typed(values, dtype)
+            columns.append({"name": name, "kind": "scalar", "dtype": dtype, "offset": append(column)})
+        for name, (rows, lengths, values) in table.lists.items():
+            dtype = _column_dtype(values)
+            entry = {"name": name, "kind": "list", "dtype": dtype, "width": table.widths.get(name, 1)}
+            if len(rows) == table.rows and len(set(lengths)) == 1:
+                entry["size"] = lengths[0]
+            else:
+                row_lengths = np.zeros(table.rows, dtype=np.int64)
+                row_lengths[rows] = lengths
+                offsets = np.zeros(table.rows + 1, dtype=np.int32)
+                np.cumsum(row_lengths, out=offsets[1:])
+                entry["offsets"] = append(offsets)
+                # Rows holding an empty list, as opposed to rows without the field
+                present = np.zeros(table.rows, dtype=bool)
+                present[rows] = True
+                entry["empty"] = np.flatnonzero(present & (row_lengths == 0)).tolist()
+            entry["offset"] = append(typed(values, dtype))
+            entry["length"] = len(values)
+            columns.append(entry)
+        header["types"].append({"name": table.name, "rows": table.rows, "columns": columns})
+    return header, bytes(buffer)
+
+def decode_columnar(header, buffer):
+    """
+    Decode a trace produced by encode_columnar back into step dicts.
+    Yields:
+        The steps in their original order
+    """
+    import numpy as np
+    count = header["count"]
+    type_codes = np.frombuffer(buffer, dtype=np.uint8, count=count, offset=header["typeCodes"])
+    types = []
+    for table in header["types"]:
+        columns = []
+        for column in table["columns"]:
+            dtype = _NUMPY_DTYPES[column["dtype"]]
+            length = table["rows"] if column["kind"] == "scalar" else column["length"]
+            values = np.frombuffer(buffer, dtype=dtype, count=length, offset=column["offset"]).tolist()
+            offsets = None
+            if "offsets" in column:
+                offsets = np.frombuffer(buffer, dtype=np.int32, count=table["rows"] + 1, offset=column["offsets"]).tolist()
+            columns.append((column, values, offsets, set(column.get("empty", ()))))
+        types.append((table["name"], columns))
+    next_row = [0] * len(types)
+    extras = header["extras"]
+    for index, code in enumerate(type_codes.tolist()):
+        name, columns = types[code]
+        row = next_row[code]
+        next_row[code] += 1
+        step = {"type": name}
+        for column, values, offsets, empty in columns:
+            dtype = column["dtype"]
+            if column["kind"] == "scalar":
+                value = values[row]
+                if value == INT_DTYPES.get(dtype) or dtype == "bool" and value == BOOL_MISSING or value != value:
+                    continue
+                step[column["name"]] = bool(value) if dtype == "bool" else value
+                continue
+            if offsets is None:
+                start = row * column["size"]
+                end = start + column["size"]
+            else:
+                start, end = offsets[row], offsets[row + 1]
+                if start == end and row not in empty:
+                    continue
+            items = values[start:end]
+            width = column["width"]
+            if width > 1:
+                items = [items[k:k + width] for k in range(0, len(items), width)]
+            step[column["name"]] = items
+        if str(index) in extras:
+            step.update(extras[str(index)])
+        yield step
@@ -1,12 +1,75 @@
 import streamlit as st
 import streamlit.components.v1 as components
 import json
-import os
-from algorithms.graph_algorithms import dfs, bfs, dijkstra
-from algorithms.sorting import quicksort
+import base64
+from algorithms.graph_algorithms import (
+    STRUCTURAL_STEPS as GRAPH_STRUCTURAL_STEPS, iter_dfs, iter_bfs, iter_dijkstra,
+    iter_bidirectional_bfs, iter_bidirectional_dijkstra, iter_astar
+)
+from algorithms.compiled_graph import compile_graph
+from algorithms.sorting import SORTING_ALGORITHMS, STRUCTURAL_STEPS as SORTING_STRUCTURAL_STEPS, iter_quicksort
+from algorithms.pivots import PIVOT_METHODS
+from algorithms.trace import chunk_steps, encode_columnar, sample_array_steps, sample_graph_steps
+from algorithms.cache import TRACE_CACHE, fingerprint
+from assets import VendorAssetError, get_bundle
 
-# Get the absolute path to the static files
-STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+# Steps embedded inline so playback can start; the rest ships in lazily parsed chunks
+FIRST_CHUNK_STEPS = 200
+STEP_CHUNK_SIZE = 5000
+
+def build_step_chunks(steps):
+    """
+    Serialize steps for chunked delivery to the browser.
+    Args:
+        steps: A list or generator of algorithm steps
+    Returns:
+        (first_json, chunk_tags): the first chunk as a JSON literal, and the remaining
+        chunks as <script type="application/json" class="step-chunk"> tags that
+        window.createStepStream parses in the background after playback starts
+    """
+    chunks = chunk_steps(steps, FIRST_CHUNK_STEPS, STEP_CHUNK_SIZE)
+    first_json = _script_safe_json(next(chunks, []))
+    chunk_tags = "".join(
+        f'<script type="application/json" class="step-chunk">{_script_safe_json(chunk)}</script>'
+        for chunk in chunks
+    )
+    return first_json, chunk_tags
+
+def build_columnar_trace(steps):
+    """
+    Serialize steps in the binary columnar format (algorithms.trace.encode_columnar).
+    Returns:
+        (first_json, trace_tag) in the shape of build_step_chunks: an empty first chunk, and a
+        <script type="application/json" class="step-columns"> tag holding the column header
+        and the base64 buffer, which window.decodeColumnarTrace reads as typed-array views
+    """
+    header, buffer = encode_columnar(steps)
+    header["data"] = base64.b64encode(buffer).decode("ascii")
+    return "[]", f'<script type="application/json" class="step-columns">{_script_safe_json(header)}</script>'
+
+def sample_steps(steps, params, structural_steps, initial=None):
+    """
+    Apply the level-of-detail parameters ("every", "structural", "window") to a step iterable.
+    Sorting traces (initial given) merge the writes of skipped steps; graph traces fold their effects.
+    """
+    every = params.get("every")
+    keep_types = structural_steps if params.get("structural") else None
+    window = params.get("window")
+    if not (every or keep_types):
+        return steps
+    if initial is not None:
+        return sample_array_steps(initial, steps, every=every, keep_types=keep_types, window=window)
+    return sample_graph_steps(steps, every=every, keep_types=keep_types, window=window)
+
+def build_trace(steps, trace_format="json"):
+    """Serialize steps with build_step_chunks ("json") or build_columnar_trace ("columnar")."""
+    if trace_format == "columnar":
+        return build_columnar_trace(steps)
+    return build_step_chunks(steps)
+
+def _script_safe_json(value):
+    """Compact JSON that can be embedded inside a <script> element."""
+    return json.dumps(value, separators=(",", ":")).replace("</", "<\\/")
 
 # Helper function to create parameter with tooltip
 def parameter_with_tooltip(label, tooltip, widget_func, *args, **kwargs):
@@ -116,29 +179,11 @@ def main():
         st.session_state.is_random = True
     if 'pivot_method' not in st.session_state:
         st.session_state.pivot_method = "last"
-    
-    # Add Font Awesome
-    st.markdown("""
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/js/all.min.js"></script>
-    <script>
-    function checkFontAwesome() {
-        if (typeof FontAwesome !== 'undefined' || document.querySelector('.fa, .fas, .far, .fab')) {
-            console.log('Font Awesome is loaded');
-        } else {
-            console.log('Font Awesome not loaded, attempting to load it again');
-            const linkElement = document.createElement('link');
-            linkElement.rel = 'stylesheet';
-            linkElement.href = 'https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css';
-            document.head.appendChild(linkElement);
-            const scriptElement = document.createElement('script');
-            scriptElement.src = 'https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/js/all.min.js';
-            document.head.appendChild(scriptElement);
-        }
-    }
-    setTimeout(checkFontAwesome, 1000);
-    </script>
-    """, unsafe_allow_html=True)
+    # Seeds keep generated inputs stable across reruns until the user asks for new ones
+    if 'graph_seed' not in st.session_state:
+        st.session_state.graph_seed = new_seed()
+    if 'array_seed' not in st.session_state:
+        st.session_state.array_seed = new_seed()
     
     st.title("Algorithm Visualization Tool")
     
@@ -375,6 +420,45 @@ def main():
         index=["Graph Algorithms", "Sorting Algorithms"].index(st.session_state.get('algorithm_type', "Graph Algorithms"))
     )
     st.session_state.algorithm_type = algorithm_type
+    
+    binary_trace = parameter_with_tooltip(
+        "Binary Trace Encoding",
+        "Send the steps as typed columns instead of JSON. Smaller payloads and faster loading for long traces.",
+        st.sidebar.checkbox,
+        value=False
+    )
+    trace_format = "columnar" if binary_trace else "json"
+    
+    level_of_detail = parameter_with_tooltip(
+        "Level of Detail",
+        "The algorithm always runs in full; this picks which steps are sent to the browser. "
+        "Skipped steps are merged into the next one that is shown, so the picture stays correct. "
+        "Structural steps are partitions, merges, runs, gaps and digit passes for sorting, "
+        "and finished nodes, BFS levels and settled nodes for graphs.",
+        st.sidebar.selectbox,
+        ["Full", "Every k-th Step", "Structural Steps"]
+    )
+    # Level-of-detail parameters, passed to visualize_* and part of the trace cache key
+    detail = {}
+    if level_of_detail != "Full":
+        if level_of_detail == "Every k-th Step":
+            detail["every"] = parameter_with_tooltip(
+                "Keep Every k-th Step",
+                "Only every k-th step of the full trace is shown.",
+                st.sidebar.number_input,
+                min_value=2, value=10, step=1
+            )
+        else:
+            detail["structural"] = True
+        window_start, window_end = parameter_with_tooltip(
+            "Full Detail Window",
+            "Trace steps (as numbered in the step titles) to show in full detail. "
+            "Traces for windows you already looked at come from the cache.",
+            st.sidebar.slider,
+            0, 100000, (0, 0), step=10
+        )
+        if window_end > window_start:
+            detail["window"] = [window_start, window_end]
 
     # If algorithm_type has changed, reset the specific algorithm choice to a valid default
     if old_algorithm_type != st.session_state.algorithm_type:
@@ -386,7 +470,10 @@ def main():
     # Now, st.session_state.algorithm should hold a potentially valid default for the current algorithm_type
     
     if st.session_state.algorithm_type == "Graph Algorithms":
-        valid_graph_algos = ["Depth-First Search (DFS)", "Breadth-First Search (BFS)", "Dijkstra's Algorithm"]
+        valid_graph_algos = [
+            "Depth-First Search (DFS)", "Breadth-First Search (BFS)", "Dijkstra's Algorithm",
+            "Bidirectional BFS", "Bidirectional Dijkstra", "A* Search"
+        ]
         # Ensure current algorithm is valid for graph algos, otherwise reset to default for this type
         current_graph_algo_from_state = st.session_state.get("algorithm", valid_graph_algos[0])
         if current_graph_algo_from_state not in valid_graph_algos:
@@ -417,11 +504,25 @@ def main():
         st.session_state.create_mode = create_mode
         
         if create_mode == "Automatic":
+            if 'graph_family' not in st.session_state:
+                st.session_state.graph_family = GRAPH_FAMILIES[0]
+            
+            graph_family = parameter_with_tooltip(
+                "Graph Family", 
+                "The kind of random graph to generate: uniform random edges, a grid, points linked by distance, or preferential attachment (hubs).",
+                st.sidebar.selectbox,
+                GRAPH_FAMILIES,
+                index=GRAPH_FAMILIES.index(st.session_state.graph_family)
+            )
+            
+            # Store graph family
+            st.session_state.graph_family = graph_family
+            
             nodes = parameter_with_tooltip(
                 "Number of Nodes", 
                 "The number of vertices in the graph. More nodes create a more complex graph.",
                 st.sidebar.slider,
-                5, 20, st.session_state.nodes
+                5, 200, st.session_state.nodes
             )
             
             # Store nodes value
@@ -452,8 +553,13 @@ def main():
             # Store directed graph choice
             st.session_state.is_directed = (is_directed == "Directed")
             
+            if st.sidebar.button("Regenerate Graph", help="Draw a new random graph with the same parameters."):
+                st.session_state.graph_seed = new_seed()
+            
             # Generate graph data
-            graph_data = generate_graph(nodes, edge_density, st.session_state.is_directed)
+            graph_data = generate_graph(
+                nodes, edge_density, st.session_state.is_directed, st.session_state.graph_seed, graph_family
+            )
         else:
             # For user-created graphs, start with an empty graph
             # Allow selecting graph type in manual mode as well
@@ -471,28 +577,94 @@ def main():
             # Store directed graph choice
             st.session_state.is_directed = (is_directed == "Directed")
             
-            # The actual graph creation happens in JavaScript
-            graph_data = {"nodes": [], "links": [], "directed": st.session_state.is_directed}
+            # The graph lives in session state; switching the graph type starts a new one
+            if st.session_state.get("manual_graph", {}).get("directed") != st.session_state.is_directed:
+                st.session_state.manual_graph = {"nodes": [], "links": [], "directed": st.session_state.is_directed}
+            graph_data = edit_manual_graph(st.session_state.manual_graph)
             st.sidebar.info("""
             In manual mode, you can build your own graph:
-            1. Click the 'Add Node' button, then click anywhere on the white space to create a node
-            2. Click 'Add Edge', select a source node, then select a target node, and enter the weight 
-            3. Use 'Delete' button to remove nodes or edges by clicking on them
-            4. 'Reset Graph' clears the entire graph
+            1. Click 'Add Node' under Edit Graph to add the next node
+            2. Pick a source, a target and a weight, then click 'Set Edge' to add the edge or change its weight
+            3. 'Delete Edge' removes the edge between the chosen nodes
+            4. 'Clear Graph' removes every node and edge
+            With Dijkstra's algorithm, each edit repairs the previous shortest paths instead of starting over.
+            The editor tools above the visualization only change the drawing, not the graph the algorithms run on.
             """)
         
         # Algorithm specific parameters
-        if algorithm == "Dijkstra's Algorithm":
+        start_node = 0
+        target_node = None
+        bidirectional = algorithm in ("Bidirectional BFS", "Bidirectional Dijkstra")
+        point_to_point = bidirectional or algorithm == "A* Search"
+        if algorithm == "Dijkstra's Algorithm" or point_to_point:
             if graph_data["nodes"]:
                 start_node = parameter_with_tooltip(
                     "Start Node", 
-                    "The source node from which Dijkstra's algorithm will find shortest paths to all other nodes.",
+                    "The source node from which Dijkstra's algorithm will find shortest paths to all other nodes."
+                    if not point_to_point else "The node the path starts from.",
                     st.sidebar.number_input,
                     0, len(graph_data["nodes"])-1, 0
                 )
             else:
-                start_node = 0
                 st.sidebar.text("Start node: 0 (create nodes first)")
+        bfs_backend = "python"
+        if algorithm == "Breadth-First Search (BFS)":
+            bfs_backend = parameter_with_tooltip(
+                "BFS Backend",
+                "python: one step per explored edge. numpy: vectorized level-by-level BFS for large graphs, "
+                "switching between top-down and bottom-up expansion, with one step per level.",
+                st.sidebar.selectbox,
+                ["python", "numpy"]
+            )
+        if algorithm in ("Breadth-First Search (BFS)", "Dijkstra's Algorithm") and graph_data["nodes"]:
+            stop_at_target = parameter_with_tooltip(
+                "Stop at Target",
+                "Stop the search as soon as the target's shortest path is known, instead of reaching every node.",
+                st.sidebar.checkbox,
+                value=False
+            )
+        else:
+            stop_at_target = point_to_point and bool(graph_data["nodes"])
+        if stop_at_target:
+            target_node = parameter_with_tooltip(
+                "Target Node",
+                "The node to find a shortest path to." if not bidirectional
+                else "The node to find a shortest path to; the backward search starts from it.",
+                st.sidebar.number_input,
+                0, len(graph_data["nodes"])-1, len(graph_data["nodes"])-1
+            )
+        if algorithm in ("Dijkstra's Algorithm", "Bidirectional Dijkstra"):
+            queue = parameter_with_tooltip(
+                "Priority Queue",
+                "Lazy: binary heap with duplicate entries. Indexed: binary heap with decrease-key. "
+                "Bucket: Dial's bucket queue for integer weights.",
+                st.sidebar.selectbox,
+                ["lazy", "indexed", "bucket"]
+            )
+        if algorithm == "A* Search":
+            # The Euclidean estimate needs layout coordinates, which only some graph families have
+            has_layout = bool(graph_data["nodes"]) and all("x" in node for node in graph_data["nodes"])
+            heuristic = parameter_with_tooltip(
+                "Heuristic",
+                "Landmarks: lower bounds from distance tables of a few landmark nodes (ALT), computed once per graph. "
+                "Euclidean: scaled straight-line distance in the layout (random geometric graphs). "
+                "Zero: no estimate, which makes A* plain Dijkstra.",
+                st.sidebar.selectbox,
+                ["landmarks", "euclidean", "zero"] if has_layout else ["landmarks", "zero"]
+            )
+            queue = parameter_with_tooltip(
+                "Priority Queue",
+                "Lazy: binary heap with duplicate entries. Indexed: binary heap with decrease-key.",
+                st.sidebar.selectbox,
+                ["lazy", "indexed"]
+            )
+            compare_dijkstra = parameter_with_tooltip(
+                "Compare with Dijkstra",
+                "Also run plain Dijkstra for the same target, so the final statistics show how many "
+                "nodes the heuristic saved. This doubles the work of each run.",
+                st.sidebar.checkbox,
+                value=False
+            )
         
         # Create visualization
         if algorithm == "Depth-First Search (DFS)":
@@ -501,24 +673,76 @@ def main():
             **Description**: DFS explores as far as possible along each branch before backtracking. 
             It uses a stack to keep track of vertices to visit next.
             """)
-            visualize_graph_algorithm(graph_data, "dfs")
+            visualize_graph_algorithm(graph_data, "dfs", trace_format=trace_format, **detail)
         elif algorithm == "Breadth-First Search (BFS)":
             st.markdown("### Breadth-First Search (BFS) Visualization")
             st.markdown("""
             **Description**: BFS explores all neighbor nodes at the present depth before moving to nodes at the next depth level. 
             It uses a queue to keep track of vertices to visit next.
             """)
-            visualize_graph_algorithm(graph_data, "bfs")
+            visualize_graph_algorithm(
+                graph_data, "bfs", target_node=target_node, backend=bfs_backend, trace_format=trace_format, **detail
+            )
         elif algorithm == "Dijkstra's Algorithm":
             st.markdown("### Dijkstra's Algorithm Visualization")
             st.markdown("""
             **Description**: Dijkstra's algorithm finds the shortest paths from a source node to all other nodes in a weighted graph. 
             It uses a priority queue to select the next vertex with the smallest distance.
             """)
-            visualize_graph_algorithm(graph_data, "dijkstra", start_node=start_node)
+            visualize_graph_algorithm(
+                graph_data, "dijkstra", start_node=start_node, target_node=target_node, queue=queue,
+                trace_format=trace_format, **detail
+            )
+            if create_mode == "Manual" and graph_data["nodes"]:
+                show_manual_repair(graph_data, start_node)
+            if graph_data["nodes"] and st.checkbox(
+                "Compare all start nodes",
+                help="Shortest distances from every start node at once, from one all-pairs computation per graph."
+            ):
+                st.dataframe(compare_start_nodes(fingerprint("graph", graph_data), graph_data), hide_index=True)
+        elif algorithm == "Bidirectional BFS":
+            st.markdown("### Bidirectional BFS Visualization")
+            st.markdown("""
+            **Description**: Two breadth-first searches, one from the start and one backwards from the target, 
+            take turns expanding their smaller frontier until they meet. Nodes reached from the target are shown in green.
+            """)
+            if target_node is None:
+                st.info("Create nodes first to choose a start and target node.")
+            else:
+                visualize_graph_algorithm(
+                    graph_data, "bidirectional_bfs", start_node=start_node, target_node=target_node,
+                    trace_format=trace_format, **detail
+                )
+        elif algorithm == "Bidirectional Dijkstra":
+            st.markdown("### Bidirectional Dijkstra Visualization")
+            st.markdown("""
+            **Description**: Dijkstra's algorithm run from the start and backwards from the target at the same time. 
+            It stops once a node is settled by both searches, usually after settling far fewer nodes than a single search.
+            """)
+            if target_node is None:
+                st.info("Create nodes first to choose a start and target node.")
+            else:
+                visualize_graph_algorithm(
+                    graph_data, "bidirectional_dijkstra", start_node=start_node, target_node=target_node, queue=queue,
+                    trace_format=trace_format, **detail
+                )
+        elif algorithm == "A* Search":
+            st.markdown("### A* Search Visualization")
+            st.markdown("""
+            **Description**: A* is Dijkstra's algorithm aimed at one target: it settles nodes in order of 
+            distance so far plus a lower bound on the distance left, so nodes leading away from the target are skipped. 
+            With "Compare with Dijkstra", the final statistics show how many fewer nodes it settles than plain Dijkstra.
+            """)
+            if target_node is None:
+                st.info("Create nodes first to choose a start and target node.")
+            else:
+                visualize_graph_algorithm(
+                    graph_data, "astar", start_node=start_node, target_node=target_node, heuristic=heuristic,
+                    queue=queue, compare_dijkstra=compare_dijkstra, trace_format=trace_format, **detail
+                )
     
     elif st.session_state.algorithm_type == "Sorting Algorithms":  # Sorting Algorithms
-        valid_sorting_algos = ["QuickSort"]
+        valid_sorting_algos = list(SORTING_CHOICES)
         # Ensure current algorithm is valid for sorting algos, otherwise reset to default
         current_sorting_algo_from_state = st.session_state.get("algorithm", valid_sorting_algos[0])
         if current_sorting_algo_from_state not in valid_sorting_algos:
@@ -561,17 +785,36 @@ def main():
                 "Pivot Selection Method (Server-Side)", 
                 "Controls how the pivot element is chosen for partitioning the array. Different methods can affect performance.",
                 st.sidebar.selectbox,
-                ["last", "first", "middle", "random", "median"],
-                index=["last", "first", "middle", "random", "median"].index(st.session_state.pivot_method)
+                PIVOT_METHODS,
+                index=PIVOT_METHODS.index(st.session_state.pivot_method)
             )
             
             # Store pivot method
             st.session_state.pivot_method = pivot_method
+            
+            partition_method = parameter_with_tooltip(
+                "Partition Scheme",
+                "Lomuto: single scan with the pivot at the end. Three-way: splits into <, = and > the pivot, "
+                "so duplicates are handled in one pass. Hoare: two pointers scanning towards each other.",
+                st.sidebar.selectbox,
+                ["lomuto", "three_way", "hoare"]
+            )
+            depth_cap = parameter_with_tooltip(
+                "Introsort Depth Cap",
+                "Switch to heapsort when the recursion gets deeper than 2·log2(n), bounding the worst case.",
+                st.sidebar.checkbox,
+                value=True
+            )
         else:
             pivot_method = "last"
+            partition_method = "lomuto"
+            depth_cap = True
+        
+        if st.sidebar.button("Regenerate Array", help="Draw a new random array with the same parameters."):
+            st.session_state.array_seed = new_seed()
         
         # Generate array data
-        array_data = generate_array(array_size, is_random)
+        array_data = generate_array(array_size, is_random, st.session_state.array_seed)
         
         # Create visualization
         if algorithm == "QuickSort":
@@ -583,7 +826,16 @@ def main():
             You can change the pivot selection method in the sidebar (server-side) or in the visualization 
             controls (client-side, for demonstration).
             """)
-            visualize_sorting_algorithm(array_data, "quicksort", pivot_method=pivot_method)
+            visualize_sorting_algorithm(
+                array_data, "quicksort", pivot_method=pivot_method, partition_method=partition_method,
+                depth_limit="auto" if depth_cap else None, seed=st.session_state.array_seed, trace_format=trace_format,
+                **detail
+            )
+        else:
+            algorithm_key, description = SORTING_CHOICES[algorithm]
+            st.markdown(f"### {algorithm} Visualization")
+            st.markdown(f"**Description**: {description}")
+            visualize_sorting_algorithm(array_data, algorithm_key, trace_format=trace_format, **detail)
     
     # Controls for visualization
     st.sidebar.header("Visualization Controls")
@@ -614,123 +866,293 @@ def main():
     </script>
     """
     components.html(js_control, height=0)
+    
+    cache_stats = TRACE_CACHE.stats()
+    st.sidebar.caption(
+        f"Trace cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+        f"{cache_stats['entries']} entries ({cache_stats['bytes'] / 1e6:.1f} MB)"
+    )
 
-def generate_graph(nodes, edge_density, is_directed=False):
-    """Generate a random graph with specified parameters."""
-    import networkx as nx
-    import random
+# Sorting algorithms offered in the sidebar: label -> (algorithms.sorting name, description)
+SORTING_CHOICES = {
+    "QuickSort": ("quicksort", ""),
+    "Merge Sort": (
+        "merge_sort",
+        "Bottom-up merge sort merges runs of width 1, 2, 4, ... through a scratch buffer. "
+        "It always takes O(n log n) time and is stable."
+    ),
+    "Heapsort": (
+        "heapsort",
+        "Heapsort builds a max-heap in place, then repeatedly moves the maximum to the end of the array. "
+        "O(n log n) in the worst case with O(1) extra space, but not stable."
+    ),
+    "Timsort": (
+        "timsort",
+        "Timsort finds ascending and descending runs already present in the data, extends short ones by "
+        "binary insertion and merges them with balanced merges. Nearly sorted input takes close to O(n) time."
+    ),
+    "Radix Sort": (
+        "radix_sort",
+        "LSD radix sort distributes the values by their last digit, then the next one, with a stable "
+        "counting sort per digit. It takes O(d·n) time for d digits and makes no comparisons."
+    ),
+    "Shell Sort": (
+        "shell_sort",
+        "Shell sort runs insertion sorts over elements a gap apart, shrinking the gap along Ciura's sequence "
+        "down to 1, so elements travel far in few moves."
+    ),
+}
+
+# Graph families offered in automatic mode, mapped to algorithms.generators
+GRAPH_FAMILIES = ["Random (G(n,p))", "Grid", "Random Geometric", "Scale-Free"]
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def generate_graph(nodes, edge_density, is_directed=False, seed=0, family=GRAPH_FAMILIES[0]):
+    """
+    Generate a random graph with specified parameters.
+    The result depends only on the arguments, and is memoized per (nodes, edge_density, is_directed, seed, family).
+    For the random geometric and scale-free families, edge_density sets the expected
+    degree to about edge_density * (nodes - 1), as in G(n,p). Grids ignore it.
+    """
+    import math
+    from algorithms.generators import (
+        gnp_edges, grid_edges, random_geometric_edges, scale_free_edges, to_graph_data
+    )
     
-    # Create either directed or undirected random graph
-    if is_directed:
-        G = nx.gnp_random_graph(nodes, edge_density, directed=True)
+    if family == "Grid":
+        sources, targets, weights = grid_edges(nodes, seed=seed)
+    elif family == "Random Geometric":
+        radius = math.sqrt(edge_density * (nodes - 1) / (math.pi * nodes))
+        sources, targets, weights, points = random_geometric_edges(nodes, radius, seed=seed)
+        # Keep the geometric layout as initial node positions (and for A*'s Euclidean heuristic)
+        return to_graph_data(
+            nodes, sources, targets, weights, directed=is_directed, points=points * 150 * math.sqrt(nodes)
+        )
+    elif family == "Scale-Free":
+        sources, targets, weights = scale_free_edges(nodes, round(edge_density * (nodes - 1) / 2), seed=seed)
     else:
-        G = nx.gnp_random_graph(nodes, edge_density, directed=False)
-    
-    # Add random weights to edges
-    for u, v in G.edges():
-        G[u][v]['weight'] = random.randint(1, 10)
+        sources, targets, weights = gnp_edges(nodes, edge_density, directed=is_directed, seed=seed)
     
     # Convert to dictionary format for D3.js
-    graph_data = {
-        "nodes": [{"id": i} for i in range(nodes)],
-        "links": [{"source": u, "target": v, "weight": G[u][v]['weight']} 
-                 for u, v in G.edges()],
-        "directed": is_directed  # Include whether the graph is directed
-    }
-    
+    return to_graph_data(nodes, sources, targets, weights, directed=is_directed)
+
+def edit_manual_graph(graph_data):
+    """
+    Sidebar controls that edit the Manual-mode graph kept in session state.
+    Each edit stores a new graph dict, so the algorithms run on the edited graph in the same rerun.
+    """
+    nodes = graph_data["nodes"]
+    links = graph_data["links"]
+    st.sidebar.subheader("Edit Graph")
+    add_column, clear_column = st.sidebar.columns(2)
+    if add_column.button("Add Node", help="Add the next node, with no edges."):
+        nodes = nodes + [{"id": len(nodes)}]
+    if clear_column.button("Clear Graph", help="Remove every node and edge."):
+        nodes, links = [], []
+        st.session_state.pop("manual_paths", None)
+    if len(nodes) >= 2:
+        source = st.sidebar.number_input("Edge Source", 0, len(nodes) - 1, 0)
+        target = st.sidebar.number_input("Edge Target", 0, len(nodes) - 1, 1)
+        weight = st.sidebar.number_input("Edge Weight", 1, 100, 1)
+        
+        def is_chosen_edge(link):
+            if link["source"] == source and link["target"] == target:
+                return True
+            return not graph_data["directed"] and link["source"] == target and link["target"] == source
+        
+        others = [link for link in links if not is_chosen_edge(link)]
+        set_column, delete_column = st.sidebar.columns(2)
+        if set_column.button("Set Edge", help="Add the edge, or change its weight if it exists."):
+            if source != target:
+                links = others + [{"source": source, "target": target, "weight": weight}]
+        if delete_column.button("Delete Edge", help="Remove the edge between the chosen nodes."):
+            links = others
+    if nodes is not graph_data["nodes"] or links is not graph_data["links"]:
+        graph_data = {"nodes": nodes, "links": links, "directed": graph_data["directed"]}
+        st.session_state.manual_graph = graph_data
     return graph_data
 
-def generate_array(size, is_random):
-    """Generate an array for sorting visualization."""
+def show_manual_repair(graph_data, start_node):
+    """
+    Keep the shortest-path tree of the Manual-mode graph (algorithms.dynamic_paths) across
+    reruns, and after an edit list the nodes whose distance or tree parent the repair changed.
+    """
+    import time
+    from algorithms.dynamic_paths import DynamicShortestPaths
+    paths = st.session_state.get("manual_paths")
+    if paths is None or paths.source != start_node or paths.directed != graph_data["directed"]:
+        st.session_state.manual_paths = DynamicShortestPaths(graph_data, start_node)
+        st.session_state.manual_repair = None
+    else:
+        # sync() applies the edit through insert_edge/delete_edge
+        started = time.perf_counter()
+        steps = paths.sync(graph_data)
+        if steps:
+            st.session_state.manual_repair = (steps, time.perf_counter() - started)
+    
+    st.markdown("#### Last Edit")
+    repair = st.session_state.get("manual_repair")
+    if repair is None:
+        st.caption("Edit an edge under Edit Graph to see which shortest paths it changes.")
+        return
+    steps, seconds = repair
+    changed = [
+        {
+            "Node": step["node"],
+            "Distance": "∞" if step["distance"] is None else str(step["distance"]),
+            "Tree Parent": "-" if step["previous"] is None else str(step["previous"])
+        }
+        for step in steps if step["type"] == "distance"
+    ]
+    for step in steps:
+        if step["type"] == "update":
+            action = {"insert": "Added", "weight": "Reweighted", "delete": "Deleted"}[step["operation"]]
+            st.markdown(f"{action} edge {step['from']} → {step['to']}")
+    if not changed:
+        st.caption(f"No shortest path changed ({seconds * 1000:.2f} ms).")
+        return
+    st.caption(f"Repaired {len(changed)} of {len(graph_data['nodes'])} nodes in {seconds * 1000:.2f} ms; the others kept their distances.")
+    st.dataframe(changed, hide_index=True)
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def generate_array(size, is_random, seed=0):
+    """
+    Generate an array for sorting visualization.
+    The result depends only on the arguments, and is memoized per (size, is_random, seed).
+    """
     import random
     
+    rng = random.Random(seed)
+    
     if is_random:
-        return [random.randint(1, 100) for _ in range(size)]
+        return [rng.randint(1, 100) for _ in range(size)]
     else:
         # Generate a nearly sorted array with some out-of-place elements
         arr = list(range(1, size + 1))
         swaps = max(1, size)
         for _ in range(swaps):
-            i, j = random.sample(range(size), 2)
+            i, j = rng.sample(range(size), 2)
             arr[i], arr[j] = arr[j], arr[i]
         return arr
 
+def new_seed():
+    """Fresh seed for the "Regenerate" actions."""
+    import random
+    return random.randrange(2 ** 31)
+
 def visualize_graph_algorithm(graph_data, algorithm, **params):
     """Create a D3.js visualization for graph algorithms."""
-    # Pass data and algorithm to the D3 visualization
-    graph_json = json.dumps(graph_data)
+    try:
+        bundle = get_bundle("graph")
+    except VendorAssetError as e:
+        st.error(str(e))
+        return
+    # Reruns that leave the algorithm input unchanged reuse the rendered payload
+    html_key = fingerprint("graph-html", graph_data, algorithm, params, bundle.fingerprint)
+    full_html = TRACE_CACHE.get(html_key)
+    if full_html is None:
+        try:
+            full_html = TRACE_CACHE.put(html_key, render_graph_algorithm(graph_data, algorithm, **params))
+        except ValueError as e:
+            st.error(str(e))
+            return
     
-    # Execute algorithm to get steps
+    components.html(full_html, height=800, scrolling=False)
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def get_compiled_graph(graph_key, _graph_data):
+    """
+    CompiledGraph for graph data, keyed by its fingerprint and kept across reruns,
+    so per-graph precomputations (such as the A* landmark tables) are made once.
+    """
+    return compile_graph(_graph_data)
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def compare_start_nodes(graph_key, _graph_data):
+    """
+    Per start node summary of the all-pairs distance matrix (algorithms.batch): how many
+    nodes it reaches, and the mean and largest distance to them.
+    """
+    import numpy as np
+    from algorithms.batch import all_pairs_distances
+    compiled_graph = get_compiled_graph(graph_key, _graph_data)
+    # Run in this process: forking a pool from Streamlit's threaded server is unsafe, and
+    # the app's graphs (at most 200 nodes) take about a second at full density
+    distances = all_pairs_distances(compiled_graph, workers=0)
+    finite = np.isfinite(distances)
+    # Other nodes reached; the start node itself is at distance 0
+    reached = finite.sum(axis=1) - 1
+    totals = np.where(finite, distances, 0)
+    return {
+        "Start Node": compiled_graph.ids,
+        "Reachable Nodes": reached.tolist(),
+        "Mean Distance": np.round(totals.sum(axis=1) / np.maximum(reached, 1), 2).tolist(),
+        "Max Distance": totals.max(axis=1).tolist(),
+    }
+
+def compute_graph_trace(graph_data, algorithm, **params):
+    """Run a graph algorithm and return its steps serialized by build_trace."""
+    # Compile the adjacency once; the algorithms share the CSR arrays
+    compiled_graph = get_compiled_graph(fingerprint("graph", graph_data), graph_data)
+    
+    # Execute algorithm to get steps lazily; explanations are resolved on the client
+    start_node = params.get("start_node", 0)
+    target_node = params.get("target_node")
     if algorithm == "dfs":
-        start_node = params.get("start_node", 0)
-        steps = dfs(graph_data, start_node)
-        # Add explanations to steps
-        for step in steps:
-            if step["type"] == "visit":
-                step["action"] = f"Visiting node {step['node']}"
-                step["reason"] = f"DFS selects an unvisited neighbor of the current node to explore next."
-            elif step["type"] == "explore":
-                step["action"] = f"Exploring edge from {step['from']} to {step['to']}"
-                step["reason"] = f"DFS explores edges to find unvisited nodes."
-            elif step["type"] == "complete":
-                step["action"] = f"Completed exploration of node {step['node']}"
-                step["reason"] = f"All neighbors of this node have been visited, so DFS marks it as complete."
-            elif step["type"] == "backtrack":
-                step["action"] = f"Backtracking from {step['from']} to {step['to']}"
-                step["reason"] = f"DFS backtracks when it reaches a dead-end or a node with no unvisited neighbors."
+        steps = iter_dfs(compiled_graph, start_node)
     elif algorithm == "bfs":
-        start_node = params.get("start_node", 0)
-        steps = bfs(graph_data, start_node)
-        # Add explanations to steps
-        for step in steps:
-            if step["type"] == "visit":
-                step["action"] = f"Visiting node {step['node']}"
-                step["reason"] = f"BFS visits nodes in order of their distance from the start node."
-            elif step["type"] == "explore":
-                step["action"] = f"Exploring edge from {step['from']} to {step['to']}"
-                step["reason"] = f"BFS explores all edges from a node before moving to the next level."
-            elif step["type"] == "complete":
-                step["action"] = f"Completed exploration of node {step['node']}"
-                step["reason"] = f"All neighbors of this node have been discovered, so BFS marks it as complete."
+        steps = iter_bfs(
+            compiled_graph, start_node, levels=params.get("structural", False), target_node=target_node,
+            backend=params.get("backend", "python")
+        )
     elif algorithm == "dijkstra":
-        start_node = params.get("start_node", 0)
-        steps = dijkstra(graph_data, start_node)
-        # Add explanations to steps
-        for step in steps:
-            if step["type"] == "distance":
-                step["action"] = f"Setting distance of node {step['node']} to {step['distance']}"
-                step["reason"] = f"Dijkstra's algorithm updates distances as it finds shorter paths."
-            elif step["type"] == "visit":
-                step["action"] = f"Visiting node {step['node']}"
-                step["reason"] = f"Dijkstra's algorithm always selects the unvisited node with the smallest distance."
-            elif step["type"] == "relax":
-                if step["success"]:
-                    step["action"] = f"Relaxing edge from {step['from']} to {step['to']}: new distance {step['newDistance']}"
-                    step["reason"] = f"Found a shorter path to node {step['to']} through node {step['from']}."
-                else:
-                    step["action"] = f"Tried relaxing edge from {step['from']} to {step['to']}, but no improvement"
-                    step["reason"] = f"The current path to node {step['to']} is already optimal."
-            elif step["type"] == "complete":
-                step["action"] = f"Completed processing of node {step['node']}"
-                step["reason"] = f"All edges from this node have been considered for relaxation."
-            elif step["type"] == "path":
-                step["action"] = f"Final shortest paths calculated"
-                step["reason"] = f"The algorithm has found the shortest path from the start node to all other nodes."
-    
-    steps_json = json.dumps(steps)
+        steps = iter_dijkstra(
+            compiled_graph, start_node, queue=params.get("queue", "lazy"), include_stats=True, target_node=target_node
+        )
+    elif algorithm == "bidirectional_bfs":
+        steps = iter_bidirectional_bfs(compiled_graph, start_node, target_node)
+    elif algorithm == "bidirectional_dijkstra":
+        steps = iter_bidirectional_dijkstra(
+            compiled_graph, start_node, target_node, queue=params.get("queue", "lazy"), include_stats=True
+        )
+    elif algorithm == "astar":
+        steps = iter_astar(
+            compiled_graph, start_node, target_node, heuristic=params.get("heuristic", "landmarks"),
+            queue=params.get("queue", "lazy"), include_stats=True,
+            compare_dijkstra=params.get("compare_dijkstra", False)
+        )
+    steps = sample_steps(steps, params, GRAPH_STRUCTURAL_STEPS[algorithm])
+    
+    return build_trace(steps, params.get("trace_format", "json"))
+
+def render_graph_algorithm(graph_data, algorithm, **params):
+    """Build the component HTML for a graph algorithm visualization."""
+    # Pass data and algorithm to the D3 visualization
+    graph_json = json.dumps(graph_data)
+    
+    first_steps_json, step_chunk_tags = TRACE_CACHE.get_or_compute(
+        fingerprint("graph-trace", graph_data, algorithm, params),
+        lambda: compute_graph_trace(graph_data, algorithm, **params)
+    )
     
     # Embed the D3.js visualization
     html_content = f"""
     <div id="graph-container" class="visualization-container"></div>
+    {step_chunk_tags}
     
-    <script src="https://d3js.org/d3.v7.min.js"></script>
     <script>
         const graphData = {graph_json};
-        const algorithmSteps = {steps_json};
+        const firstSteps = {first_steps_json};
         const algorithm = "{algorithm}";
         
         
         document.addEventListener("DOMContentLoaded", function() {{
+            // Columnar traces decode on access; JSON playback starts with the first chunk
+            // and the rest is appended as it is parsed
+            const columnarTrace = document.querySelector("script.step-columns");
+            const algorithmSteps = columnarTrace
+                ? window.decodeColumnarTrace(columnarTrace)
+                : window.createStepStream(firstSteps, document.querySelectorAll("script.step-chunk"));
             if (window.createGraphVisualization) {{
                 window.createGraphVisualization(
                     graphData, 
@@ -743,98 +1165,75 @@ def visualize_graph_algorithm(graph_data, algorithm, **params):
     </script>
     """
     
-    # Include custom JavaScript and CSS
-    graph_js_path = os.path.join(STATIC_DIR, "js", "visualizations", "graph.js")
-    main_js_path = os.path.join(STATIC_DIR, "js", "main.js")
-    css_path = os.path.join(STATIC_DIR, "css", "style.css")
-    
-    with open(graph_js_path, "r") as f:
-        graph_js = f.read()
-    
-    with open(main_js_path, "r") as f:
-        main_js = f.read()
-    
-    with open(css_path, "r") as f:
-        css = f.read()
-    
+    # Static JS/CSS come from the per-process bundle (minified; vendor libraries served or inlined)
+    bundle = get_bundle("graph")
     full_html = f"""
-    <style>{css}</style>
+    {bundle.head}
     {html_content}
-    <script>{main_js}</script>
-    <script>{graph_js}</script>
+    {bundle.body}
     """
     
-    components.html(full_html, height=800, scrolling=False)
+    return full_html
 
 def visualize_sorting_algorithm(array_data, algorithm, **params):
     """Create a D3.js visualization for sorting algorithms."""
-    # Pass data and algorithm to the D3 visualization
-    array_json = json.dumps(array_data)
+    try:
+        bundle = get_bundle("sorting")
+    except VendorAssetError as e:
+        st.error(str(e))
+        return
+    # Reruns that leave the algorithm input unchanged reuse the rendered payload
+    html_key = fingerprint("sorting-html", array_data, algorithm, params, bundle.fingerprint)
+    full_html = TRACE_CACHE.get(html_key)
+    if full_html is None:
+        full_html = TRACE_CACHE.put(html_key, render_sorting_algorithm(array_data, algorithm, **params))
     
-    # Execute algorithm to get steps
+    components.html(full_html, height=1000, scrolling=False)
+
+def compute_sorting_trace(array_data, algorithm, **params):
+    """Run a sorting algorithm and return its steps serialized by build_trace."""
+    # Execute algorithm to get steps lazily; explanations are resolved on the client
     if algorithm == "quicksort":
         pivot_method = params.get("pivot_method", "last")
-        steps = quicksort(array_data.copy(), pivot_method=pivot_method)
-        # Add explanations to steps
-        for i, step in enumerate(steps):
-            if not "action" in step:  # Only add if not already present
-                # Keep track of current pivot for all steps
-                current_pivot_idx = -1
-                if "pivot" in step:
-                    current_pivot_idx = step['pivot']
-                    step["action"] = f"Selected pivot: value {array_data[step['pivot']]} at index {step['pivot']}"
-                    step["reason"] = f"Using {pivot_method} element as pivot"
-                elif "range" in step:
-                    low, high = step['range']
-                    subarray_elements = array_data[low:high+1]
-                    
-                    # Find pivot if it exists in this range from previous steps
-                    pivot_info = ""
-                    for j in range(i, -1, -1):
-                        if "pivot" in steps[j] and low <= steps[j]["pivot"] <= high:
-                            current_pivot_idx = steps[j]["pivot"]
-                            pivot_info = f" (pivot at index {current_pivot_idx}, value {array_data[current_pivot_idx]})"
-                            break
-                            
-                    step["action"] = f"Processing subarray from index {low} to {high}: {subarray_elements}{pivot_info}"
-                    step["reason"] = ""
-                elif "comparing" in step:
-                    comparing_indices = step['comparing']
-                    comparing_values = [array_data[idx] for idx in comparing_indices]
-                    step["action"] = f"Comparing value {comparing_values[0]} with pivot"
-                    step["reason"] = ""
-                elif "swapping" in step:
-                    swapping_indices = step['swapping']
-                    swapping_values = [array_data[idx] for idx in swapping_indices]
-                    step["action"] = f"Swapping values: {swapping_values[0]} and {swapping_values[1]}"
-                    step["reason"] = ""
-                elif "sorted" in step:
-                    if len(step['sorted']) == len(array_data):
-                        step["action"] = "Array sorted successfully"
-                        step["reason"] = ""
-                    else:
-                        sorted_indices = step['sorted']
-                        sorted_values = [array_data[idx] for idx in sorted_indices]
-                        step["action"] = f"Elements now in final position: {sorted_values}"
-                        step["reason"] = ""
-                else:
-                    step["action"] = f"Step {i+1}"
-                    step["reason"] = ""
-    
-    steps_json = json.dumps(steps)
+        steps = iter_quicksort(
+            array_data.copy(), pivot_method=pivot_method,
+            partition_method=params.get("partition_method", "lomuto"), depth_limit=params.get("depth_limit", "auto"),
+            seed=params.get("seed"), include_stats=True
+        )
+    else:
+        steps = SORTING_ALGORITHMS[algorithm](array_data.copy(), include_stats=True)
+    steps = sample_steps(steps, params, SORTING_STRUCTURAL_STEPS[algorithm], initial=array_data)
+    
+    return build_trace(steps, params.get("trace_format", "json"))
+
+def render_sorting_algorithm(array_data, algorithm, **params):
+    """Build the component HTML for a sorting algorithm visualization."""
+    # Pass data and algorithm to the D3 visualization
+    array_json = json.dumps(array_data)
+    
+    first_steps_json, step_chunk_tags = TRACE_CACHE.get_or_compute(
+        fingerprint("sorting-trace", array_data, algorithm, params),
+        lambda: compute_sorting_trace(array_data, algorithm, **params)
+    )
     
     # Embed the D3.js visualization
     html_content = f"""
     <div id="sorting-container" class="visualization-container"></div>
+    {step_chunk_tags}
     
-    <script src="https://d3js.org/d3.v7.min.js"></script>
     <script>
         const arrayData = {array_json};
-        const algorithmSteps = {steps_json};
+        const firstSteps = {first_steps_json};
         const algorithm = "{algorithm}";
         
         
         document.addEventListener("DOMContentLoaded", function() {{
+            // Columnar traces decode on access; JSON playback starts with the first chunk
+            // and the rest is appended as it is parsed
+            const columnarTrace = document.querySelector("script.step-columns");
+            const algorithmSteps = columnarTrace
+                ? window.decodeColumnarTrace(columnarTrace)
+                : window.createStepStream(firstSteps, document.querySelectorAll("script.step-chunk"));
             if (window.createSortingVisualization) {{
                 window.createSortingVisualization(
                     arrayData, 
@@ -847,28 +1246,15 @@ def visualize_sorting_algorithm(array_data, algorithm, **params):
     </script>
     """
     
-    # Include custom JavaScript and CSS
-    sorting_js_path = os.path.join(STATIC_DIR, "js", "visualizations", "sorting.js")
-    main_js_path = os.path.join(STATIC_DIR, "js", "main.js")
-    css_path = os.path.join(STATIC_DIR, "css", "style.css")
-    
-    with open(sorting_js_path, "r") as f:
-        sorting_js = f.read()
-    
-    with open(main_js_path, "r") as f:
-        main_js = f.read()
-    
-    with open(css_path, "r") as f:
-        css = f.read()
-    
+    # Static JS/CSS come from the per-process bundle (minified; vendor libraries served or inlined)
+    bundle = get_bundle("sorting")
     full_html = f"""
-    <style>{css}</style>
+    {bundle.head}
     {html_content}
-    <script>{main_js}</script>
-    <script>{sorting_js}</script>
+    {bundle.body}
     """
     
-    components.html(full_html, height=1000, scrolling=False)
+    return full_html
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,176 @@
+# Static asset pipeline for the visualization components
+# JS/CSS are loaded, minified and fingerprinted once per process and reused across sessions and reruns
+import hashlib
+import os
+import re
+import threading
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+VENDOR_DIR = os.path.join(STATIC_DIR, "vendor")
+
+# Third-party scripts, pinned: name -> (file in static/vendor, download URL).
+# `python assets.py fetch` downloads them once; the app never reaches a CDN unless
+# ALGOVIZ_ALLOW_CDN=1 is set and a file is missing.
+VENDOR_SCRIPTS = {
+    "d3": ("d3.v7.min.js", "https://cdn.jsdelivr.net/npm/d3@7.9.0/dist/d3.min.js"),
+    "font-awesome": ("fontawesome.all.min.js", "https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/js/all.min.js"),
+}
+CDN_ENV_VAR = "ALGOVIZ_ALLOW_CDN"
+# URL prefix of STATIC_DIR under Streamlit's static file serving (server.enableStaticServing)
+STATIC_URL = "app/static"
+
+class VendorAssetError(RuntimeError):
+    """A vendored library is missing and the CDN fallback is not enabled."""
+
+# Files making up each component bundle, relative to STATIC_DIR
+BUNDLES = {
+    "graph": {
+        "css": ["css/style.css"],
+        "vendor": ["d3"],
+        "js": ["js/main.js", "js/visualizations/graph.js"],
+    },
+    "sorting": {
+        "css": ["css/style.css"],
+        "vendor": ["d3", "font-awesome"],
+        "js": ["js/main.js", "js/visualizations/sorting.js"],
+    },
+}
+
+def minify_js(source):
+    """
+    Conservative line-based JS minifier.
+    Drops blank lines, indentation and whole-line comments but never joins lines,
+    so automatic semicolon insertion is unaffected. Lines inside multi-line
+    template literals are kept verbatim.
+    """
+    lines = []
+    in_template = False
+    in_comment = False
+    for line in source.splitlines():
+        if in_template:
+            lines.append(line)
+        else:
+            stripped = line.strip()
+            if in_comment:
+                if "*/" in stripped:
+                    in_comment = False
+                continue
+            if not stripped or stripped.startswith("//"):
+                continue
+            if stripped.startswith("/*"):
+                in_comment = "*/" not in stripped
+                continue
+            lines.append(stripped)
+        if len(re.findall(r"(?<!\\)`", line)) % 2 == 1:
+            in_template = not in_template
+    return "\n".join(lines)
+
+def minify_css(source):
+    """Strip comments and collapse whitespace in a stylesheet."""
+    source = re.sub(r"/\*.*?\*/", "", source, flags=re.S)
+    source = re.sub(r"\s+", " ", source)
+    source = re.sub(r"\s*([{};:,>])\s*", r"\1", source)
+    return source.strip()
+
+def _read(relative_path):
+    with open(os.path.join(STATIC_DIR, relative_path), "r", encoding="utf-8") as f:
+        return f.read()
+
+def _static_serving_enabled():
+    """Whether Streamlit serves STATIC_DIR at STATIC_URL (see .streamlit/config.toml)."""
+    try:
+        from streamlit import config
+    except ImportError:
+        return False
+    return bool(config.get_option("server.enableStaticServing"))
+
+def vendor_script_tag(name):
+    """
+    <script> tag for a vendored library.
+    With static serving on, the file is referenced by URL, so the browser loads it once for
+    every component; otherwise it is inlined. A missing file is loaded from its pinned URL
+    only when ALGOVIZ_ALLOW_CDN=1.
+    Raises:
+        VendorAssetError: If the file is missing and the CDN fallback is not enabled
+    """
+    filename, url = VENDOR_SCRIPTS[name]
+    path = os.path.join(VENDOR_DIR, filename)
+    if not os.path.exists(path):
+        if os.environ.get(CDN_ENV_VAR) == "1":
+            return f'<script src="{url}"></script>'
+        raise VendorAssetError(
+            f"static/vendor/{filename} is missing. Run `python assets.py fetch` once, "
+            f"or set {CDN_ENV_VAR}=1 to load it from {url}."
+        )
+    if _static_serving_enabled():
+        return f'<script src="{STATIC_URL}/vendor/{filename}"></script>'
+    with open(path, "r", encoding="utf-8") as f:
+        return f"<script>{f.read()}</script>"
+
+def fetch_vendor_scripts(force=False):
+    """
+    Download the pinned VENDOR_SCRIPTS into static/vendor.
+    Returns:
+        (filename, sha256 hex digest) for each downloaded file, so the copies can be checked
+    """
+    import urllib.request
+    os.makedirs(VENDOR_DIR, exist_ok=True)
+    fetched = []
+    for filename, url in VENDOR_SCRIPTS.values():
+        path = os.path.join(VENDOR_DIR, filename)
+        if os.path.exists(path) and not force:
+            continue
+        with urllib.request.urlopen(url, timeout=60) as response:
+            data = response.read()
+        with open(path + ".tmp", "wb") as f:
+            f.write(data)
+        os.replace(path + ".tmp", path)
+        fetched.append((filename, hashlib.sha256(data).hexdigest()))
+    return fetched
+
+class AssetBundle:
+    """
+    A built component bundle.
+    head: <style> and vendor <script> tags to place before the component markup
+    body: the application scripts to place after it
+    fingerprint: content hash of head and body, usable in cache keys
+    """
+    def __init__(self, name, head, body):
+        self.name = name
+        self.head = head
+        self.body = body
+        self.fingerprint = hashlib.sha256((head + body).encode("utf-8")).hexdigest()[:16]
+
+    @classmethod
+    def build(cls, name):
+        spec = BUNDLES[name]
+        css = "".join(minify_css(_read(path)) for path in spec["css"])
+        head = f"<style>{css}</style>" + "".join(vendor_script_tag(lib) for lib in spec["vendor"])
+        body = "".join(f"<script>{minify_js(_read(path))}</script>" for path in spec["js"])
+        return cls(name, head, body)
+
+_bundles = {}
+_lock = threading.Lock()
+
+def get_bundle(name):
+    """Return the bundle for name, building it on first use in this process."""
+    bundle = _bundles.get(name)
+    if bundle is None:
+        with _lock:
+            bundle = _bundles.get(name)
+            if bundle is None:
+                bundle = _bundles[name] = AssetBundle.build(name)
+    return bundle
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(prog="python assets.py", description="Manage the vendored JS libraries.")
+    parser.add_argument("command", choices=["fetch"], help="fetch: download the pinned libraries into static/vendor")
+    parser.add_argument("--force", action="store_true", help="Download again even if a file exists")
+    args = parser.parse_args()
+    try:
+        fetched = fetch_vendor_scripts(force=args.force)
+    except OSError as e:
+        parser.exit(1, f"Download failed: {e}\nCopy the files listed in VENDOR_SCRIPTS into {VENDOR_DIR} by hand.\n")
+    for filename, digest in fetched:
+        print(f"{filename}  sha256 {digest}")
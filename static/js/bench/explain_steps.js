@@ -0,0 +1,63 @@
+/**
+ * Times the client-side step explanations over a full sorting trace, for algorithms/bench.py
+ * Usage: node explain_steps.js TRACE_FILE [REPEAT]
+ * TRACE_FILE holds {"algorithm", "initial", "steps"} with the delta-encoded steps of a
+ * sorting algorithm. Prints {"steps", "seconds"}: the best of REPEAT passes, after a warm-up
+ * pass, that rebuild each step's array from the writes and keyframes (as arrayAtStep does),
+ * restore its pointers (normalizeSortingStep) and build its text (explainStep). Node
+ * startup, script loading and JSON parsing are not timed.
+ */
+const fs = require("fs");
+const path = require("path");
+const vm = require("vm");
+
+const JS_DIR = path.join(__dirname, "..");
+// Scripts of the sorting bundle that define the explanation templates (see assets.BUNDLES)
+const SCRIPTS = ["main.js", "visualizations/sorting.js"];
+
+function loadTemplates() {
+    const context = { console, document: { addEventListener() {} }, addEventListener() {} };
+    context.window = context;
+    vm.createContext(context);
+    for (const script of SCRIPTS) {
+        vm.runInContext(fs.readFileSync(path.join(JS_DIR, script), "utf8"), context, { filename: script });
+    }
+    return context;
+}
+
+function explainTrace(templates, algorithm, initial, steps) {
+    // The templates only read the array, so one array is updated in place instead of
+    // copied per step; the copy in stepWithArray belongs to rendering
+    const current = initial.slice();
+    let textLength = 0;
+    for (let index = 0; index < steps.length; index++) {
+        const step = steps[index];
+        if (step.array) {
+            for (let k = 0; k < step.array.length; k++) current[k] = step.array[k];
+        } else if (step.writes) {
+            for (let w = 0; w < step.writes.length; w += 2) current[step.writes[w]] = step.writes[w + 1];
+        }
+        const view = templates.normalizeSortingStep(algorithm, Object.assign({}, step, { array: current }));
+        const explanation = templates.explainStep(algorithm, view, { stepIndex: index });
+        textLength += explanation.action.length + explanation.reason.length;
+    }
+    return textLength;
+}
+
+function main() {
+    const [tracePath, repeatArgument] = process.argv.slice(2);
+    const trace = JSON.parse(fs.readFileSync(tracePath, "utf8"));
+    const repeat = Math.max(1, parseInt(repeatArgument || "3", 10));
+    const templates = loadTemplates();
+    // One untimed pass, so small traces are not timed while the JIT is still compiling
+    explainTrace(templates, trace.algorithm, trace.initial, trace.steps);
+    let best = Infinity;
+    for (let run = 0; run < repeat; run++) {
+        const started = process.hrtime.bigint();
+        explainTrace(templates, trace.algorithm, trace.initial, trace.steps);
+        best = Math.min(best, Number(process.hrtime.bigint() - started) / 1e9);
+    }
+    process.stdout.write(JSON.stringify({ steps: trace.steps.length, seconds: best }) + "\n");
+}
+
+main();
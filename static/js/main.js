@@ -16,6 +16,124 @@ function updateControlParams(speed, stepSize) {
     }
 }
 window.updateControlParams = updateControlParams;
+// Step list that starts with the inline first chunk and grows as the remaining
+// <script type="application/json" class="step-chunk"> payloads are parsed
+function createStepStream(firstSteps, chunkElements) {
+    const steps = firstSteps;
+    const pending = Array.from(chunkElements || []);
+    function loadNextChunk() {
+        const element = pending.shift();
+        if (!element) return;
+        const chunk = JSON.parse(element.textContent);
+        for (let i = 0; i < chunk.length; i++) {
+            steps.push(chunk[i]);
+        }
+        element.remove();
+        setTimeout(loadNextChunk, 0);
+    }
+    setTimeout(loadNextChunk, 0);
+    return steps;
+}
+window.createStepStream = createStepStream;
+// Steps from the columnar trace format (algorithms/trace.py encode_columnar), embedded as
+// <script type="application/json" class="step-columns">{header..., "data": base64}</script>.
+// Columns are typed-array views on the decoded buffer; steps[i] builds the step object on access.
+const COLUMN_ARRAYS = {
+    bool: Uint8Array, int8: Int8Array, int16: Int16Array, int32: Int32Array, float64: Float64Array
+};
+const COLUMN_MISSING = { bool: 255, int8: -128, int16: -32768, int32: -2147483648 };
+function decodeColumnarTrace(element) {
+    const header = JSON.parse(element.textContent);
+    const binary = atob(header.data);
+    const bytes = new Uint8Array(binary.length);
+    for (let i = 0; i < binary.length; i++) {
+        bytes[i] = binary.charCodeAt(i);
+    }
+    const buffer = bytes.buffer;
+    const count = header.count;
+    const typeCodes = new Uint8Array(buffer, header.typeCodes, count);
+    const tables = header.types.map(table => ({
+        name: table.name,
+        columns: table.columns.map(column => {
+            const ArrayType = COLUMN_ARRAYS[column.dtype];
+            const length = column.kind === "scalar" ? table.rows : column.length;
+            return Object.assign({}, column, {
+                values: new ArrayType(buffer, column.offset, length),
+                offsets: column.offsets !== undefined ? new Int32Array(buffer, column.offsets, table.rows + 1) : null,
+                empty: new Set(column.empty || [])
+            });
+        })
+    }));
+    // Row of each step within its type's table
+    const rows = new Int32Array(count);
+    const nextRow = new Int32Array(tables.length);
+    for (let i = 0; i < count; i++) {
+        rows[i] = nextRow[typeCodes[i]]++;
+    }
+    function stepAt(index) {
+        const table = tables[typeCodes[index]];
+        const row = rows[index];
+        const step = { type: table.name };
+        for (const column of table.columns) {
+            if (column.kind === "scalar") {
+                const value = column.values[row];
+                if (value === COLUMN_MISSING[column.dtype] || value !== value) continue;
+                step[column.name] = column.dtype === "bool" ? value === 1 : value;
+                continue;
+            }
+            let start, end;
+            if (column.offsets) {
+                start = column.offsets[row];
+                end = column.offsets[row + 1];
+                if (start === end && !column.empty.has(row)) continue;
+            } else {
+                start = row * column.size;
+                end = start + column.size;
+            }
+            const items = Array.from(column.values.subarray(start, end));
+            if (column.width > 1) {
+                const groups = [];
+                for (let k = 0; k < items.length; k += column.width) {
+                    groups.push(items.slice(k, k + column.width));
+                }
+                step[column.name] = groups;
+            } else {
+                step[column.name] = items;
+            }
+        }
+        const extra = header.extras[index];
+        return extra ? Object.assign(step, extra) : step;
+    }
+    return new Proxy([], {
+        get(target, property) {
+            if (property === "length") return count;
+            if (typeof property === "string" && /^\d+$/.test(property)) {
+                const index = Number(property);
+                return index < count ? stepAt(index) : undefined;
+            }
+            return target[property];
+        }
+    });
+}
+window.decodeColumnarTrace = decodeColumnarTrace;
+// Step explanation registry: each visualization registers templates per algorithm and
+// step type, and a step's text is only built when that step is displayed.
+// A template is {action, reason}, each a string or a function (step, context) => string.
+const stepExplanations = {};
+function registerStepExplanations(algorithm, templates) {
+    stepExplanations[algorithm] = Object.assign(stepExplanations[algorithm] || {}, templates);
+}
+window.registerStepExplanations = registerStepExplanations;
+function explainStep(algorithm, step, context) {
+    const templates = stepExplanations[algorithm] || {};
+    const template = templates[step.type] || templates.default || {};
+    const resolve = (part) => {
+        const value = template[part];
+        return typeof value === 'function' ? value(step, context || {}) : (value || '');
+    };
+    return { action: resolve('action'), reason: resolve('reason') };
+}
+window.explainStep = explainStep;
 // Fullscreen functionality is disabled
 function toggleFullscreen(container) {
     console.log("Fullscreen functionality has been disabled");
@@ -212,7 +212,9 @@ function createGraphVisualization(data, steps, algorithm, container) {
     
     
     let distanceLabels = null;
-    if (algorithm === "dijkstra") {
+    // One distance per node: Dijkstra and A* (the bidirectional search keeps two)
+    const showsDistances = algorithm === "dijkstra" || algorithm === "astar";
+    if (showsDistances) {
         
         const nodeGroup = graph.append("g").attr("class", "node-group");
         
@@ -509,20 +511,15 @@ function createGraphVisualization(data, steps, algorithm, container) {
             currentStep = 0;
             
             
-            node.attr("fill", colors.node)
-                .attr("stroke", colors.nodeStroke);
+            clearGraphState();
             
             
-            link.attr("stroke", colors.edge)
-                .attr("stroke-width", 2);
-            
-            
-            if (algorithm === "dijkstra" && distanceLabels) {
-                distanceLabels.selectAll("text").text("∞");
+            // Replay from the nearest keyframe of a sampled trace, or from the start
+            let replayStart = targetStep - 1;
+            while (replayStart > 0 && !steps[replayStart].keyframe) {
+                replayStart--;
             }
-            
-            
-            for (let i = 0; i < targetStep; i++) {
+            for (let i = Math.max(replayStart, 0); i < targetStep; i++) {
                 processStep(i, false); 
             }
             
@@ -536,11 +533,7 @@ function createGraphVisualization(data, steps, algorithm, container) {
         }
     }
     
-    function resetVisualization() {
-        currentStep = 0;
-        stepCounter.text("Step: " + currentStep + " / " + steps.length);
-        
-        
+    function clearGraphState() {
         node.attr("fill", colors.node)
             .attr("stroke", colors.nodeStroke);
         
@@ -549,9 +542,17 @@ function createGraphVisualization(data, steps, algorithm, container) {
             .attr("stroke-width", 2);
         
         
-        if (algorithm === "dijkstra" && distanceLabels) {
+        if (showsDistances && distanceLabels) {
             distanceLabels.selectAll("text").text("∞");
         }
+    }
+    
+    function resetVisualization() {
+        currentStep = 0;
+        stepCounter.text("Step: " + currentStep + " / " + steps.length);
+        
+        
+        clearGraphState();
         
         
         explanationPanels.updateStepContent('');
@@ -567,17 +568,9 @@ function createGraphVisualization(data, steps, algorithm, container) {
         }
 
         
-        let stepText = "Processing algorithm step";
-        let reasonText = "No explanation available";
-
-        
-        if (step.action) {
-            stepText = step.action;
-        }
-
-        if (step.reason) {
-            reasonText = step.reason;
-        }
+        const explanation = explainStep(algorithm, step);
+        const stepText = explanation.action || "Processing algorithm step";
+        const reasonText = explanation.reason || "No explanation available";
 
         
         try {
@@ -597,6 +590,9 @@ function createGraphVisualization(data, steps, algorithm, container) {
                 if (algorithm === "dfs") algoName = "Depth-First Search";
                 else if (algorithm === "bfs") algoName = "Breadth-First Search";
                 else if (algorithm === "dijkstra") algoName = "Dijkstra's Algorithm";
+                else if (algorithm === "bidirectional_bfs") algoName = "Bidirectional BFS";
+                else if (algorithm === "bidirectional_dijkstra") algoName = "Bidirectional Dijkstra";
+                else if (algorithm === "astar") algoName = "A* Search";
                 
                 
                 let actionTitle = '';
@@ -620,11 +616,25 @@ function createGraphVisualization(data, steps, algorithm, container) {
                         actionTitle = `${algoName}: ${step.success ? 'Relaxing' : 'Checking'} Edge from ${step.from} to ${step.to}`;
                         break;
                     case 'path':
-                        actionTitle = `${algoName}: Final Shortest Paths`;
+                        actionTitle = step.target !== undefined
+                            ? `${algoName}: Path to Node ${step.target}`
+                            : `${algoName}: Final Shortest Paths`;
+                        break;
+                    case 'meet':
+                        actionTitle = `${algoName}: Searches Meet at Node ${step.node}`;
+                        break;
+                    case 'stats':
+                        actionTitle = `${algoName}: Run Statistics`;
+                        break;
+                    case 'level':
+                        actionTitle = `${algoName}: Level ${step.level} (${frontierSize(step)} Nodes)`;
                         break;
                     default:
                         actionTitle = `${algoName}: Processing Algorithm`;
                 }
+                if (step.traceIndex !== undefined) {
+                    actionTitle += ` (trace step ${step.traceIndex + 1})`;
+                }
                 
                 explanationPanels.updateTitleContent(actionTitle);
             }
@@ -633,12 +643,35 @@ function createGraphVisualization(data, steps, algorithm, container) {
         }
     }
     
+    // Sampled traces (level of detail) fold the effects of skipped steps into the next
+    // kept step; keyframe steps fold the whole state up to that point
+    function applyFoldedEffects(step) {
+        if (step.keyframe) {
+            clearGraphState();
+        }
+        const folded = step.folded;
+        if (!folded) return;
+        const visited = new Set(folded.visited);
+        const completed = new Set(folded.completed);
+        const edges = new Set(folded.edges.map(edge => edge[0] + "->" + edge[1]));
+        node.filter(d => visited.has(d.id))
+            .attr("fill", colors.visitedNode);
+        node.filter(d => completed.has(d.id))
+            .attr("fill", colors.currentNode);
+        link.filter(d => edges.has(d.source.id + "->" + d.target.id) ||
+                (!data.directed && edges.has(d.target.id + "->" + d.source.id)))
+            .attr("stroke", colors.edgeHighlight)
+            .attr("stroke-width", 3);
+    }
+    
     function processStep(stepIndex, animate = true) {
         const step = steps[stepIndex];
         
-        if (algorithm === "dfs" || algorithm === "bfs") {
+        applyFoldedEffects(step);
+        
+        if (algorithm === "dfs" || algorithm === "bfs" || algorithm === "bidirectional_bfs") {
             processGraphTraversalStep(step, animate);
-        } else if (algorithm === "dijkstra") {
+        } else if (algorithm === "dijkstra" || algorithm === "bidirectional_dijkstra" || algorithm === "astar") {
             processDijkstraStep(step, animate);
         }
         
@@ -654,7 +687,7 @@ function createGraphVisualization(data, steps, algorithm, container) {
             node.filter(d => d.id === step.node)
                 .transition()
                 .duration(duration)
-                .attr("fill", colors.visitedNode);
+                .attr("fill", visitColor(step));
         } else if (step.type === "explore") {
             
             if (data.directed) {
@@ -699,6 +732,25 @@ function createGraphVisualization(data, steps, algorithm, container) {
                     .attr("stroke", colors.edgeHighlight)
                     .attr("stroke-width", 2);
             }
+        } else if (step.type === "level" && Array.isArray(step.frontier)) {
+            // Level-synchronous BFS: the whole level and its tree edges at once
+            const level = new Set(step.frontier);
+            const edges = new Set();
+            step.frontier.forEach((id, i) => {
+                if (step.parents[i] !== null) edges.add(step.parents[i] + "->" + id);
+            });
+            node.filter(d => level.has(d.id))
+                .transition()
+                .duration(duration)
+                .attr("fill", colors.visitedNode);
+            link.filter(d => edges.has(d.source.id + "->" + d.target.id) ||
+                    (!data.directed && edges.has(d.target.id + "->" + d.source.id)))
+                .transition()
+                .duration(duration)
+                .attr("stroke", colors.edgeHighlight)
+                .attr("stroke-width", 3);
+        } else if (step.type === "path") {
+            highlightPath(step, duration);
         }
     }
     
@@ -715,11 +767,14 @@ function createGraphVisualization(data, steps, algorithm, container) {
             node.filter(d => d.id === step.node)
                 .transition()
                 .duration(duration)
-                .attr("fill", colors.visitedNode);
+                .attr("fill", visitColor(step));
         } else if (step.type === "relax") {
             
+            // Backward searches relax in-edges, which run from step.to to step.from
+            const reversed = !data.directed || step.side === "backward";
             link.filter(d => 
-                    (d.source.id === step.from && d.target.id === step.to))
+                    (d.source.id === step.from && d.target.id === step.to) ||
+                    (reversed && d.source.id === step.to && d.target.id === step.from))
                 .transition()
                 .duration(duration)
                 .attr("stroke", colors.edgeHighlight)
@@ -736,19 +791,25 @@ function createGraphVisualization(data, steps, algorithm, container) {
                 .duration(duration)
                 .attr("fill", colors.currentNode);
         } else if (step.type === "path") {
-            
-            link.filter(d => 
-                    step.edges.some(edge => 
-                        (d.source.id === edge[0] && d.target.id === edge[1]) ||
-                        (d.source.id === edge[1] && d.target.id === edge[0])
-                    ))
-                    .transition()
-                    .duration(duration)
-                .attr("stroke", colors.shortestPathNode)
-                .attr("stroke-width", 4);
+            highlightPath(step, duration);
         }
     }
     
+    // Bidirectional searches color the nodes reached from the target differently
+    function visitColor(step) {
+        return step.side === "backward" ? colors.discoveredNode : colors.visitedNode;
+    }
+    
+    function highlightPath(step, duration) {
+        const edges = new Set(step.edges.map(edge => edge[0] + "->" + edge[1]));
+        link.filter(d => edges.has(d.source.id + "->" + d.target.id) ||
+                edges.has(d.target.id + "->" + d.source.id))
+            .transition()
+            .duration(duration)
+            .attr("stroke", colors.shortestPathNode)
+            .attr("stroke-width", 4);
+    }
+    
     
     function dragstarted(event, d) {
         if (!event.active) simulation.alphaTarget(0.3).restart();
@@ -1406,7 +1467,7 @@ function createGraphVisualization(data, steps, algorithm, container) {
             .text(d => d.id);
         
         
-        if (algorithm === "dijkstra") {
+        if (showsDistances) {
             distanceLabels = nodeGroup.append("g")
                 .attr("class", "distance-labels")
                 .selectAll("g")
@@ -1520,4 +1581,151 @@ function createGraphVisualization(data, steps, algorithm, container) {
 }
 
 
+const visitAction = step => `Visiting node ${step.node}`;
+// "frontier" is a node count, or the node list itself for the vectorized BFS backend
+const frontierSize = step => Array.isArray(step.frontier) ? step.frontier.length : step.frontier;
+const exploreAction = step => `Exploring edge from ${step.from} to ${step.to}`;
+const completeAction = step => `Completed exploration of node ${step.node}`;
+registerStepExplanations("dfs", {
+    visit: { action: visitAction, reason: "DFS selects an unvisited neighbor of the current node to explore next." },
+    explore: { action: exploreAction, reason: "DFS explores edges to find unvisited nodes." },
+    complete: { action: completeAction, reason: "All neighbors of this node have been visited, so DFS marks it as complete." },
+    backtrack: {
+        action: step => `Backtracking from ${step.from} to ${step.to}`,
+        reason: "DFS backtracks when it reaches a dead-end or a node with no unvisited neighbors."
+    }
+});
+registerStepExplanations("bfs", {
+    visit: { action: visitAction, reason: "BFS visits nodes in order of their distance from the start node." },
+    explore: { action: exploreAction, reason: "BFS explores all edges from a node before moving to the next level." },
+    complete: { action: completeAction, reason: "All neighbors of this node have been discovered, so BFS marks it as complete." },
+    level: {
+        action: step => Array.isArray(step.frontier)
+            ? `Level ${step.level}: found ${frontierSize(step)} node(s) at distance ${step.level} from the start`
+            : `Starting level ${step.level}: ${step.frontier} node(s) at distance ${step.level} from the start`,
+        reason: step => {
+            if (step.direction === "bottom-up") {
+                return `Bottom-up: every unvisited node looked for a parent in the previous level (${step.edgesChecked} edge(s) checked). ` +
+                    "This is cheaper than scanning the out-edges of a large frontier.";
+            }
+            if (step.direction === "top-down" && step.level > 0) {
+                return `Top-down: the out-edges of the previous level were scanned (${step.edgesChecked} edge(s) checked).`;
+            }
+            return "Every node of a level is expanded before any node of the next one.";
+        }
+    },
+    path: {
+        action: step => `Reached node ${step.target} after ${step.distance} edge(s)`,
+        reason: "BFS discovers nodes in order of distance, so it stops at the target with a path of fewest edges."
+    }
+});
+const sideName = step => step.side === "backward" ? "backward search (from the target)" : "forward search (from the start)";
+registerStepExplanations("bidirectional_bfs", {
+    visit: { action: step => `The ${sideName(step)} visits node ${step.node}`, reason: "Each search runs a BFS from its own end of the path." },
+    explore: {
+        action: step => `The ${sideName(step)} explores the edge between ${step.from} and ${step.to}`,
+        reason: step => step.side === "backward"
+            ? "The backward search follows edges against their direction, towards the start."
+            : "The forward search follows edges in their direction, towards the target."
+    },
+    complete: { action: completeAction, reason: "All neighbors of this node have been discovered on this side." },
+    level: {
+        action: step => `The ${sideName(step)} expands level ${step.level} (${step.frontier} node(s))`,
+        reason: "Expanding the smaller frontier keeps both searches small: each only has to reach about half the distance."
+    },
+    meet: {
+        action: step => `Node ${step.node} was reached by both searches`,
+        reason: "A node seen from both ends joins a forward and a backward path into a shortest path."
+    },
+    path: {
+        action: step => `Path to node ${step.target}: ${step.distance} edge(s)`,
+        reason: "The path follows the forward search's parents to the meeting node, then the backward search's to the target."
+    }
+});
+const dijkstraStepExplanations = {
+    distance: {
+        action: step => `Setting distance of node ${step.node} to ${step.distance}`,
+        reason: "Dijkstra's algorithm updates distances as it finds shorter paths."
+    },
+    visit: { action: visitAction, reason: "Dijkstra's algorithm always selects the unvisited node with the smallest distance." },
+    relax: {
+        action: step => step.success
+            ? `Relaxing edge from ${step.from} to ${step.to}: new distance ${step.newDistance}`
+            : `Tried relaxing edge from ${step.from} to ${step.to}, but no improvement`,
+        reason: step => step.success
+            ? `Found a shorter path to node ${step.to} through node ${step.from}.`
+            : `The current path to node ${step.to} is already optimal.`
+    },
+    complete: {
+        action: step => `Completed processing of node ${step.node}`,
+        reason: "All edges from this node have been considered for relaxation."
+    },
+    path: {
+        action: step => step.target !== undefined
+            ? `Shortest path to node ${step.target}: distance ${step.distance}`
+            : "Final shortest paths calculated",
+        reason: step => step.target !== undefined
+            ? "The target's distance is final once it is selected, so the search stops without settling farther nodes."
+            : "The algorithm has found the shortest path from the start node to all other nodes."
+    },
+    stats: {
+        action: step => `Priority queue (${step.queue}): ${step.pushes} pushes, ${step.pops} pops, ` +
+            `${step.stalePops} stale pops, ${step.decreaseKeys} decrease-keys`,
+        reason: "Decrease-key and bucket queues avoid the stale entries a lazy binary heap has to skip."
+    }
+};
+registerStepExplanations("dijkstra", dijkstraStepExplanations);
+// A* shares Dijkstra's steps; only the selection order and the statistics differ
+registerStepExplanations("astar", Object.assign({}, dijkstraStepExplanations, {
+    visit: {
+        action: visitAction,
+        reason: "A* selects the node with the smallest distance so far plus estimated distance to the target."
+    },
+    // dijkstraSettled and settledSaved are only present when the run compared against Dijkstra
+    stats: {
+        action: step => `A* (${step.heuristic}) settled ${step.settled} node(s)` +
+            (step.dijkstraSettled !== undefined ? `; Dijkstra settles ${step.dijkstraSettled}` : ""),
+        reason: step => {
+            if (step.settledSaved === undefined) {
+                return "Each node settled before the target is one the estimate could not rule out.";
+            }
+            return step.settledSaved > 0
+                ? `The heuristic saved ${step.settledSaved} node(s) by steering the search towards the target.`
+                : "The estimate did not rule out any node Dijkstra would settle for this target.";
+        }
+    }
+}));
+registerStepExplanations("bidirectional_dijkstra", {
+    distance: {
+        action: step => `The ${sideName(step)} sets the distance of node ${step.node} to ${step.distance}`,
+        reason: "Each search keeps its own distances: from the start, or to the target."
+    },
+    visit: {
+        action: step => `The ${sideName(step)} selects node ${step.node}`,
+        reason: "Each step advances the search with the smaller queue by its closest unsettled node."
+    },
+    relax: {
+        action: step => step.success
+            ? `The ${sideName(step)} relaxes the edge between ${step.from} and ${step.to}: new distance ${step.newDistance}`
+            : `The ${sideName(step)} tried the edge between ${step.from} and ${step.to}, but no improvement`,
+        reason: "A relaxation reaching a node labelled by the other search may also shorten the best path found so far."
+    },
+    complete: {
+        action: step => `The ${sideName(step)} settled node ${step.node}`,
+        reason: "Once a node is settled by both searches, no unexplored path can beat the best one found."
+    },
+    meet: {
+        action: step => `The best path runs through node ${step.node}`,
+        reason: "It is the node where the shortest forward and backward distances add up to the smallest total."
+    },
+    path: {
+        action: step => `Shortest path to node ${step.target}: distance ${step.distance}`,
+        reason: "The forward parents lead from the start to the meeting node, the backward parents from there to the target."
+    },
+    stats: {
+        action: step => `Both queues (${step.queue}): ${step.pushes} pushes, ${step.pops} pops, ${step.settled} nodes settled`,
+        reason: "Two searches that meet in the middle usually settle fewer nodes than one search from the start."
+    }
+});
+
 window.createGraphVisualization = createGraphVisualization;
\ No newline at end of file
@@ -1,6 +1,6 @@
 /**
  * Sorting visualization module using D3.js
- * Visualizes sorting algorithms: QuickSort
+ * Visualizes sorting algorithms: QuickSort, Merge Sort, Heapsort, Timsort, Radix Sort, Shell Sort
  */
 
 
@@ -24,6 +24,7 @@ function createSortingVisualization(data, steps, algorithm, container) {
         pivot: "#ff5722", 
         comparing: "#ffeb3b", 
         swapping: "#9c27b0", 
+        writing: "#e91e63",
         sorted: "#4caf50", 
         text: "#000000", 
         axisLine: "#ccc",  
@@ -147,6 +148,38 @@ function createSortingVisualization(data, steps, algorithm, container) {
     let currentArray = [...initialData];
     
     
+    // Steps are delta-encoded: keyframe steps carry a full "array" snapshot,
+    // the others only a flat [index, value, ...] "writes" list. The array for
+    // any step is rebuilt on demand from a cursor or the nearest keyframe.
+    let cursorIndex = -1;
+    let cursorArray = [...initialData];
+    
+    function arrayAtStep(stepIndex) {
+        if (stepIndex < cursorIndex) {
+            let k = stepIndex;
+            while (k >= 0 && !steps[k].array) k--;
+            cursorIndex = k;
+            cursorArray = k >= 0 ? [...steps[k].array] : [...initialData];
+        }
+        while (cursorIndex < stepIndex) {
+            cursorIndex++;
+            const step = steps[cursorIndex];
+            if (step.array) {
+                cursorArray = [...step.array];
+            } else if (step.writes) {
+                for (let w = 0; w < step.writes.length; w += 2) {
+                    cursorArray[step.writes[w]] = step.writes[w + 1];
+                }
+            }
+        }
+        return cursorArray;
+    }
+    
+    function stepWithArray(stepIndex) {
+        return normalizeSortingStep(algorithm, Object.assign({}, steps[stepIndex], { array: [...arrayAtStep(stepIndex)] }));
+    }
+    
+    
     const explanationPanels = window.createExplanationPanels(container);
     
     
@@ -236,38 +269,47 @@ function createSortingVisualization(data, steps, algorithm, container) {
     const quicksortOptions = document.createElement('div');
     quicksortOptions.className = 'quicksort-options';
     
-    if (algorithm.toLowerCase().includes('quicksort')) {
-        const pivotLabel = document.createElement('div');
-        pivotLabel.innerHTML = `<span style="color:${colors.pivot}">■</span> Pivot`;
-        pivotLabel.style.margin = '5px';
-        pivotLabel.style.display = 'inline-block';
-        pivotLabel.style.color = colors.text;
-        
-        const comparingLabel = document.createElement('div');
-        comparingLabel.innerHTML = `<span style="color:${colors.comparing}">■</span> Comparing`;
-        comparingLabel.style.margin = '5px';
-        comparingLabel.style.display = 'inline-block';
-        comparingLabel.style.color = colors.text;
-        
-        const swappingLabel = document.createElement('div');
-        swappingLabel.innerHTML = `<span style="color:${colors.swapping}">■</span> Swapping`;
-        swappingLabel.style.margin = '5px';
-        swappingLabel.style.display = 'inline-block';
-        swappingLabel.style.color = colors.text;
-        
-        const sortedLabel = document.createElement('div');
-        sortedLabel.innerHTML = `<span style="color:${colors.sorted}">■</span> Sorted`;
-        sortedLabel.style.margin = '5px';
-        sortedLabel.style.display = 'inline-block';
-        sortedLabel.style.color = colors.text;
-        
+    const pivotLabel = document.createElement('div');
+    pivotLabel.innerHTML = `<span style="color:${colors.pivot}">■</span> Pivot`;
+    pivotLabel.style.margin = '5px';
+    pivotLabel.style.display = 'inline-block';
+    pivotLabel.style.color = colors.text;
+    
+    const writingLabel = document.createElement('div');
+    writingLabel.innerHTML = `<span style="color:${colors.writing}">■</span> Writing`;
+    writingLabel.style.margin = '5px';
+    writingLabel.style.display = 'inline-block';
+    writingLabel.style.color = colors.text;
+    
+    const comparingLabel = document.createElement('div');
+    comparingLabel.innerHTML = `<span style="color:${colors.comparing}">■</span> Comparing`;
+    comparingLabel.style.margin = '5px';
+    comparingLabel.style.display = 'inline-block';
+    comparingLabel.style.color = colors.text;
+    
+    const swappingLabel = document.createElement('div');
+    swappingLabel.innerHTML = `<span style="color:${colors.swapping}">■</span> Swapping`;
+    swappingLabel.style.margin = '5px';
+    swappingLabel.style.display = 'inline-block';
+    swappingLabel.style.color = colors.text;
+    
+    const sortedLabel = document.createElement('div');
+    sortedLabel.innerHTML = `<span style="color:${colors.sorted}">■</span> Sorted`;
+    sortedLabel.style.margin = '5px';
+    sortedLabel.style.display = 'inline-block';
+    sortedLabel.style.color = colors.text;
+    
+    if (algorithm === 'quicksort') {
         quicksortOptions.appendChild(pivotLabel);
-        quicksortOptions.appendChild(comparingLabel);
-        quicksortOptions.appendChild(swappingLabel);
-        quicksortOptions.appendChild(sortedLabel);
-        
-        container.appendChild(quicksortOptions);
     }
+    quicksortOptions.appendChild(comparingLabel);
+    quicksortOptions.appendChild(swappingLabel);
+    if (['merge_sort', 'timsort', 'radix_sort'].includes(algorithm)) {
+        quicksortOptions.appendChild(writingLabel);
+    }
+    quicksortOptions.appendChild(sortedLabel);
+    
+    container.appendChild(quicksortOptions);
     
     function togglePlay() {
         isPlaying = !isPlaying;
@@ -325,7 +367,7 @@ function createSortingVisualization(data, steps, algorithm, container) {
             
             
             
-            const step = steps[currentStepIndex];
+            const step = stepWithArray(currentStepIndex);
             
             
             if (step.array) {
@@ -372,16 +414,24 @@ function createSortingVisualization(data, steps, algorithm, container) {
         }
 
         
-        let algoName = 'QuickSort';
+        let algoName = sortingAlgorithmNames[algorithm] || algorithm;
         
         
         let actionTitle = '';
         if (step.type === "pivot") {
-            actionTitle = `${algoName}: Selecting Pivot (${step.array[step.pivot]})`;
-        } else if (step.type === "compare") {
+            actionTitle = `${algoName}: Selecting Pivot (${step.array[step.range[1]]})`;
+        } else if (step.type === "three_way_pivot" || step.type === "hoare_pivot") {
+            actionTitle = `${algoName}: Selecting Pivot (${step.pivotValue})`;
+        } else if (["compare", "three_way_compare", "hoare_scan"].includes(step.type)) {
             actionTitle = `${algoName}: Comparing Elements`;
-        } else if (step.type === "swap") {
+        } else if (["swap", "three_way_swap", "hoare_swap"].includes(step.type)) {
             actionTitle = `${algoName}: Swapping Elements`;
+        } else if (step.type === "split") {
+            actionTitle = `${algoName}: Partition Split after Index ${step.split}`;
+        } else if (step.type === "stats") {
+            actionTitle = `${algoName}: Run Statistics`;
+        } else if (step.type === "heapsort") {
+            actionTitle = `${algoName}: Depth Limit Reached, Heapsort [${step.range[0]}...${step.range[1]}]`;
         } else if (step.type === "sorted") {
             if (step.sorted.length === step.array.length) {
                 actionTitle = `${algoName}: Array Sorted Successfully`;
@@ -390,131 +440,51 @@ function createSortingVisualization(data, steps, algorithm, container) {
             }
         } else if (step.type === "range") {
             actionTitle = `${algoName}: Processing Subarray [${step.range[0]}...${step.range[1]}]`;
+        } else if (step.type === "pass") {
+            actionTitle = `${algoName}: Merging Runs of Width ${step.width}`;
+        } else if (step.type === "merge") {
+            actionTitle = `${algoName}: Merging [${step.range[0]}...${step.mid - 1}] and [${step.mid}...${step.range[1]}]`;
+        } else if (step.type === "write") {
+            actionTitle = `${algoName}: Writing Index ${step.writing[0]}`;
+        } else if (step.type === "run") {
+            actionTitle = `${algoName}: ${step.descending ? "Descending" : "Ascending"} Run [${step.range[0]}...${step.range[1]}]`;
+        } else if (step.type === "insert") {
+            actionTitle = `${algoName}: Binary Insertion at Index ${step.inserting[0]}`;
+        } else if (step.type === "heapify") {
+            actionTitle = `${algoName}: Building the Max-Heap`;
+        } else if (step.type === "digit") {
+            actionTitle = `${algoName}: Sorting by Digit ${step.digit + 1} (${step.place}s)`;
+        } else if (step.type === "read") {
+            actionTitle = `${algoName}: Counting Bucket ${step.bucket}`;
+        } else if (step.type === "gap") {
+            actionTitle = `${algoName}: Gap ${step.gap}`;
         } else {
             actionTitle = `${algoName}: Step ${currentStepIndex + 1}`;
         }
         
-        explanationPanels.updateTitleContent(actionTitle);
-        
-        
-        if (step.action) {
-            explanationPanels.updateStepContent(`<p><strong>${step.action}</strong></p>`);
-        } else {
-            explanationPanels.updateStepContent(createStepDescription(step));
+        if (step.traceIndex !== undefined) {
+            actionTitle += ` (trace step ${step.traceIndex + 1})`;
         }
+        explanationPanels.updateTitleContent(actionTitle);
         
         
-        if (step.reason && step.reason.trim() !== "") {
-            explanationPanels.updateReasonContent(`<p>${step.reason}</p>`);
-        } else if (step.type === "compare" && step.i_pointer !== undefined && step.j_pointer !== undefined) {
-            const compareVal = step.array[step.j_pointer];
-            let pivotVal;
-            
-            if (step.comparing && step.comparing.length > 1) {
-                pivotVal = step.array[step.comparing[1]];
-                explanationPanels.updateReasonContent(`<p>Comparing element ${compareVal} (j=${step.j_pointer}) with pivot ${pivotVal}. If ${compareVal} ≤ ${pivotVal}, i will advance and we'll swap elements.</p>`);
-            } else {
-                explanationPanels.updateReasonContent(`<p>Comparing element at position j=${step.j_pointer}. Current partition boundary is at i=${step.i_pointer}.</p>`);
-            }
-        } else if (step.type === "swap") {
-            
-            const values = step.swapping.map(idx => step.array[idx]);
-            let pivotValue;
-            
-            
-            if (step.comparing && step.comparing.length > 1) {
-                pivotValue = step.array[step.comparing[1]];
-            } else {
-                
-                for (let i = currentStepIndex; i >= 0; i--) {
-                    if (steps[i].pivot !== undefined) {
-                        pivotValue = steps[i].array[steps[i].pivot];
-                        break;
-                    }
-                }
-            }
-            
-            let pointerInfo = "";
-            if (step.i_pointer !== undefined && step.j_pointer !== undefined) {
-                if (step.swapping[0] === step.i_pointer && step.swapping[1] === step.j_pointer) {
-                    pointerInfo = ` (i=${step.i_pointer}, j=${step.j_pointer})`;
-                }
-            }
-            
-            if (pivotValue !== undefined) {
-                if (values[0] <= pivotValue && values[1] > pivotValue) {
-                    explanationPanels.updateReasonContent(`<p>Swapped ${values[0]} and ${values[1]}${pointerInfo} because ${values[0]} ≤ pivot (${pivotValue}) and should move left.</p>`);
-                } else if (values[1] <= pivotValue && values[0] > pivotValue) {
-                    explanationPanels.updateReasonContent(`<p>Swapped ${values[0]} and ${values[1]}${pointerInfo} because ${values[1]} ≤ pivot (${pivotValue}) and should move left.</p>`);
-                } else if (step.swapping[1] === step.range[1]) {
-                    explanationPanels.updateReasonContent(`<p>Final swap: placing pivot ${pivotValue} at its correct sorted position.</p>`);
-                } else {
-                    explanationPanels.updateReasonContent(`<p>Swapped ${values[0]} and ${values[1]}${pointerInfo} to reposition elements around pivot (${pivotValue}).</p>`);
-                }
-            } else {
-                explanationPanels.updateReasonContent(`<p>Swapped ${values[0]} and ${values[1]}${pointerInfo} to arrange elements in sorted order.</p>`);
-            }
-        } else if (step.type === "pivot") {
-            explanationPanels.updateReasonContent(`<p>The pivot element is used to partition the array into two sections.</p>`);
-        } else if (step.type === "sorted") {
-            if (step.sorted.length === step.array.length) {
-                explanationPanels.updateReasonContent(`<p>All elements are now in their correct positions.</p>`);
-            } else {
-                explanationPanels.updateReasonContent(`<p>This element has found its final sorted position and won't be moved again.</p>`);
-            }
-        } else {
-            
-            explanationPanels.updateReasonContent("");
-        }
+        const explanation = explainStep(algorithm, step, { stepIndex: currentStepIndex });
+        explanationPanels.updateStepContent(`<p>${explanation.action}</p>`);
+        explanationPanels.updateReasonContent(explanation.reason ? `<p>${explanation.reason}</p>` : "");
     }
     
     function processStep(stepIndex, animate = true) {
-        const step = steps[stepIndex];
+        const step = stepWithArray(stepIndex);
         
         
         updateExplanations(step);
         
         
-        processQuicksortStep(step, animate);
-    }
-    
-    
-    function createStepDescription(step) {
-        switch (step.type) {
-            case 'pivot':
-                return `<p><strong>Selected pivot:</strong> Value ${step.array[step.pivot]} at index ${step.pivot}</p>`;
-            case 'compare':
-                return `<p><strong>Comparing:</strong> Value ${step.array[step.comparing[0]]} at index ${step.comparing[0]} with pivot value ${step.array[step.comparing[1]]} at index ${step.comparing[1]}</p>`;
-            case 'swap':
-                return `<p><strong>Swapping elements:</strong> Value ${step.array[step.swapping[0]]} at index ${step.swapping[0]} with value ${step.array[step.swapping[1]]} at index ${step.swapping[1]}</p>`;
-            case 'sorted':
-                if (step.sorted.length === step.array.length) {
-                    return `<p><strong>Array is now fully sorted!</strong></p>`;
-                } else {
-                    const elements = step.sorted.map(i => `${step.array[i]} (index ${i})`).join(', ');
-                    return `<p><strong>Element(s) in final position:</strong> ${elements}</p>`;
-                }
-            case 'range':
-                
-                let pivotInfo = "";
-                for (let i = 0; i < step.array.length; i++) {
-                    if (i >= step.range[0] && i <= step.range[1] && step.pivotIndex === i) {
-                        pivotInfo = ` (pivot at index ${i}, value ${step.array[i]})`;
-                        break;
-                    }
-                }
-                return `<p><strong>Processing subarray:</strong> From index ${step.range[0]} to ${step.range[1]}${pivotInfo}</p>`;
-            default:
-                return `<p>Step ${currentStepIndex + 1}</p>`;
-        }
+        processArrayStep(step, animate);
     }
     
     
-    function createReasonDescription(step) {
-        return "";
-    }
-    
-    function processQuicksortStep(step, animate) {
+    function processArrayStep(step, animate) {
         
         bars.attr("fill", colors.bar);
         
@@ -557,6 +527,23 @@ function createSortingVisualization(data, steps, algorithm, container) {
         }
         
         
+        if (step.reading) {
+            step.reading.forEach(index => {
+                bars.filter((d, i) => i === index)
+                    .attr("fill", colors.comparing);
+            });
+        }
+        
+        
+        const written = step.writing || step.inserting;
+        if (written) {
+            written.forEach(index => {
+                bars.filter((d, i) => i === index)
+                    .attr("fill", colors.writing);
+            });
+        }
+        
+        
         if (step.sorted) {
             step.sorted.forEach(index => {
                 bars.filter((d, i) => i === index)
@@ -569,59 +556,41 @@ function createSortingVisualization(data, steps, algorithm, container) {
     }
     
     
+    // Pointer fields drawn as arrows above the bars: [field, label, color]
+    const pointerArrows = [
+        ["i_pointer", "i", "#FF5722"],
+        ["j_pointer", "j", "#2196F3"],
+        ["lt_pointer", "lt", "#4CAF50"],
+        ["gt_pointer", "gt", "#9C27B0"]
+    ];
+    
     function addPointerArrows(step) {
-        
-        if (step.i_pointer !== undefined || step.j_pointer !== undefined) {
+        // Pointers that share a position are stacked so their labels stay readable
+        const stacked = {};
+        pointerArrows.forEach(([field, label, color]) => {
+            const index = step[field];
+            if (index === undefined || index < -1) return;
+            const xPos = index >= 0 ? xScale(index) + xScale.bandwidth() / 2 : xScale(0) - xScale.bandwidth() / 2;
+            const lift = 22 * (stacked[index] || 0);
+            stacked[index] = (stacked[index] || 0) + 1;
             
-            if (step.i_pointer !== undefined && step.i_pointer >= -1) {
-                const iIndex = step.i_pointer;
-                const xPos = iIndex >= 0 ? xScale(iIndex) + xScale.bandwidth() / 2 : xScale(0) - xScale.bandwidth() / 2;
-                
-                
-                g.append("path")
-                    .attr("class", "pointer-arrow")
-                    .attr("d", `M${xPos},${-50} L${xPos},${-30} L${xPos-6},${-36} M${xPos},${-30} L${xPos+6},${-36}`)
-                    .attr("stroke", "#FF5722")
-                    .attr("stroke-width", 3)
-                    .attr("fill", "none");
-                
-                
-                g.append("text")
-                    .attr("class", "pointer-arrow")
-                    .attr("x", xPos)
-                    .attr("y", -60)
-                    .attr("text-anchor", "middle")
-                    .attr("fill", "#FF5722")
-                    .attr("font-weight", "bold")
-                    .attr("font-size", "14px")
-                    .text("i=" + iIndex);
-            }
+            g.append("path")
+                .attr("class", "pointer-arrow")
+                .attr("d", `M${xPos},${-50 - lift} L${xPos},${-30 - lift} L${xPos-6},${-36 - lift} M${xPos},${-30 - lift} L${xPos+6},${-36 - lift}`)
+                .attr("stroke", color)
+                .attr("stroke-width", 3)
+                .attr("fill", "none");
             
-            
-            if (step.j_pointer !== undefined) {
-                const jIndex = step.j_pointer;
-                const xPos = xScale(jIndex) + xScale.bandwidth() / 2;
-                
-                
-                g.append("path")
-                    .attr("class", "pointer-arrow")
-                    .attr("d", `M${xPos},${-50} L${xPos},${-30} L${xPos-6},${-36} M${xPos},${-30} L${xPos+6},${-36}`)
-                    .attr("stroke", "#2196F3")
-                    .attr("stroke-width", 3)
-                    .attr("fill", "none");
-                
-                
-                g.append("text")
-                    .attr("class", "pointer-arrow")
-                    .attr("x", xPos)
-                    .attr("y", -60)
-                    .attr("text-anchor", "middle")
-                    .attr("fill", "#2196F3")
-                    .attr("font-weight", "bold")
-                    .attr("font-size", "14px")
-                    .text("j=" + jIndex);
-            }
-        }
+            g.append("text")
+                .attr("class", "pointer-arrow")
+                .attr("x", xPos)
+                .attr("y", -60 - lift)
+                .attr("text-anchor", "middle")
+                .attr("fill", color)
+                .attr("font-weight", "bold")
+                .attr("font-size", "14px")
+                .text(label + "=" + index);
+        });
     }
     
     function updateBars(newData, animate = true) {
@@ -823,4 +792,281 @@ function createSortingVisualization(data, steps, algorithm, container) {
 }
 
 
-window.createSortingVisualization = createSortingVisualization;
\ No newline at end of file
+// Display names of the algorithms in algorithms.sorting.SORTING_ALGORITHMS
+const sortingAlgorithmNames = {
+    quicksort: "QuickSort",
+    merge_sort: "Merge Sort",
+    heapsort: "Heapsort",
+    timsort: "Timsort",
+    radix_sort: "Radix Sort",
+    shell_sort: "Shell Sort"
+};
+
+// Quicksort partition steps leave out the pointers their own indices give (see
+// algorithms.sorting.iter_quicksort); they are restored here in O(1) per step
+function normalizeSortingStep(algorithm, step) {
+    if (algorithm !== "quicksort" || isHeapStep(step)) return step;
+    if (step.type === "compare") {
+        step.j_pointer = step.comparing[0];
+    } else if (step.type === "swap") {
+        // The final swap places the pivot at swapping[0] = i + 1
+        step.i_pointer = step.swapping[0] === step.pivot ? step.swapping[0] - 1 : step.swapping[0];
+        step.j_pointer = step.swapping[1];
+    } else if (step.type === "hoare_swap") {
+        [step.i_pointer, step.j_pointer] = step.swapping;
+    } else if (step.type === "three_way_compare") {
+        step.i_pointer = step.comparing[0];
+    }
+    return step;
+}
+// Lomuto swaps carry the pivot's index: the end of the range, or its sorted position
+// for the final swap
+function quicksortPivotValue(step) {
+    return step.array[step.pivot];
+}
+// Ranges past the introsort depth limit are heapsorted with iter_heapsort's steps, whose
+// compares and swaps carry the heap range; they are explained as in heapsort
+function isHeapStep(step) {
+    return step.range !== undefined;
+}
+function heapExplanation(part, fallback) {
+    return (step, context) => isHeapStep(step)
+        ? explainStep("heapsort", step, context)[part]
+        : (typeof fallback === "function" ? fallback(step, context) : fallback);
+}
+registerStepExplanations("quicksort", {
+    pivot: {
+        action: step => `<strong>Selected pivot:</strong> Value ${step.array[step.range[1]]} at index ${step.pivot}`,
+        reason: "The pivot element is used to partition the array into two sections."
+    },
+    compare: {
+        action: heapExplanation("action", step => `<strong>Comparing:</strong> Value ${step.array[step.comparing[0]]} at index ${step.comparing[0]} ` +
+            `with pivot value ${step.array[step.comparing[1]]} at index ${step.comparing[1]}`),
+        reason: heapExplanation("reason", step => {
+            const compareVal = step.array[step.j_pointer];
+            const pivotVal = step.array[step.comparing[1]];
+            return `Comparing element ${compareVal} (j=${step.j_pointer}) with pivot ${pivotVal}. ` +
+                `If ${compareVal} ≤ ${pivotVal}, i will advance and we'll swap elements.`;
+        })
+    },
+    swap: {
+        action: heapExplanation("action", step => `<strong>Swapping elements:</strong> Value ${step.array[step.swapping[0]]} at index ${step.swapping[0]} ` +
+            `with value ${step.array[step.swapping[1]]} at index ${step.swapping[1]}`),
+        reason: heapExplanation("reason", step => {
+            const values = step.swapping.map(idx => step.array[idx]);
+            const pivotValue = quicksortPivotValue(step);
+            let pointerInfo = "";
+            if (step.swapping[0] === step.i_pointer && step.swapping[1] === step.j_pointer) {
+                pointerInfo = ` (i=${step.i_pointer}, j=${step.j_pointer})`;
+            }
+            if (values[0] <= pivotValue && values[1] > pivotValue) {
+                return `Swapped ${values[0]} and ${values[1]}${pointerInfo} because ${values[0]} ≤ pivot (${pivotValue}) and should move left.`;
+            } else if (values[1] <= pivotValue && values[0] > pivotValue) {
+                return `Swapped ${values[0]} and ${values[1]}${pointerInfo} because ${values[1]} ≤ pivot (${pivotValue}) and should move left.`;
+            } else if (step.swapping[0] === step.pivot) {
+                return `Final swap: placing pivot ${pivotValue} at its correct sorted position.`;
+            }
+            return `Swapped ${values[0]} and ${values[1]}${pointerInfo} to reposition elements around pivot (${pivotValue}).`;
+        })
+    },
+    sorted: {
+        action: step => {
+            if (step.sorted.length === step.array.length) {
+                return `<strong>Array is now fully sorted!</strong>`;
+            }
+            const elements = step.sorted.map(i => `${step.array[i]} (index ${i})`).join(', ');
+            return `<strong>Element(s) in final position:</strong> ${elements}`;
+        },
+        reason: step => step.sorted.length === step.array.length
+            ? "All elements are now in their correct positions."
+            : "This element has found its final sorted position and won't be moved again."
+    },
+    range: {
+        action: step => `<strong>Processing subarray:</strong> From index ${step.range[0]} to ${step.range[1]}`
+    },
+    three_way_pivot: {
+        action: step => `<strong>Selected pivot:</strong> Value ${step.pivotValue} at index ${step.pivot}`,
+        reason: "Three-way partitioning splits the range into values less than, equal to and greater than the pivot."
+    },
+    three_way_compare: {
+        action: step => `<strong>Comparing:</strong> Value ${step.array[step.comparing[0]]} at index ${step.comparing[0]} ` +
+            `with pivot value ${step.pivotValue}`,
+        reason: step => {
+            const value = step.array[step.comparing[0]];
+            if (step.outcome < 0) return `${value} < ${step.pivotValue}: it joins the "less" block at lt=${step.lt_pointer}, and both lt and i advance.`;
+            if (step.outcome > 0) return `${value} > ${step.pivotValue}: it is swapped to gt=${step.gt_pointer}, and gt moves left.`;
+            return `${value} equals the pivot: it stays in the "equal" block and i advances.`;
+        }
+    },
+    three_way_swap: {
+        action: step => `<strong>Swapping elements:</strong> index ${step.swapping[0]} with index ${step.swapping[1]}`,
+        reason: "The swap grows the block of smaller or larger elements at the edges of the range."
+    },
+    hoare_pivot: {
+        action: step => `<strong>Selected pivot:</strong> Value ${step.pivotValue}, moved to index ${step.pivot}`,
+        reason: "Hoare partitioning scans from both ends towards the middle, comparing against the pivot value."
+    },
+    hoare_scan: {
+        action: step => `<strong>Scanning:</strong> Value ${step.array[step.comparing[0]]} at index ${step.comparing[0]} ` +
+            `against pivot value ${step.pivotValue}`,
+        reason: step => step.comparing[0] === step.i_pointer
+            ? `i stops at the first value ≥ ${step.pivotValue}.`
+            : `j stops at the first value ≤ ${step.pivotValue}.`
+    },
+    hoare_swap: {
+        action: step => `<strong>Swapping elements:</strong> Value ${step.array[step.swapping[1]]} at index ${step.swapping[0]} ` +
+            `with value ${step.array[step.swapping[0]]} at index ${step.swapping[1]}`,
+        reason: "Both pointers stopped on values on the wrong side of the pivot, so they are exchanged."
+    },
+    split: {
+        action: step => `<strong>Partition complete:</strong> [${step.range[0]}...${step.split}] and [${step.split + 1}...${step.range[1]}]`,
+        reason: "The pointers crossed. Every value on the left is ≤ the pivot and every value on the right is ≥ it."
+    },
+    heapsort: {
+        action: step => `<strong>Switching to heapsort:</strong> From index ${step.range[0]} to ${step.range[1]} at depth ${step.depth}`,
+        reason: "The recursion exceeded the introsort depth limit, so this range is heapsorted to bound the worst case."
+    },
+    stats: {
+        action: step => `<strong>${step.pivotMethod} pivot, ${step.partitionMethod} partition:</strong> ` +
+            `${step.comparisons} comparisons, ${step.swaps} swaps, max depth ${step.maxDepth}`,
+        reason: step => `${step.partitions} partitions with mean balance ${step.partitionBalance} ` +
+            `(smaller side / larger side; 1 means even halves)` +
+            (step.heapsortRanges ? `, ${step.heapsortRanges} range(s) finished by heapsort.` : ".")
+    },
+    heapify: {
+        action: heapExplanation("action"),
+        reason: heapExplanation("reason")
+    },
+    default: {
+        action: (step, context) => `Step ${context.stepIndex + 1}`
+    }
+});
+
+window.createSortingVisualization = createSortingVisualization;
+// Steps shared by the algorithms built on algorithms.instrumented.InstrumentedArray
+const arrayStepExplanations = {
+    compare: {
+        action: step => `<strong>Comparing:</strong> Value ${step.array[step.comparing[0]]} at index ${step.comparing[0]} ` +
+            `with value ${step.array[step.comparing[1]]} at index ${step.comparing[1]}`
+    },
+    swap: {
+        action: step => `<strong>Swapping elements:</strong> Value ${step.array[step.swapping[1]]} at index ${step.swapping[0]} ` +
+            `with value ${step.array[step.swapping[0]]} at index ${step.swapping[1]}`
+    },
+    write: {
+        action: step => `<strong>Writing:</strong> Value ${step.array[step.writing[0]]} to index ${step.writing[0]}`
+    },
+    sorted: {
+        action: step => {
+            if (step.sorted.length === step.array.length) {
+                return `<strong>Array is now fully sorted!</strong>`;
+            }
+            const elements = step.sorted.map(i => `${step.array[i]} (index ${i})`).join(', ');
+            return `<strong>Element(s) in final position:</strong> ${elements}`;
+        },
+        reason: step => step.sorted.length === step.array.length
+            ? "All elements are now in their correct positions."
+            : "This element has found its final sorted position and won't be moved again."
+    },
+    stats: {
+        action: step => `<strong>${sortingAlgorithmNames[step.algorithm] || step.algorithm}:</strong> ` +
+            `${step.comparisons} comparisons, ${step.swaps} swaps, ${step.elementReads} reads, ${step.elementWrites} writes`,
+        reason: "Reads and writes count every array access, including the ones made by comparisons and swaps."
+    },
+    default: {
+        action: (step, context) => `Step ${context.stepIndex + 1}`
+    }
+};
+registerStepExplanations("merge_sort", Object.assign({}, arrayStepExplanations, {
+    pass: {
+        action: step => `<strong>New pass:</strong> Merging neighbouring sorted runs of width ${step.width}`,
+        reason: "Bottom-up merge sort doubles the run width on every pass until one run covers the array."
+    },
+    merge: {
+        action: step => `<strong>Merging:</strong> [${step.range[0]}...${step.mid - 1}] with [${step.mid}...${step.range[1]}]`,
+        reason: "If the last value of the left run is not larger than the first of the right run, the runs are already in order."
+    },
+    compare: Object.assign({}, arrayStepExplanations.compare, {
+        reason: "The smaller value goes to the scratch buffer next; on ties the left value goes first, keeping the sort stable."
+    }),
+    write: Object.assign({}, arrayStepExplanations.write, {
+        reason: "Merged values are copied back from the scratch buffer, which is allocated once and reused by every merge."
+    }),
+    stats: Object.assign({}, arrayStepExplanations.stats, {
+        reason: step => `${step.passes} passes over the array. Merge sort makes no swaps; values move through the scratch buffer.`
+    })
+}));
+registerStepExplanations("heapsort", Object.assign({}, arrayStepExplanations, {
+    heapify: {
+        action: step => `<strong>Building a max-heap:</strong> From index ${step.range[0]} to ${step.range[1]}`,
+        reason: "Sifting down every parent from the last one to the root puts the largest value at index 0."
+    },
+    compare: Object.assign({}, arrayStepExplanations.compare, {
+        reason: "Sifting down keeps the largest value of the heap at the root."
+    }),
+    swap: Object.assign({}, arrayStepExplanations.swap, {
+        reason: step => step.swapping[0] === step.range[0] && step.swapping[1] === step.range[1]
+            ? "The heap's maximum moves to the end of the unsorted part."
+            : "A child larger than its parent moves up the heap."
+    })
+}));
+registerStepExplanations("timsort", Object.assign({}, arrayStepExplanations, {
+    run: {
+        action: step => `<strong>Found a ${step.descending ? "descending" : "ascending"} run:</strong> ` +
+            `From index ${step.range[0]} to ${step.range[1]}`,
+        reason: step => step.descending
+            ? "Strictly descending runs are reversed in place, which keeps equal values in order."
+            : "Timsort takes the ordered stretches already present in the data as its initial runs."
+    },
+    compare: Object.assign({}, arrayStepExplanations.compare, {
+        reason: "Neighbouring values are compared to find where the current run ends; inside a short run, " +
+            "binary search compares the next value with the middle of the sorted part."
+    }),
+    insert: {
+        action: step => `<strong>Inserting:</strong> Value ${step.array[step.inserting[0]]} from index ${step.source} ` +
+            `at index ${step.inserting[0]}`,
+        reason: "Short runs are extended to the minimum run length by binary insertion, shifting larger values right."
+    },
+    merge: {
+        action: step => `<strong>Merging runs:</strong> [${step.range[0]}...${step.mid - 1}] with [${step.mid}...${step.range[1]}]`,
+        reason: "Runs are merged when the run stack breaks Timsort's length invariants, which keeps merges balanced."
+    },
+    write: Object.assign({}, arrayStepExplanations.write, {
+        reason: "Merged values are copied back from the scratch buffer."
+    }),
+    stats: Object.assign({}, arrayStepExplanations.stats, {
+        reason: step => `${step.runs} runs with a minimum run length of ${step.minRun}.`
+    })
+}));
+registerStepExplanations("radix_sort", Object.assign({}, arrayStepExplanations, {
+    digit: {
+        action: step => `<strong>Digit pass ${step.digit + 1}:</strong> Sorting by the ${step.place}s digit (base ${step.base})`,
+        reason: "Each pass is a stable counting sort, so the order from earlier (less significant) digits is kept for ties."
+    },
+    read: {
+        action: step => `<strong>Reading:</strong> Value ${step.array[step.reading[0]]} at index ${step.reading[0]} goes to bucket ${step.bucket}`,
+        reason: "The bucket sizes give each bucket's starting position in the output."
+    },
+    write: {
+        action: step => `<strong>Writing:</strong> Value ${step.array[step.writing[0]]} from bucket ${step.bucket} to index ${step.writing[0]}`,
+        reason: "Values are written back bucket by bucket, in their previous order within each bucket."
+    },
+    stats: Object.assign({}, arrayStepExplanations.stats, {
+        reason: step => `${step.passes} digit passes in base ${step.base}. Radix sort never compares two values.`
+    })
+}));
+registerStepExplanations("shell_sort", Object.assign({}, arrayStepExplanations, {
+    gap: {
+        action: step => `<strong>New gap:</strong> Insertion sort over elements ${step.gap} apart`,
+        reason: "Large gaps move values far in a few swaps; the last pass with gap 1 is a plain insertion sort on an almost sorted array."
+    },
+    compare: Object.assign({}, arrayStepExplanations.compare, {
+        reason: step => `Elements ${step.gap} apart are compared; if the left one is larger they are swapped.`
+    }),
+    swap: Object.assign({}, arrayStepExplanations.swap, {
+        reason: step => `The smaller value moves ${step.gap} places to the left.`
+    }),
+    stats: Object.assign({}, arrayStepExplanations.stats, {
+        reason: step => `Gap sequence: ${step.gaps.join(", ")}.`
+    })
+}));
@@ -0,0 +1,85 @@
+# Tests for batched distance computation (algorithms.batch.distance_matrix)
+# Each row must equal a separate Dijkstra (or BFS) run from its start node, in process or in the pool
+import random
+
+import numpy as np
+import pytest
+
+from algorithms.batch import all_pairs_distances, distance_matrix
+from algorithms.compiled_graph import compile_graph
+from algorithms.generators import gnp_edges, to_graph_data
+from algorithms.graph_algorithms import iter_bfs, iter_dijkstra
+
+INFINITY = float("infinity")
+
+def random_graph(rng, n=None):
+    n = n or rng.randint(1, 60)
+    directed = rng.random() < 0.5
+    edges = gnp_edges(n, rng.choice([0.02, 0.08, 0.3]), directed=directed, seed=rng.randrange(1000))
+    return to_graph_data(n, *edges, directed=directed)
+
+def dijkstra_row(graph, source):
+    """Distances from one iter_dijkstra run, in node order."""
+    distances = {node["id"]: INFINITY for node in graph["nodes"]}
+    for step in iter_dijkstra(graph, source):
+        if step["type"] == "distance":
+            distances[step["node"]] = step["distance"]
+    return [distances[node["id"]] for node in graph["nodes"]]
+
+def bfs_row(graph, source):
+    """Hop counts from the explore steps of one iter_bfs run, in node order."""
+    hops = {node["id"]: INFINITY for node in graph["nodes"]}
+    hops[source] = 0
+    for step in iter_bfs(graph, source):
+        if step["type"] == "explore":
+            hops[step["to"]] = hops[step["from"]] + 1
+    return [hops[node["id"]] for node in graph["nodes"]]
+
+ROWS = {"dijkstra": dijkstra_row, "bfs": bfs_row}
+
+@pytest.mark.parametrize("method", list(ROWS))
+def test_rows_match_single_source_runs(method):
+    rng = random.Random(method)
+    for _ in range(30):
+        graph = random_graph(rng)
+        n = len(graph["nodes"])
+        sources = [rng.randrange(n) for _ in range(rng.randint(1, 5))]
+        matrix = distance_matrix(graph, sources, method=method, workers=0)
+        assert matrix.shape == (len(sources), n)
+        for row, source in zip(matrix, sources):
+            assert row.tolist() == ROWS[method](graph, source)
+
+@pytest.mark.parametrize("method", list(ROWS))
+def test_pool_matches_in_process(method):
+    # More sources than one chunk, so several workers fill rows
+    graph = random_graph(random.Random(7), n=150)
+    compiled = compile_graph(graph)
+    in_process = all_pairs_distances(compiled, method=method, workers=0)
+    pooled = all_pairs_distances(compiled, method=method, workers=2)
+    np.testing.assert_array_equal(pooled, in_process)
+    for source in (0, 75, 149):
+        assert in_process[source].tolist() == ROWS[method](graph, source)
+
+def test_memory_mapped_result(tmp_path):
+    graph = random_graph(random.Random(8), n=80)
+    expected = all_pairs_distances(graph, workers=0)
+    for workers in (0, 2):
+        path = tmp_path / f"apsp-{workers}.npy"
+        result = all_pairs_distances(graph, workers=workers, path=str(path))
+        np.testing.assert_array_equal(result, expected)
+        np.testing.assert_array_equal(np.load(path), expected)
+
+def test_float32_rows():
+    graph = random_graph(random.Random(9), n=40)
+    result = distance_matrix(graph, [0, 1], dtype=np.float32, workers=0)
+    assert result.dtype == np.float32
+    np.testing.assert_array_equal(result, distance_matrix(graph, [0, 1], workers=0))
+
+def test_invalid_arguments():
+    graph = {"nodes": [{"id": 0}, {"id": 1}], "links": []}
+    with pytest.raises(ValueError):
+        distance_matrix(graph, [5])
+    with pytest.raises(ValueError):
+        distance_matrix(graph, method="astar")
+    # Isolated nodes reach only themselves
+    assert all_pairs_distances(graph, workers=0).tolist() == [[0, INFINITY], [INFINITY, 0]]
@@ -0,0 +1,73 @@
+# Round-trip tests for the columnar trace format (algorithms.trace.encode_columnar/decode_columnar)
+# Decoding must give back every step, in order, with the same fields and values
+import json
+import random
+
+import pytest
+
+from algorithms.graph_algorithms import (
+    iter_astar, iter_bfs, iter_bidirectional_bfs, iter_bidirectional_dijkstra, iter_dfs, iter_dijkstra
+)
+from algorithms.generators import gnp_edges, to_graph_data
+from algorithms.sorting import SORTING_ALGORITHMS
+from algorithms.trace import encode_columnar, decode_columnar
+
+def round_trip(steps):
+    """Encode, pass the header through JSON as the app does, and decode."""
+    header, buffer = encode_columnar(steps)
+    return list(decode_columnar(json.loads(json.dumps(header)), buffer))
+
+def normalized(value):
+    """Tuples decode as lists; compare the steps as JSON would see them."""
+    return json.loads(json.dumps(value))
+
+def graph_traces(graph, start, target):
+    yield list(iter_dfs(graph, start))
+    yield list(iter_bfs(graph, start))
+    yield list(iter_bfs(graph, start, levels=True, target_node=target, backend="numpy"))
+    yield list(iter_dijkstra(graph, start, include_stats=True))
+    yield list(iter_bidirectional_bfs(graph, start, target))
+    yield list(iter_bidirectional_dijkstra(graph, start, target, include_stats=True))
+    yield list(iter_astar(graph, start, target, include_stats=True))
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_graph_traces(directed):
+    rng = random.Random(5 + directed)
+    for _ in range(30):
+        n = rng.randint(1, 40)
+        edges = gnp_edges(n, rng.choice([0.05, 0.2, 0.5]), directed=directed, seed=rng.randrange(2 ** 31))
+        graph = to_graph_data(n, *edges, directed=directed)
+        start, target = rng.randrange(n), rng.randrange(n)
+        for steps in graph_traces(graph, start, target):
+            assert round_trip(steps) == normalized(steps)
+
+@pytest.mark.parametrize("algorithm", list(SORTING_ALGORITHMS))
+def test_sorting_traces(algorithm):
+    rng = random.Random(len(algorithm))
+    for size in [0, 1, 2, 17, 300]:
+        # Non-negative, which radix sort requires
+        arr = [rng.randint(0, 1000) for _ in range(size)]
+        # A short keyframe interval puts "array" snapshots between delta steps
+        steps = list(SORTING_ALGORITHMS[algorithm](arr, keyframe_interval=16, include_stats=True))
+        assert round_trip(steps) == normalized(steps)
+
+def test_field_kinds():
+    steps = [
+        {"type": "a", "small": 1, "wide": 2 ** 20, "real": 0.5, "flag": True, "list": [1, 2, 3]},
+        # Missing fields, an empty list and a float column holding an integer
+        {"type": "a", "real": 3, "list": []},
+        {"type": "a", "flag": False, "negative": -2 ** 31 + 1},
+        {"type": "b", "pairs": [[0, 1], [1, 2]], "name": "text", "none": None, "nested": {"k": [1]}},
+        {"type": "b", "pairs": [], "infinite": float("infinity")},
+        {"type": "a", "list": [-1.5, 2]},
+    ]
+    assert round_trip(steps) == steps
+
+def test_out_of_range_markers_are_not_missing():
+    # Values equal to an int8/int16 "missing" marker widen the column instead of disappearing
+    steps = [{"type": "a", "value": value} for value in [-128, -2 ** 15, 5]]
+    assert round_trip(steps) == steps
+
+def test_empty_trace():
+    assert round_trip([]) == []
+    assert round_trip(iter([])) == []
@@ -0,0 +1,110 @@
+# Regression tests for the explicit-stack DFS (algorithms.graph_algorithms.iter_dfs)
+# Its traces must match the recursive implementation it replaced, step by step
+import random
+import sys
+
+import pytest
+
+from algorithms.compiled_graph import compile_graph
+from algorithms.graph_algorithms import dfs
+
+def recursive_dfs(graph, start_node):
+    """
+    Frozen copy of the original recursive dfs, without the action/reason strings that moved
+    to client-side templates, and following links one way only for directed graphs.
+    """
+    nodes = graph["nodes"]
+    links = graph["links"]
+    directed = graph.get("directed", False)
+    node_ids = [node["id"] for node in nodes]
+    if start_node not in node_ids:
+        return []
+    adj_list = {node["id"]: [] for node in nodes}
+    for link in links:
+        source = link["source"]
+        target = link["target"]
+        adj_list[source].append({"target": target, "weight": link.get("weight", 1)})
+        if not directed:
+            adj_list[target].append({"target": source, "weight": link.get("weight", 1)})
+    visited = set()
+    path = []
+    steps = []
+    def dfs_recursive(node):
+        visited.add(node)
+        path.append(node)
+        steps.append({"type": "visit", "node": node})
+        for neighbor in adj_list[node]:
+            target = neighbor["target"]
+            if target not in visited:
+                steps.append({"type": "explore", "from": node, "to": target})
+                dfs_recursive(target)
+        steps.append({"type": "complete", "node": node})
+        if node != path[-1]:
+            current_index = path.index(node)
+            if current_index < len(path) - 1:
+                next_node = path[current_index + 1]
+                steps.append({"type": "backtrack", "from": node, "to": next_node})
+    dfs_recursive(start_node)
+    return steps
+
+def random_graph(rng, directed):
+    """A small random graph: possibly disconnected, with self-loops and parallel links."""
+    n = rng.randint(1, 20)
+    density = rng.choice([0.0, 0.1, 0.3, 0.7])
+    links = []
+    for source in range(n):
+        for target in range(n):
+            if (directed or source <= target) and rng.random() < density:
+                links.append({"source": source, "target": target, "weight": rng.randint(1, 9)})
+    rng.shuffle(links)
+    if links and rng.random() < 0.3:
+        links.append(dict(rng.choice(links)))
+    return {"nodes": [{"id": i} for i in range(n)], "links": links, "directed": directed}
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_matches_recursive_on_random_graphs(directed):
+    rng = random.Random(3 + directed)
+    for _ in range(300):
+        graph = random_graph(rng, directed)
+        start = rng.randrange(len(graph["nodes"]))
+        assert dfs(graph, start) == recursive_dfs(graph, start)
+
+def test_matches_recursive_with_compiled_graph():
+    rng = random.Random(11)
+    for _ in range(50):
+        graph = random_graph(rng, rng.random() < 0.5)
+        compiled = compile_graph(graph)
+        for start in range(len(graph["nodes"])):
+            assert dfs(compiled, start) == recursive_dfs(graph, start)
+
+def test_self_loops_and_isolated_nodes():
+    graph = {
+        "nodes": [{"id": i} for i in range(4)],
+        "links": [{"source": 0, "target": 0}, {"source": 0, "target": 1}, {"source": 1, "target": 1}]
+    }
+    assert dfs(graph, 0) == recursive_dfs(graph, 0)
+    assert dfs(graph, 3) == recursive_dfs(graph, 3) == [
+        {"type": "visit", "node": 3},
+        {"type": "complete", "node": 3}
+    ]
+
+def test_unknown_start_node():
+    graph = {"nodes": [{"id": 0}], "links": []}
+    assert dfs(graph, 5) == recursive_dfs(graph, 5) == []
+
+def test_deep_path_graph():
+    # Deeper than the recursion limit, which the recursive version could not handle
+    n = sys.getrecursionlimit() * 4
+    graph = {
+        "nodes": [{"id": i} for i in range(n)],
+        "links": [{"source": i, "target": i + 1} for i in range(n - 1)]
+    }
+    with pytest.raises(RecursionError):
+        recursive_dfs(graph, 0)
+    steps = dfs(graph, 0)
+    assert [step["node"] for step in steps if step["type"] == "visit"] == list(range(n))
+    assert [step["node"] for step in steps if step["type"] == "complete"] == list(range(n - 1, -1, -1))
+    # Every node but the last backtracks towards the node visited right after it
+    backtracks = [(step["from"], step["to"]) for step in steps if step["type"] == "backtrack"]
+    assert backtracks == [(i, i + 1) for i in range(n - 2, -1, -1)]
+    assert len(steps) == 4 * n - 2
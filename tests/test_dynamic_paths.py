@@ -0,0 +1,107 @@
+# Tests for incremental shortest-path repair (algorithms.dynamic_paths.DynamicShortestPaths)
+# After every edit the repaired distances must equal a full Dijkstra run on the edited graph
+import random
+
+import pytest
+
+from algorithms.dynamic_paths import DynamicShortestPaths
+from algorithms.graph_algorithms import iter_dijkstra
+
+INFINITY = float("infinity")
+
+def to_graph(n, edges, directed):
+    return {
+        "nodes": [{"id": i} for i in range(n)],
+        "links": [{"source": u, "target": v, "weight": w} for (u, v), w in edges.items()],
+        "directed": directed
+    }
+
+def full_distances(graph, source):
+    """Final distances of a full iter_dijkstra run (infinity for unreached nodes)."""
+    distances = {node["id"]: INFINITY for node in graph["nodes"]}
+    for step in iter_dijkstra(graph, source):
+        if step["type"] == "distance":
+            distances[step["node"]] = step["distance"]
+    return distances
+
+def edge_key(u, v, directed):
+    return (u, v) if directed else (min(u, v), max(u, v))
+
+def check_tree(paths, edges, directed):
+    """Every tree edge is a graph edge that is tight for the current distances."""
+    for node, parent in paths.previous.items():
+        if parent is None:
+            assert node == paths.source or paths.distance[node] == INFINITY
+            continue
+        weight = edges[edge_key(parent, node, directed)]
+        assert paths.distance[node] == paths.distance[parent] + weight
+
+def random_edit(rng, edges, n, directed):
+    """
+    Apply one random insert, delete or reweight to edges.
+    Returns:
+        (method, args) for the matching DynamicShortestPaths call
+    """
+    operation = rng.choice(["insert", "insert", "delete", "weight"])
+    if operation != "insert" and edges:
+        key = rng.choice(sorted(edges))
+        if operation == "delete":
+            del edges[key]
+            return "delete_edge", key
+        weight = rng.randint(0, 12)
+        edges[key] = weight
+        return "set_weight", key + (weight,)
+    u, v = rng.randrange(n), rng.randrange(n)
+    weight = rng.randint(0, 12)
+    edges[edge_key(u, v, directed)] = weight
+    return "insert_edge", (u, v, weight)
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_random_edit_sequences_match_full_dijkstra(directed):
+    rng = random.Random(21 + directed)
+    for _ in range(100):
+        n = rng.randint(1, 15)
+        edges = {}
+        for _ in range(rng.randint(0, 3 * n)):
+            u, v = rng.randrange(n), rng.randrange(n)
+            edges[edge_key(u, v, directed)] = rng.randint(1, 9)
+        source = rng.randrange(n)
+        paths = DynamicShortestPaths(to_graph(n, edges, directed), source)
+        assert paths.distances() == full_distances(to_graph(n, edges, directed), source)
+        for _ in range(20):
+            before = paths.distances()
+            method, args = random_edit(rng, edges, n, directed)
+            steps = getattr(paths, method)(*args)
+            expected = full_distances(to_graph(n, edges, directed), source)
+            assert paths.distances() == expected
+            check_tree(paths, edges, directed)
+            assert steps[0]["type"] == "update"
+            # Every node whose distance changed is reported, with its new distance
+            reported = {step["node"]: step["distance"] for step in steps if step["type"] == "distance"}
+            for node, distance in expected.items():
+                if distance != before[node]:
+                    assert reported[node] == (None if distance == INFINITY else distance)
+
+def test_sync_applies_an_edited_graph():
+    rng = random.Random(5)
+    for _ in range(50):
+        directed = rng.random() < 0.5
+        n = rng.randint(2, 12)
+        edges = {edge_key(rng.randrange(n), rng.randrange(n), directed): rng.randint(1, 9) for _ in range(2 * n)}
+        paths = DynamicShortestPaths(to_graph(n, edges, directed), 0)
+        for _ in range(rng.randint(1, 6)):
+            random_edit(rng, edges, n, directed)
+        edited = to_graph(n, edges, directed)
+        paths.sync(edited)
+        assert paths.distances() == full_distances(edited, 0)
+        check_tree(paths, edges, directed)
+
+def test_remove_node_and_unreachable_distances():
+    graph = to_graph(3, {(0, 1): 1, (1, 2): 1}, False)
+    paths = DynamicShortestPaths(graph, 0)
+    steps = paths.remove_node(1)
+    assert paths.distances() == {0: 0, 2: INFINITY}
+    assert {"type": "distance", "node": 2, "distance": None, "previous": None} in steps
+    assert paths.path_to(2) == []
+    with pytest.raises(ValueError):
+        paths.remove_node(0)
@@ -0,0 +1,111 @@
+# Tests for the level-synchronous NumPy BFS (algorithms.frontier_bfs.iter_frontier_bfs)
+# Each expansion direction must find the levels of a plain BFS, with a valid BFS tree
+import random
+from collections import deque
+
+import pytest
+
+from algorithms.frontier_bfs import iter_frontier_bfs
+from algorithms.generators import gnp_edges, grid_edges, path_edges, to_graph_data
+
+DIRECTIONS = ["auto", "top-down", "bottom-up"]
+
+def plain_levels(graph, source):
+    out = {node["id"]: [] for node in graph["nodes"]}
+    for link in graph["links"]:
+        out[link["source"]].append(link["target"])
+        if not graph["directed"]:
+            out[link["target"]].append(link["source"])
+    levels = {source: 0}
+    queue = deque([source])
+    while queue:
+        u = queue.popleft()
+        for v in out[u]:
+            if v not in levels:
+                levels[v] = levels[u] + 1
+                queue.append(v)
+    return levels
+
+def arcs(graph):
+    pairs = {(link["source"], link["target"]) for link in graph["links"]}
+    if not graph["directed"]:
+        pairs |= {(v, u) for u, v in pairs}
+    return pairs
+
+def random_graphs(rng):
+    for _ in range(40):
+        n = rng.randint(1, 300)
+        directed = rng.random() < 0.5
+        # Dense graphs make "auto" switch to bottom-up
+        p = rng.choice([0.002, 0.01, 0.05, 0.3])
+        edges = gnp_edges(n, p, directed=directed, seed=rng.randrange(1000))
+        yield to_graph_data(n, *edges, directed=directed)
+    yield to_graph_data(400, *grid_edges(400, seed=1))
+    yield to_graph_data(300, *path_edges(300, seed=2))
+
+@pytest.mark.parametrize("direction", DIRECTIONS)
+def test_levels_match_plain_bfs(direction):
+    rng = random.Random(direction)
+    for graph in random_graphs(rng):
+        start = rng.randrange(len(graph["nodes"]))
+        expected = plain_levels(graph, start)
+        graph_arcs = arcs(graph)
+        steps = list(iter_frontier_bfs(graph, start, direction=direction))
+        assert all(step["type"] == "level" for step in steps)
+        assert steps[0]["frontier"] == [start] and steps[0]["parents"] == [None]
+        found = {}
+        for level, step in enumerate(steps):
+            assert step["level"] == level
+            assert len(step["frontier"]) == len(step["parents"]) > 0
+            for node, parent in zip(step["frontier"], step["parents"]):
+                assert node not in found
+                found[node] = level
+                if level:
+                    # The parent is an in-neighbor one level up
+                    assert (parent, node) in graph_arcs and found[parent] == level - 1
+            if level and direction != "auto":
+                assert step["direction"] == direction
+        assert found == expected
+
+def test_auto_switches_direction():
+    n = 2000
+    graph = to_graph_data(n, *gnp_edges(n, 0.01, seed=3))
+    directions = [step["direction"] for step in iter_frontier_bfs(graph, 0)]
+    assert "bottom-up" in directions and directions[0] == "top-down"
+
+@pytest.mark.parametrize("direction", DIRECTIONS)
+def test_target_stops_at_its_level(direction):
+    rng = random.Random(f"target-{direction}")
+    for graph in random_graphs(rng):
+        n = len(graph["nodes"])
+        start, target = rng.randrange(n), rng.randrange(n)
+        expected = plain_levels(graph, start)
+        steps = list(iter_frontier_bfs(graph, start, target_node=target, direction=direction))
+        levels = [step for step in steps if step["type"] == "level"]
+        if target not in expected:
+            assert steps[-1]["type"] == "level"
+            continue
+        path = steps[-1]
+        assert path["type"] == "path" and path["target"] == target and path["distance"] == expected[target]
+        assert levels[-1]["level"] == expected[target]
+        node = start
+        for u, v in path["edges"]:
+            assert u == node and (u, v) in arcs(graph)
+            node = v
+        assert node == target
+
+def test_bottom_up_stops_at_the_first_parent():
+    # On a complete graph each unvisited node finds the start on its first in-edge, so
+    # bottom-up checks one edge per node, as many as top-down expansion of the start
+    n = 200
+    graph = to_graph_data(n, *gnp_edges(n, 1.0, seed=0))
+    top_down = list(iter_frontier_bfs(graph, 0, direction="top-down"))
+    bottom_up = list(iter_frontier_bfs(graph, 0, direction="bottom-up"))
+    assert top_down[1]["edgesChecked"] == n - 1
+    assert bottom_up[1]["edgesChecked"] == n - 1
+    assert sorted(top_down[1]["frontier"]) == sorted(bottom_up[1]["frontier"]) == list(range(1, n))
+
+def test_unknown_direction():
+    graph = {"nodes": [{"id": 0}], "links": []}
+    with pytest.raises(ValueError):
+        list(iter_frontier_bfs(graph, 0, direction="sideways"))
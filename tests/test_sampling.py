@@ -0,0 +1,122 @@
+# Tests for level-of-detail sampling (algorithms.trace.sample_array_steps/sample_graph_steps)
+# Replaying the kept steps must rebuild the state of the full trace at each of them
+import random
+
+import pytest
+
+from algorithms.generators import gnp_edges, to_graph_data
+from algorithms.graph_algorithms import STRUCTURAL_STEPS as GRAPH_STRUCTURAL_STEPS, iter_bfs, iter_dfs, iter_dijkstra
+from algorithms.sorting import SORTING_ALGORITHMS, STRUCTURAL_STEPS as SORTING_STRUCTURAL_STEPS
+from algorithms.trace import apply_writes, array_at, decode_array_steps, sample_array_steps, sample_graph_steps
+
+def options(rng, length, structural_types):
+    """Sampling parameters: every k-th step, structural types, a detail window, or a mix."""
+    every = rng.choice([None, 1, 2, 7, 50])
+    keep_types = rng.choice([None, structural_types])
+    if not (every or keep_types):
+        every = 3
+    window = None
+    if length and rng.random() < 0.5:
+        first = rng.randrange(length)
+        window = (first, first + rng.randint(0, 40))
+    return {"every": every, "keep_types": keep_types, "window": window, "keyframe_interval": rng.choice([1, 4, 256])}
+
+def expected_indices(steps, every, keep_types, window, **_):
+    indices = []
+    for index, step in enumerate(steps):
+        if (
+            index == len(steps) - 1
+            or window is not None and window[0] <= index <= window[1]
+            or keep_types is not None and step["type"] in keep_types
+            or every and index % every == 0
+        ):
+            indices.append(index)
+    return indices
+
+@pytest.mark.parametrize("algorithm", list(SORTING_ALGORITHMS))
+def test_array_sampling_replays_the_full_trace(algorithm):
+    rng = random.Random(algorithm)
+    for _ in range(20):
+        initial = [rng.randint(0, 99) for _ in range(rng.randint(0, 80))]
+        steps = list(SORTING_ALGORITHMS[algorithm](list(initial), keyframe_interval=16))
+        full = list(decode_array_steps(initial, steps))
+        params = options(rng, len(steps), SORTING_STRUCTURAL_STEPS[algorithm])
+        sampled = list(sample_array_steps(initial, iter(steps), **params))
+        assert [step["traceIndex"] for step in sampled] == expected_indices(steps, **params)
+        current = list(initial)
+        for position, step in enumerate(sampled):
+            state = full[step["traceIndex"]]["array"]
+            assert apply_writes(current, step) == state
+            if "array" in step:
+                assert step["array"] == state
+            # Seeking from the nearest keyframe gives the same state
+            assert array_at(initial, sampled, position) == state
+            assert position % params["keyframe_interval"] or "array" in step
+
+def graph_effects(step):
+    """Visited nodes, completed nodes and highlighted edges a step leaves behind."""
+    if step["type"] == "visit":
+        return {step["node"]}, set(), set()
+    if step["type"] == "complete":
+        return set(), {step["node"]}, set()
+    if step["type"] in ("explore", "backtrack") or step["type"] == "relax" and step["success"]:
+        return set(), set(), {(step["from"], step["to"])}
+    if step["type"] == "level" and isinstance(step.get("frontier"), list):
+        edges = {(parent, node) for parent, node in zip(step["parents"], step["frontier"]) if parent is not None}
+        return set(step["frontier"]), set(), edges
+    return set(), set(), set()
+
+def full_states(steps):
+    """The (visited, completed, edges) state after each step of the full trace."""
+    state = (set(), set(), set())
+    states = []
+    for step in steps:
+        state = tuple(applied | effects for applied, effects in zip(state, graph_effects(step)))
+        states.append(state)
+    return states
+
+def folded(step):
+    fields = step.get("folded", {})
+    return (
+        set(fields.get("visited", [])),
+        set(fields.get("completed", [])),
+        {tuple(edge) for edge in fields.get("edges", [])},
+    )
+
+def graph_traces(rng):
+    n = rng.randint(1, 60)
+    directed = rng.random() < 0.5
+    edges = gnp_edges(n, rng.choice([0.05, 0.2]), directed=directed, seed=rng.randrange(100))
+    graph = to_graph_data(n, *edges, directed=directed)
+    start = rng.randrange(n)
+    yield "dfs", list(iter_dfs(graph, start))
+    yield "bfs", list(iter_bfs(graph, start, levels=True))
+    yield "bfs", list(iter_bfs(graph, start, backend="numpy"))
+    yield "dijkstra", list(iter_dijkstra(graph, start, include_stats=True))
+
+def test_graph_sampling_replays_the_full_trace():
+    rng = random.Random(20)
+    for _ in range(40):
+        for algorithm, steps in graph_traces(rng):
+            states = full_states(steps)
+            params = options(rng, len(steps), GRAPH_STRUCTURAL_STEPS[algorithm])
+            sampled = list(sample_graph_steps(iter(steps), **params))
+            assert [step["traceIndex"] for step in sampled] == expected_indices(steps, **params)
+            state = (set(), set(), set())
+            for position, step in enumerate(sampled):
+                expected = states[step["traceIndex"]]
+                if step.get("keyframe"):
+                    # A keyframe alone restores the state, so playback can start from it
+                    assert position % params["keyframe_interval"] == 0
+                    restored = tuple(a | b for a, b in zip(folded(step), graph_effects(step)))
+                    assert restored == expected
+                    state = (set(), set(), set())
+                state = tuple(a | b | c for a, b, c in zip(state, folded(step), graph_effects(step)))
+                assert state == expected
+                # The step itself is unchanged apart from the added fields
+                original = steps[step["traceIndex"]]
+                assert {k: v for k, v in step.items() if k not in ("traceIndex", "folded", "keyframe")} == original
+
+def test_empty_traces():
+    assert list(sample_array_steps([], iter([]), every=2)) == []
+    assert list(sample_graph_steps(iter([]), every=2)) == []
@@ -0,0 +1,256 @@
+# Tests for the shortest-path searches in algorithms.graph_algorithms
+# Every priority queue and search variant must find the distances of a plain Dijkstra/BFS
+import heapq
+import random
+from collections import deque
+
+import pytest
+
+from algorithms.compiled_graph import compile_graph
+from algorithms.generators import random_geometric_edges, to_graph_data
+from algorithms.graph_algorithms import (
+    iter_astar, iter_bfs, iter_bidirectional_bfs, iter_bidirectional_dijkstra, iter_dijkstra
+)
+from algorithms.priority_queues import PRIORITY_QUEUES, make_queue
+
+INFINITY = float("infinity")
+
+def random_graph(rng, directed, weight=None):
+    """A small random graph: possibly disconnected, with self-loops and parallel links."""
+    n = rng.randint(1, 25)
+    density = rng.choice([0.05, 0.15, 0.4])
+    weight = weight or (lambda: rng.randint(0, 9))
+    links = []
+    for source in range(n):
+        for target in range(n):
+            if (directed or source <= target) and rng.random() < density:
+                links.append({"source": source, "target": target, "weight": weight()})
+    if links and rng.random() < 0.3:
+        links.append(dict(rng.choice(links), weight=weight()))
+    return {"nodes": [{"id": i} for i in range(n)], "links": links, "directed": directed}
+
+def adjacency(graph):
+    """Lightest weight per (source, target) arc."""
+    arcs = {}
+    for link in graph["links"]:
+        pairs = [(link["source"], link["target"])]
+        if not graph["directed"]:
+            pairs.append((link["target"], link["source"]))
+        for pair in pairs:
+            arcs[pair] = min(arcs.get(pair, INFINITY), link["weight"])
+    return arcs
+
+def plain_dijkstra(graph, source):
+    arcs = adjacency(graph)
+    out = {node["id"]: [] for node in graph["nodes"]}
+    for (u, v), w in arcs.items():
+        out[u].append((v, w))
+    distances = {node["id"]: INFINITY for node in graph["nodes"]}
+    distances[source] = 0
+    heap = [(0, source)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > distances[u]:
+            continue
+        for v, w in out[u]:
+            if d + w < distances[v]:
+                distances[v] = d + w
+                heapq.heappush(heap, (d + w, v))
+    return distances
+
+def plain_bfs(graph, source):
+    out = {node["id"]: [] for node in graph["nodes"]}
+    for u, v in adjacency(graph):
+        out[u].append(v)
+    distances = {node["id"]: INFINITY for node in graph["nodes"]}
+    distances[source] = 0
+    queue = deque([source])
+    while queue:
+        u = queue.popleft()
+        for v in out[u]:
+            if distances[v] == INFINITY:
+                distances[v] = distances[u] + 1
+                queue.append(v)
+    return distances
+
+def final_distances(graph, steps):
+    """Last "distance" per node in a Dijkstra-style trace (infinity for unreached nodes)."""
+    distances = {node["id"]: INFINITY for node in graph["nodes"]}
+    for step in steps:
+        if step["type"] == "distance":
+            distances[step["node"]] = step["distance"]
+    return distances
+
+def path_step(steps):
+    paths = [step for step in steps if step["type"] == "path"]
+    assert len(paths) <= 1
+    return paths[0] if paths else None
+
+def check_path(graph, steps, start, target, expected, hops=False):
+    """The "path" step reaches target from start along graph edges with the expected length."""
+    path = path_step(steps)
+    if expected == INFINITY:
+        assert path is None
+        return
+    assert path["target"] == target and path["distance"] == expected
+    arcs = adjacency(graph)
+    node = start
+    length = 0
+    for u, v in path["edges"]:
+        assert u == node and (u, v) in arcs
+        length += 1 if hops else arcs[(u, v)]
+        node = v
+    assert node == target and length == expected
+
+def cases(seed, directed, count=60, weight=None):
+    rng = random.Random(seed)
+    for _ in range(count):
+        graph = random_graph(rng, directed, weight and (lambda: weight(rng)))
+        n = len(graph["nodes"])
+        yield graph, rng.randrange(n), rng.randrange(n)
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("queue", list(PRIORITY_QUEUES))
+def test_dijkstra_queues(queue, directed):
+    for graph, start, target in cases(1 + directed, directed):
+        expected = plain_dijkstra(graph, start)
+        steps = list(iter_dijkstra(graph, start, queue=queue, include_stats=True))
+        assert final_distances(graph, steps) == expected
+        stats = steps[-1]
+        assert stats["type"] == "stats"
+        assert stats["settled"] == sum(d < INFINITY for d in expected.values())
+        # The tree edges of the final "path" step are tight
+        path = path_step(steps)
+        for u, v in path["edges"] if path else []:
+            assert expected[v] == expected[u] + adjacency(graph)[(u, v)]
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("queue", list(PRIORITY_QUEUES))
+def test_dijkstra_target_stops_early(queue, directed):
+    for graph, start, target in cases(3 + directed, directed):
+        expected = plain_dijkstra(graph, start)
+        steps = list(iter_dijkstra(graph, start, queue=queue, include_stats=True, target_node=target))
+        check_path(graph, steps, start, target, expected[target])
+        # Nothing farther than the target is settled
+        visits = [step["node"] for step in steps if step["type"] == "visit"]
+        assert all(expected[node] <= expected[target] for node in visits)
+        if expected[target] < INFINITY:
+            assert visits[-1] == target
+
+def test_float_weights():
+    for graph, start, target in cases(5, True, weight=lambda rng: rng.random() * 10):
+        expected = plain_dijkstra(graph, start)
+        for queue in ("lazy", "indexed"):
+            assert final_distances(graph, iter_dijkstra(graph, start, queue=queue)) == expected
+        if graph["links"]:
+            with pytest.raises(ValueError):
+                list(iter_dijkstra(graph, start, queue="bucket"))
+
+@pytest.mark.parametrize("queue", list(PRIORITY_QUEUES))
+def test_queue_pops_in_priority_order(queue):
+    # A Dijkstra-like workload: priorities never below the last pop nor above it plus the max weight
+    rng = random.Random(len(queue))
+    max_weight = 9
+    for _ in range(100):
+        capacity = rng.randint(1, 30)
+        pq = make_queue(queue, capacity, max_weight)
+        queued = {}
+        last = 0
+        for _ in range(200):
+            if queued and rng.random() < 0.4:
+                priority, item = pq.pop()
+                assert priority == queued.pop(item) == min([priority] + list(queued.values()))
+                last = priority
+            else:
+                item = rng.randrange(capacity)
+                priority = last + rng.randint(0, max_weight)
+                if priority < queued.get(item, INFINITY):
+                    pq.push(item, priority)
+                    queued[item] = priority
+            assert len(pq) == len(queued)
+        stats = pq.stats()
+        assert stats["queue"] == queue and stats["pops"] + len(queued) + stats["decreaseKeys"] == stats["pushes"]
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_bfs(backend, directed):
+    for graph, start, target in cases(7 + directed, directed):
+        expected = plain_bfs(graph, start)
+        steps = list(iter_bfs(graph, start, target_node=target, backend=backend))
+        check_path(graph, steps, start, target, expected[target], hops=True)
+        if backend == "python":
+            # Without a target every reachable node is visited once, level by level
+            visits = [step["node"] for step in iter_bfs(graph, start) if step["type"] == "visit"]
+            assert sorted(visits) == sorted(node for node, d in expected.items() if d < INFINITY)
+            assert [expected[node] for node in visits] == sorted(expected[node] for node in visits)
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_bidirectional_bfs(directed):
+    for graph, start, target in cases(9 + directed, directed):
+        steps = list(iter_bidirectional_bfs(graph, start, target))
+        check_path(graph, steps, start, target, plain_bfs(graph, start)[target], hops=True)
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("queue", list(PRIORITY_QUEUES))
+def test_bidirectional_dijkstra(queue, directed):
+    for graph, start, target in cases(11 + directed, directed):
+        steps = list(iter_bidirectional_dijkstra(graph, start, target, queue=queue))
+        check_path(graph, steps, start, target, plain_dijkstra(graph, start)[target])
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("heuristic", ["zero", "landmarks"])
+@pytest.mark.parametrize("queue", ["lazy", "indexed"])
+def test_astar(queue, heuristic, directed):
+    for graph, start, target in cases(13 + directed, directed):
+        compiled = compile_graph(graph)
+        steps = list(iter_astar(compiled, start, target, heuristic=heuristic, queue=queue, include_stats=True,
+                                compare_dijkstra=True))
+        check_path(graph, steps, start, target, plain_dijkstra(graph, start)[target])
+        # The heuristics are consistent, so no node is settled twice
+        visits = [step["node"] for step in steps if step["type"] == "visit"]
+        assert len(visits) == len(set(visits))
+        stats = steps[-1]
+        assert stats["settledSaved"] == stats["dijkstraSettled"] - stats["settled"]
+        if heuristic == "zero":
+            assert stats["settledSaved"] == 0
+
+def test_astar_euclidean():
+    for seed in range(20):
+        n = 60
+        sources, targets, weights, points = random_geometric_edges(n, 0.25, seed=seed)
+        graph = to_graph_data(n, sources, targets, weights, points=points * 100)
+        rng = random.Random(seed)
+        start, target = rng.randrange(n), rng.randrange(n)
+        steps = list(iter_astar(graph, start, target, heuristic="euclidean"))
+        check_path(graph, steps, start, target, plain_dijkstra(graph, start)[target])
+
+def test_astar_stats_are_opt_in():
+    graph = {"nodes": [{"id": i} for i in range(3)], "links": [{"source": 0, "target": 1, "weight": 2}]}
+    stats = list(iter_astar(graph, 0, 1, include_stats=True))[-1]
+    assert stats["type"] == "stats" and "dijkstraSettled" not in stats
+    with pytest.raises(ValueError):
+        list(iter_astar(graph, 0, 1, queue="bucket"))
+
+def test_start_is_target():
+    graph = {"nodes": [{"id": i} for i in range(3)], "links": [{"source": 0, "target": 1, "weight": 2}]}
+    searches = [
+        lambda: iter_bfs(graph, 0, target_node=0),
+        lambda: iter_bfs(graph, 0, target_node=0, backend="numpy"),
+        lambda: iter_dijkstra(graph, 0, target_node=0),
+        lambda: iter_bidirectional_bfs(graph, 0, 0),
+        lambda: iter_bidirectional_dijkstra(graph, 0, 0),
+        lambda: iter_astar(graph, 0, 0),
+    ]
+    for search in searches:
+        steps = list(search())
+        path = path_step(steps)
+        assert path["edges"] == [] and path["distance"] == 0 and path["target"] == 0
+        # The start is visited once, and nothing else is reached
+        visited = [step["node"] for step in steps if step["type"] == "visit"]
+        assert visited in ([], [0])
+
+@pytest.mark.parametrize("search", [iter_dijkstra, iter_bfs])
+def test_unknown_target(search):
+    graph = {"nodes": [{"id": 0}], "links": []}
+    with pytest.raises(ValueError):
+        list(search(graph, 0, target_node=7))
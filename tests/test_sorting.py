@@ -0,0 +1,159 @@
+# Tests for the sorting algorithms (algorithms.sorting) and their delta-encoded traces
+# Every algorithm, pivot method and partition scheme must sort, and replaying the trace must rebuild each array state
+import random
+
+import pytest
+
+from algorithms.pivots import PIVOT_METHODS, get_pivot_strategy, median_of_three
+from algorithms.instrumented import InstrumentedArray
+from algorithms.sorting import PARTITION_METHODS, SORTING_ALGORITHMS, iter_quicksort, iter_radix_sort, shell_gaps
+from algorithms.trace import array_at, decode_array_steps
+
+def random_arrays(rng):
+    """Short and long arrays: random, with many duplicates, sorted, reversed and constant."""
+    for size in [0, 1, 2, 3, 10, 57, 150]:
+        yield [rng.randint(0, 1000) for _ in range(size)]
+        yield [rng.randint(0, 3) for _ in range(size)]
+        yield list(range(size))
+        yield list(range(size, 0, -1))
+        yield [7] * size
+
+def check_trace(initial, steps):
+    """The replayed trace ends sorted, and array_at agrees with the full decode at every step."""
+    decoded = list(decode_array_steps(initial, steps))
+    assert decoded[-1]["array"] == sorted(initial)
+    assert decoded[-1]["type"] == "sorted"
+    for index in range(0, len(steps), 7):
+        assert array_at(initial, steps, index) == decoded[index]["array"]
+    # Keyframes hold the state they were taken in
+    for step, full in zip(steps, decoded):
+        if "array" in step:
+            assert step["array"] == full["array"]
+
+@pytest.mark.parametrize("depth_limit", ["auto", None, 0])
+@pytest.mark.parametrize("partition_method", PARTITION_METHODS)
+@pytest.mark.parametrize("pivot_method", PIVOT_METHODS)
+def test_quicksort_sorts(pivot_method, partition_method, depth_limit):
+    rng = random.Random(f"{pivot_method}-{partition_method}-{depth_limit}")
+    for initial in random_arrays(rng):
+        arr = list(initial)
+        steps = list(iter_quicksort(
+            arr, pivot_method=pivot_method, partition_method=partition_method, depth_limit=depth_limit,
+            seed=1, keyframe_interval=32, include_stats=True
+        ))
+        assert arr == sorted(initial)
+        stats = steps.pop()
+        assert stats["type"] == "stats" and stats["partitionMethod"] == partition_method
+        if depth_limit == 0:
+            # Only the whole array is partitioned; deeper ranges go to heapsort
+            assert stats["partitions"] <= 1
+        if depth_limit is None:
+            assert stats["heapsortRanges"] == 0
+        check_trace(initial, steps)
+
+def test_three_way_keeps_duplicates_out_of_the_recursion():
+    # Two distinct values: after one three-way partition only the smaller side recurses
+    initial = [1, 0] * 200
+    steps = list(iter_quicksort(list(initial), partition_method="three_way", depth_limit=None, include_stats=True))
+    assert steps[-1]["maxDepth"] <= 2
+    check_trace(initial, steps[:-1])
+
+def test_depth_stays_logarithmic_with_depth_limit():
+    # Sorted input with the last element as pivot is the quadratic worst case without the cap
+    initial = list(range(500))
+    capped = list(iter_quicksort(list(initial), include_stats=True))[-1]
+    uncapped = list(iter_quicksort(list(initial), depth_limit=None, include_stats=True))[-1]
+    assert capped["maxDepth"] <= 2 * len(initial).bit_length()
+    assert uncapped["maxDepth"] == len(initial) - 2
+
+@pytest.mark.parametrize("pivot_method", PIVOT_METHODS)
+def test_pivot_in_range(pivot_method):
+    choose = get_pivot_strategy(pivot_method)
+    rng = random.Random(pivot_method)
+    for _ in range(500):
+        arr = [rng.randint(0, 50) for _ in range(rng.randint(1, 120))]
+        low = rng.randrange(len(arr))
+        high = rng.randrange(low, len(arr))
+        assert low <= choose(arr, low, high, rng) <= high
+
+class CountingList(list):
+    """A list that counts element reads."""
+    reads = 0
+    def __getitem__(self, index):
+        self.reads += 1
+        return super().__getitem__(index)
+
+@pytest.mark.parametrize("pivot_method", PIVOT_METHODS)
+def test_pivot_reads_a_constant_number_of_elements(pivot_method):
+    choose = get_pivot_strategy(pivot_method)
+    for size in [10, 1000, 100000]:
+        arr = CountingList(range(size))
+        choose(arr, 0, size - 1, random.Random(0))
+        # The ninther compares four triples of elements; nothing scans the range
+        assert arr.reads <= 4 * 6
+
+def test_median_of_three():
+    for values in [(1, 2, 3), (1, 3, 2), (2, 1, 3), (2, 3, 1), (3, 1, 2), (3, 2, 1), (1, 1, 2), (2, 1, 1), (5, 5, 5)]:
+        index = median_of_three(list(values), 0, 1, 2)
+        assert values[index] == sorted(values)[1]
+
+@pytest.mark.parametrize("partition_method", ["lomuto", "hoare"])
+@pytest.mark.parametrize("pivot_method", ["middle", "median", "ninther"])
+def test_sorted_input_stays_balanced(pivot_method, partition_method):
+    # The last element is the worst pivot for sorted input; these pick its median
+    initial = list(range(1000))
+    stats = list(iter_quicksort(
+        initial, pivot_method=pivot_method, partition_method=partition_method, include_stats=True
+    ))[-1]
+    assert stats["heapsortRanges"] == 0
+    assert stats["maxDepth"] <= len(initial).bit_length()
+
+def test_random_pivot_is_seeded():
+    initial = [random.Random(4).randint(0, 100) for _ in range(200)]
+    runs = [list(iter_quicksort(list(initial), pivot_method="random", seed=seed)) for seed in (1, 1, 2)]
+    assert runs[0] == runs[1] != runs[2]
+
+def test_unknown_pivot_method():
+    with pytest.raises(ValueError):
+        list(iter_quicksort([3, 1, 2], pivot_method="unknown"))
+
+def test_unknown_partition_method():
+    with pytest.raises(ValueError):
+        list(iter_quicksort([3, 1, 2], partition_method="unknown"))
+
+@pytest.mark.parametrize("algorithm", list(SORTING_ALGORITHMS))
+def test_every_algorithm_sorts(algorithm):
+    rng = random.Random(algorithm)
+    for initial in random_arrays(rng):
+        arr = list(initial)
+        steps = list(SORTING_ALGORITHMS[algorithm](arr, keyframe_interval=32, include_stats=True))
+        assert arr == sorted(initial)
+        stats = steps.pop()
+        assert stats["type"] == "stats" and stats["algorithm"] == algorithm
+        assert stats["elementWrites"] >= 2 * stats["swaps"]
+        check_trace(initial, steps)
+        # Every keyframe_interval-th step carries a snapshot
+        assert all("array" in step for step in steps[::32])
+
+def test_instrumented_array_deltas():
+    a = InstrumentedArray([5, 4, 3, 2], keyframe_interval=100)
+    first = a.step("start")
+    assert first == {"type": "start", "array": [5, 4, 3, 2]}
+    a.swap(0, 3)
+    a[1] = 9
+    a[1] = 4
+    assert a.step("swap") == {"type": "swap", "writes": [0, 2, 3, 5, 1, 4]}
+    assert a.step("idle") == {"type": "idle"}
+    assert a.compare(0, 1) == -1 and a.compare_value(2, 3) == 0
+    assert a.stats() == {"elementReads": 5, "elementWrites": 4, "comparisons": 2, "swaps": 1}
+
+def test_radix_sort_rejects_negative_values():
+    with pytest.raises(ValueError):
+        list(iter_radix_sort([3, -1, 2]))
+    with pytest.raises(ValueError):
+        list(iter_radix_sort([3, 1, 2], base=1))
+
+def test_shell_gaps_end_with_one():
+    for n in [2, 10, 1000, 10 ** 6]:
+        gaps = shell_gaps(n)
+        assert gaps[-1] == 1 and gaps == sorted(gaps, reverse=True) and gaps[0] < n